@@ -32,7 +32,8 @@ class ObjectDetectionNanodetNode:
 
     def __init__(self, input_rgb_image_topic="/usb_cam/image_raw",
                  output_rgb_image_topic="/opendr/image_objects_annotated", detections_topic="/opendr/objects",
-                 performance_topic=None, device="cuda", model="plus_m_1.5x_416"):
+                 performance_topic=None, device="cuda", model="plus_m_1.5x_416",
+                 half_precision=False):
         """
         Creates a ROS Node for object detection with Nanodet.
         :param input_rgb_image_topic: Topic from which we are reading the input image
@@ -50,6 +51,8 @@ class ObjectDetectionNanodetNode:
         :type device: str
         :param model: the name of the model of which we want to load the config file
         :type model: str
+        :param half_precision: whether to run inference in FP16, only used on CUDA
+        :type half_precision: bool
         """
         self.input_rgb_image_topic = input_rgb_image_topic
 
@@ -71,6 +74,7 @@ class ObjectDetectionNanodetNode:
         self.bridge = ROSBridge()
 
         # Initialize the object detector
+        self.half_precision = half_precision and device == "cuda"
         self.object_detector = NanodetLearner(model_to_use=model, device=device)
         self.object_detector.download(path=".", mode="pretrained", verbose=True)
         self.object_detector.load("./nanodet_{}".format(model))
@@ -96,7 +100,7 @@ class ObjectDetectionNanodetNode:
         image = self.bridge.from_ros_image(data, encoding='bgr8')
 
         # Run object detection
-        boxes = self.object_detector.infer(image, conf_threshold=0.35)
+        boxes = self.object_detector.infer(image, conf_threshold=0.35, hf=self.half_precision)
 
         if self.performance_publisher:
             end_time = perf_counter()
@@ -132,6 +136,8 @@ def main():
                         type=str, default=None)
     parser.add_argument("--device", help="Device to use (cpu, cuda)", type=str, default="cuda", choices=["cuda", "cpu"])
     parser.add_argument("--model", help="Model that config file will be used", type=str, default="plus_m_1.5x_416")
+    parser.add_argument("--accelerate", help="Enables acceleration flags (e.g., half precision inference)",
+                        default=False, action="store_true")
     args = parser.parse_args(rospy.myargv()[1:])
 
     try:
@@ -148,6 +154,7 @@ def main():
         device = "cpu"
 
     object_detection_nanodet_node = ObjectDetectionNanodetNode(device=device, model=args.model,
+                                                               half_precision=args.accelerate,
                                                                input_rgb_image_topic=args.input_rgb_image_topic,
                                                                output_rgb_image_topic=args.output_rgb_image_topic,
                                                                detections_topic=args.detections_topic,
@@ -14,6 +14,9 @@
 # limitations under the License.
 
 import argparse
+import threading
+from collections import deque
+import numpy as np
 import torch
 from time import perf_counter
 
@@ -32,7 +35,7 @@ class ObjectDetectionYOLOV5Node:
 
     def __init__(self, input_rgb_image_topic="/usb_cam/image_raw",
                  output_rgb_image_topic="/opendr/image_objects_annotated", detections_topic="/opendr/objects",
-                 performance_topic=None, device="cuda", model_name="yolov5s"):
+                 performance_topic=None, device="cuda", model_name="yolov5s", half_precision=False):
         """
         Creates a ROS Node for object detection with YOLOV5.
         :param input_rgb_image_topic: Topic from which we are reading the input image
@@ -50,6 +53,9 @@ class ObjectDetectionYOLOV5Node:
         :type device: str
         :param model_name: network architecture name
         :type model_name: str
+        :param half_precision: Enables inference using half (fp16) precision instead of single (fp32) precision.
+        Valid only for GPU-based inference
+        :type half_precision: bool
         """
         self.input_rgb_image_topic = input_rgb_image_topic
 
@@ -72,6 +78,16 @@ class ObjectDetectionYOLOV5Node:
 
         # Initialize the object detector
         self.object_detector = YOLOv5DetectorLearner(model_name=model_name, device=device)
+        if device == "cuda":
+            # NHWC weights let cuDNN pick tensor-core friendly convolution kernels
+            self.object_detector.model.to(memory_format=torch.channels_last)
+            if half_precision:
+                # The hub model casts its input batch to the dtype of its weights, so halving the weights is enough
+                self.object_detector.model.half()
+
+        # Only the most recent frame is kept, older ones are dropped if inference falls behind
+        self.frames = deque(maxlen=1)
+        self.new_frame = threading.Event()
 
     def listen(self):
         """
@@ -79,22 +95,58 @@ class ObjectDetectionYOLOV5Node:
         """
         rospy.init_node('opendr_object_detection_yolov5_node', anonymous=True)
         rospy.Subscriber(self.input_rgb_image_topic, ROS_Image, self.callback, queue_size=1, buff_size=10000000)
+        threading.Thread(target=self.worker, daemon=True).start()
         rospy.loginfo("Object detection YOLOV5 node started.")
         rospy.spin()
 
     def callback(self, data):
         """
-        Callback that processes the input data and publishes to the corresponding topics.
+        Callback that stores the latest input message, so that the subscriber thread is never blocked by inference.
+        :param data: input message
+        :type data: sensor_msgs.msg.Image
+        """
+        self.frames.append(data)
+        self.new_frame.set()
+
+    def worker(self):
+        """
+        Processes the latest received frame until the node is shut down.
+        """
+        while not rospy.is_shutdown():
+            if not self.new_frame.wait(timeout=0.1):
+                continue
+            self.new_frame.clear()
+            try:
+                data = self.frames.popleft()
+            except IndexError:
+                continue
+            try:
+                self.process(data)
+            except Exception as e:
+                # A failing frame must not stop the worker, the next frame is processed as usual
+                rospy.logerr("Object detection YOLOV5 failed to process a frame: {}".format(e))
+
+    def process(self, data):
+        """
+        Processes the input data and publishes to the corresponding topics.
         :param data: input message
         :type data: sensor_msgs.msg.Image
         """
         if self.performance_publisher:
             start_time = perf_counter()
         # Convert sensor_msgs.msg.Image into OpenDR Image
-        image = self.bridge.from_ros_image(data, encoding='bgr8')
+        if data.encoding == 'bgr8':
+            # Wrap the message buffer directly, cv_bridge is only needed when a color conversion is required
+            cv_image = np.ndarray(shape=(data.height, data.width, 3), dtype=np.uint8, buffer=data.data,
+                                  strides=(data.step, 3, 1))
+            image = Image(cv_image)
+        else:
+            cv_image = None
+            image = self.bridge.from_ros_image(data, encoding='bgr8')
 
         # Run object detection
-        boxes = self.object_detector.infer(image)
+        with torch.inference_mode():
+            boxes = self.object_detector.infer(image)
 
         if self.performance_publisher:
             end_time = perf_counter()
@@ -108,12 +160,30 @@ class ObjectDetectionYOLOV5Node:
             self.object_publisher.publish(self.bridge.to_ros_bounding_box_list(boxes))
 
         if self.image_publisher is not None:
-            # Get an OpenCV image back
-            image = image.opencv()
+            # Get an OpenCV image back, reusing the message data when available (it is read-only, so copy it once)
+            image = image.opencv() if cv_image is None else cv_image.copy()
             # Annotate image with object detection boxes
             image = draw_bounding_boxes(image, boxes, class_names=self.object_detector.classes, line_thickness=3)
-            # Convert the annotated OpenDR image to ROS2 image message using bridge and publish it
-            self.image_publisher.publish(self.bridge.to_ros_image(Image(image), encoding='bgr8'))
+            # Convert the annotated OpenCV image to ROS image message and publish it
+            self.image_publisher.publish(self.to_ros_image(image))
+
+    @staticmethod
+    def to_ros_image(image, encoding='bgr8'):
+        """
+        Fills a ROS image message directly from an OpenCV image, avoiding the round-trip through an OpenDR image.
+        :param image: image in OpenCV (HWC) format
+        :type image: numpy.ndarray
+        :param encoding: encoding of the image data
+        :type encoding: str
+        :return: ROS image
+        :rtype: sensor_msgs.msg.Image
+        """
+        message = ROS_Image()
+        message.height, message.width = image.shape[:2]
+        message.encoding = encoding
+        message.step = image.shape[1] * image.shape[2] * image.itemsize
+        message.data = image.tobytes()
+        return message
 
 
 def main():
@@ -133,6 +203,8 @@ def main():
     parser.add_argument("--model_name", help="Network architecture, defaults to \"yolov5s\"",
                         type=str, default="yolov5s", choices=['yolov5s', 'yolov5n', 'yolov5m', 'yolov5l', 'yolov5x',
                                                               'yolov5n6', 'yolov5s6', 'yolov5m6', 'yolov5l6', 'custom'])
+    parser.add_argument("--accelerate", help="Enables acceleration flags (e.g., half precision on GPU)", default=False,
+                        action="store_true")
     args = parser.parse_args(rospy.myargv()[1:])
 
     try:
@@ -152,7 +224,8 @@ def main():
                                                              input_rgb_image_topic=args.input_rgb_image_topic,
                                                              output_rgb_image_topic=args.output_rgb_image_topic,
                                                              detections_topic=args.detections_topic,
-                                                             performance_topic=args.performance_topic)
+                                                             performance_topic=args.performance_topic,
+                                                             half_precision=args.accelerate)
     object_detection_yolov5_node.listen()
 
 
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import array
 import struct
 import numpy as np
 from opendr.engine.data import Image, PointCloud, Timeseries
@@ -83,7 +84,16 @@ class ROS2Bridge:
         if time is not None:
             header.stamp = time
         # Convert from the OpenDR standard (CHW/RGB) to OpenCV standard (HWC/BGR)
-        message = self._cv_bridge.cv2_to_imgmsg(image.opencv(), encoding=encoding, header=header)
+        cv_image = image.opencv()
+        if cv_image.dtype == np.uint8 and cv_image.ndim == 3 and cv_image.shape[2] == 3 and \
+                encoding in ('passthrough', 'bgr8'):
+            # No color conversion is needed, so fill the message directly instead of going through cv_bridge
+            message = ImageMsg(header=header, height=cv_image.shape[0], width=cv_image.shape[1],
+                               encoding='8UC3' if encoding == 'passthrough' else encoding,
+                               step=cv_image.shape[1] * 3)
+            message.data.frombytes(cv_image.tobytes())
+        else:
+            message = self._cv_bridge.cv2_to_imgmsg(cv_image, encoding=encoding, header=header)
         return message
 
     def from_ros_image(self, message: ImageMsg, encoding: str='passthrough') -> Image:
@@ -96,7 +106,12 @@ class ROS2Bridge:
         :return: OpenDR image (RGB)
         :rtype: engine.data.Image
         """
-        cv_image = self._cv_bridge.imgmsg_to_cv2(message, desired_encoding=encoding)
+        if message.encoding in ('bgr8', 'rgb8', '8UC3') and encoding in ('passthrough', message.encoding):
+            # No color conversion is needed, so view the message buffer directly instead of going through cv_bridge
+            cv_image = np.ndarray(shape=(message.height, message.width, 3), dtype=np.uint8, buffer=message.data,
+                                  strides=(message.step, 3, 1))
+        else:
+            cv_image = self._cv_bridge.imgmsg_to_cv2(message, desired_encoding=encoding)
         image = Image(np.asarray(cv_image, dtype=np.uint8))
         return image
 
@@ -118,14 +133,10 @@ class ROS2Bridge:
         if pose.confidence:
             ros_pose.conf = pose.confidence
 
-        # Add keypoints to pose
-        for i in range(data.shape[0]):
-            ros_keypoint = OpenDRPose2DKeypoint()
-            ros_keypoint.kpt_name = pose.kpt_names[i]
-            ros_keypoint.x = int(data[i][0])
-            ros_keypoint.y = int(data[i][1])
-            # Add keypoint to pose
-            ros_pose.keypoint_list.append(ros_keypoint)
+        # Add keypoints to pose, converting the coordinates to Python ints in one go
+        coords = data[:, :2].astype(np.int32).tolist()
+        ros_pose.keypoint_list.extend([OpenDRPose2DKeypoint(kpt_name=name, x=x, y=y)
+                                       for name, (x, y) in zip(pose.kpt_names, coords)])
         return ros_pose
 
     def from_ros_pose(self, ros_pose: OpenDRPose2D):
@@ -137,13 +148,10 @@ class ROS2Bridge:
         :rtype: engine.target.Pose
         """
         ros_keypoints = ros_pose.keypoint_list
-        keypoints = []
         pose_id, confidence = ros_pose.pose_id, ros_pose.conf
 
-        for ros_keypoint in ros_keypoints:
-            keypoints.append(int(ros_keypoint.x))
-            keypoints.append(int(ros_keypoint.y))
-        data = np.asarray(keypoints).reshape((-1, 2))
+        data = np.fromiter((v for kp in ros_keypoints for v in (kp.x, kp.y)), dtype=int,
+                           count=2 * len(ros_keypoints)).reshape((-1, 2))
 
         pose = Pose(data, confidence)
         pose.id = pose_id
@@ -180,29 +188,26 @@ class ROS2Bridge:
         :return: ROS2 message with the bounding boxes
         :rtype: vision_msgs.msg.Detection2DArray
         """
-        boxes = box_list.data
         ros_boxes = Detection2DArray()
-        for idx, box in enumerate(boxes):
-            ros_box = Detection2D()
-            ros_box.bbox = BoundingBox2D()
-            ros_box.results.append(ObjectHypothesisWithPose())
-            ros_box.bbox.center = Pose2D()
-            try:
-                ros_box.bbox.center.x = box.left + box.width / 2.
-            except:
-                ros_box.bbox.center.x = float(box.left + box.width / 2.)
-            try:
-                ros_box.bbox.center.y = box.top + box.height / 2.
-            except:
-                ros_box.bbox.center.y = float(box.top + box.height / 2.)
-            ros_box.bbox.size_x = float(box.width)
-            ros_box.bbox.size_y = float(box.height)
-            ros_box.results[0].id = str(box.name)
-            if box.confidence:
-                ros_box.results[0].score = float(box.confidence)
-            ros_boxes.detections.append(ros_box)
+        ros_boxes.detections = [self._to_ros_detection(box, float(box.confidence) if box.confidence else 0.0)
+                                for box in box_list.data]
         return ros_boxes
 
+    @staticmethod
+    def _to_ros_detection(box, score):
+        """
+        Builds a Detection2D message for a box, setting all its fields through the message constructors.
+        :param box: OpenDR bounding box to be converted
+        :type box: engine.target.BoundingBox
+        :param score: score to be stored in the detection hypothesis
+        :type score: float
+        :return: ROS2 message with the Detection2D including the bounding box
+        :rtype: vision_msgs.msg.Detection2D
+        """
+        center = Pose2D(x=float(box.left + box.width / 2.), y=float(box.top + box.height / 2.))
+        return Detection2D(bbox=BoundingBox2D(center=center, size_x=float(box.width), size_y=float(box.height)),
+                           results=[ObjectHypothesisWithPose(id=str(box.name), score=score)])
+
     def from_ros_boxes(self, ros_detections):
         """
         Converts a ROS2 message with bounding boxes into an OpenDR BoundingBoxList
@@ -212,18 +217,30 @@ class ROS2Bridge:
         :rtype: engine.target.BoundingBoxList
         """
         ros_boxes = ros_detections.detections
-        bboxes = BoundingBoxList(boxes=[])
-
-        for idx, box in enumerate(ros_boxes):
-            width = box.bbox.size_x
-            height = box.bbox.size_y
-            left = box.bbox.center.x - width / 2.
-            top = box.bbox.center.y - height / 2.
-            _id = int(float(box.results[0].id.strip('][').split(', ')[0]))
-            bbox = BoundingBox(top=top, left=left, width=width, height=height, name=_id)
-            bboxes.data.append(bbox)
+        if not ros_boxes:
+            return BoundingBoxList(boxes=[])
+
+        # Gather centers and sizes into one array and compute the top-left corners for all boxes at once
+        sizes, corners = self._boxes_geometry(ros_boxes)
+        ids = [int(float(box.results[0].id.strip('][').split(', ')[0])) for box in ros_boxes]
+        bboxes = BoundingBoxList(boxes=[BoundingBox(top=top, left=left, width=width, height=height, name=_id)
+                                        for (left, top), (width, height), _id in zip(corners, sizes, ids)])
         return bboxes
 
+    @staticmethod
+    def _boxes_geometry(ros_boxes):
+        """
+        Returns the sizes and top-left corners of a list of Detection2D messages.
+        :param ros_boxes: the ROS2 detections
+        :type ros_boxes: list of vision_msgs.msg.Detection2D
+        :return: (width, height) and (left, top) pairs of every box
+        :rtype: tuple of two lists
+        """
+        geometry = np.array([(box.bbox.center.x, box.bbox.center.y, box.bbox.size_x, box.bbox.size_y)
+                             for box in ros_boxes], dtype=np.float64)
+        corners = geometry[:, :2] - geometry[:, 2:] / 2.
+        return geometry[:, 2:].tolist(), corners.tolist()
+
     def to_ros_bounding_box_list(self, bounding_box_list):
         """
         Converts an OpenDR bounding_box_list into a Detection2DArray msg that can carry the same information
@@ -234,18 +251,8 @@ class ROS2Bridge:
         :rtype: vision_msgs.msg.Detection2DArray
         """
         detections = Detection2DArray()
-        for bounding_box in bounding_box_list:
-            detection = Detection2D()
-            detection.bbox = BoundingBox2D()
-            detection.results.append(ObjectHypothesisWithPose())
-            detection.bbox.center = Pose2D()
-            detection.bbox.center.x = bounding_box.left + bounding_box.width / 2.0
-            detection.bbox.center.y = bounding_box.top + bounding_box.height / 2.0
-            detection.bbox.size_x = float(bounding_box.width)
-            detection.bbox.size_y = float(bounding_box.height)
-            detection.results[0].id = str(bounding_box.name)
-            detection.results[0].score = float(bounding_box.confidence)
-            detections.detections.append(detection)
+        detections.detections = [self._to_ros_detection(bounding_box, float(bounding_box.confidence))
+                                 for bounding_box in bounding_box_list]
         return detections
 
     def from_ros_bounding_box_list(self, ros_detection_2d_array):
@@ -258,16 +265,12 @@ class ROS2Bridge:
         :rtype: engine.target.BoundingBoxList
         """
         detections = ros_detection_2d_array.detections
-        boxes = []
+        if not detections:
+            return BoundingBoxList([])
 
-        for detection in detections:
-            width = detection.bbox.size_x
-            height = detection.bbox.size_y
-            left = detection.bbox.center.x - width / 2.0
-            top = detection.bbox.center.y - height / 2.0
-            name = detection.results[0].id
-            score = detection.results[0].confidence
-            boxes.append(BoundingBox(name, left, top, width, height, score))
+        sizes, corners = self._boxes_geometry(detections)
+        boxes = [BoundingBox(detection.results[0].id, left, top, width, height, detection.results[0].confidence)
+                 for detection, (left, top), (width, height) in zip(detections, corners, sizes)]
         bounding_box_list = BoundingBoxList(boxes)
         return bounding_box_list
 
@@ -396,19 +399,16 @@ class ROS2Bridge:
         header.stamp = time_stamp
         ros_point_cloud.header = header
 
-        channels_count = point_cloud.data.shape[-1] - 3
-
-        channels = [ChannelFloat32Msg(name="channel_" + str(i), values=[]) for i in range(channels_count)]
-        points = []
+        data = np.asarray(point_cloud.data)
+        channels_count = data.shape[-1] - 3
 
-        for point in point_cloud.data:
-            point_msg = Point32Msg()
-            point_msg.x = float(point[0])
-            point_msg.y = float(point[1])
-            point_msg.z = float(point[2])
-            points.append(point_msg)
-            for i in range(channels_count):
-                channels[i].values.append(float(point[3 + i]))
+        channels = []
+        for i in range(channels_count):
+            # Typed arrays are accepted by the message as a whole, without per-value validation
+            values = array.array('f')
+            values.frombytes(np.ascontiguousarray(data[:, 3 + i], dtype=np.float32).tobytes())
+            channels.append(ChannelFloat32Msg(name="channel_" + str(i), values=values))
+        points = [Point32Msg(x=x, y=y, z=z) for x, y, z in data[:, :3].astype(np.float64).tolist()]
 
         ros_point_cloud.points = points
         ros_point_cloud.channels = channels
@@ -557,13 +557,10 @@ class ROS2Bridge:
         :return faces: Numpy array Nx3 representing the IDs of the vertices of each face of the 3D model
         :rtype faces: numpy array (Nx3)
         """
-        vertices = np.zeros([len(mesh_ROS.vertices), 3])
-        faces = np.zeros([len(mesh_ROS.triangles), 3]).astype(int)
-        for i in range(len(mesh_ROS.vertices)):
-            vertices[i] = np.array([mesh_ROS.vertices[i].x, mesh_ROS.vertices[i].y, mesh_ROS.vertices[i].z])
-        for i in range(len(mesh_ROS.triangles)):
-            faces[i] = np.array([int(mesh_ROS.triangles[i].vertex_indices[0]), int(mesh_ROS.triangles[i].vertex_indices[1]),
-                                 int(mesh_ROS.triangles[i].vertex_indices[2])]).astype(int)
+        vertices = np.fromiter((c for v in mesh_ROS.vertices for c in (v.x, v.y, v.z)), dtype=np.float64,
+                               count=3 * len(mesh_ROS.vertices)).reshape(-1, 3)
+        faces = np.fromiter((i for t in mesh_ROS.triangles for i in t.vertex_indices[:3]), dtype=int,
+                            count=3 * len(mesh_ROS.triangles)).reshape(-1, 3)
         return vertices, faces
 
     def to_ros_mesh(self, vertices, faces):
@@ -577,18 +574,9 @@ class ROS2Bridge:
         :rtype mesh_ROS: shape_msgs.msg.Mesh
         """
         mesh_ROS = Mesh()
-        for i in range(vertices.shape[0]):
-            point = Point()
-            point.x = vertices[i, 0]
-            point.y = vertices[i, 1]
-            point.z = vertices[i, 2]
-            mesh_ROS.vertices.append(point)
-        for i in range(faces.shape[0]):
-            mesh_triangle = MeshTriangle()
-            mesh_triangle.vertex_indices[0] = int(faces[i][0])
-            mesh_triangle.vertex_indices[1] = int(faces[i][1])
-            mesh_triangle.vertex_indices[2] = int(faces[i][2])
-            mesh_ROS.triangles.append(mesh_triangle)
+        # Convert to plain Python lists once, instead of extracting numpy scalars element by element
+        mesh_ROS.vertices = [Point(x=x, y=y, z=z) for x, y, z in vertices.astype(np.float64, copy=False).tolist()]
+        mesh_ROS.triangles = [MeshTriangle(vertex_indices=face[:3]) for face in faces.astype(np.uint32).tolist()]
         return mesh_ROS
 
     def from_ros_colors(self, ros_colors):
@@ -599,9 +587,8 @@ class ROS2Bridge:
         :return colors: the colors of the vertices of the 3D model
         :rtype colors: numpy array (Nx3)
         """
-        colors = np.zeros([len(ros_colors), 3])
-        for i in range(len(ros_colors)):
-            colors[i] = np.array([ros_colors[i].r, ros_colors[i].g, ros_colors[i].b])
+        colors = np.fromiter((v for c in ros_colors for v in (c.r, c.g, c.b)), dtype=np.float64,
+                             count=3 * len(ros_colors)).reshape(-1, 3)
         return colors
 
     def to_ros_colors(self, colors):
@@ -612,14 +599,7 @@ class ROS2Bridge:
         :return ros_colors: a list of the colors of the vertices
         :rtype ros_colors: std_msgs.msg.ColorRGBA[]
         """
-        ros_colors = []
-        for i in range(colors.shape[0]):
-            color = ColorRGBA()
-            color.r = colors[i, 0]
-            color.g = colors[i, 1]
-            color.b = colors[i, 2]
-            color.a = 0.0
-            ros_colors.append(color)
+        ros_colors = [ColorRGBA(r=r, g=g, b=b, a=0.0) for r, g, b in colors[:, :3].astype(np.float64).tolist()]
         return ros_colors
 
     def from_ros_pose_3D(self, ros_pose):
@@ -631,9 +611,8 @@ class ROS2Bridge:
         :rtype: engine.target.Pose
         """
         keypoints = ros_pose.keypoint_list
-        data = []
-        for i, keypoint in enumerate(keypoints):
-            data.append([keypoint.x, keypoint.y, keypoint.z])
+        data = np.fromiter((v for kp in keypoints for v in (kp.x, kp.y, kp.z)), dtype=np.float64,
+                           count=3 * len(keypoints)).reshape(-1, 3)
         pose = Pose(data, 1.0)
         pose.id = 0
         return pose
@@ -653,13 +632,8 @@ class ROS2Bridge:
         if pose.id is not None:
             ros_pose.pose_id = int(pose.id)
         ros_pose.conf = 1.0
-        for i in range(len(data)):
-            keypoint = OpenDRPose3DKeypoint()
-            keypoint.kpt_name = ''
-            keypoint.x = float(data[i][0])
-            keypoint.y = float(data[i][1])
-            keypoint.z = float(data[i][2])
-            ros_pose.keypoint_list.append(keypoint)
+        coords = np.asarray(data, dtype=np.float64)[:, :3].tolist()
+        ros_pose.keypoint_list.extend([OpenDRPose3DKeypoint(kpt_name='', x=x, y=y, z=z) for x, y, z in coords])
         return ros_pose
 
     def to_ros_category(self, category):
@@ -14,8 +14,11 @@
 # limitations under the License.
 
 
+import os
+import hashlib
 import rclpy
 from rclpy.node import Node
+from rclpy.qos import qos_profile_sensor_data
 import torch
 import message_filters
 import cv2
@@ -27,8 +30,8 @@ from vision_msgs.msg import Detection2DArray
 from sensor_msgs.msg import Image as ROS_Image
 from opendr_bridge import ROS2Bridge
 from opendr.perception.object_detection_2d import GemLearner
-from opendr.perception.object_detection_2d import draw_bounding_boxes
-from opendr.engine.data import Image
+from opendr.perception.object_detection_2d.datasets.transforms import BoundingBoxListToNumpyArray
+from opendr.perception.object_detection_2d.utils.vis_utils import draw_detections
 
 
 class ObjectDetectionGemNode(Node):
@@ -43,6 +46,8 @@ class ObjectDetectionGemNode(Node):
             device="cuda",
             pts_rgb=None,
             pts_infra=None,
+            cache_path=None,
+            delay=0.02,
     ):
         """
         Creates a ROS2 Node for object detection with GEM
@@ -72,6 +77,11 @@ class ObjectDetectionGemNode(Node):
         and can be obtained using get_color_infra_alignment.py which is located in the
         opendr/perception/object_detection2d/utils module.
         :type pts_infra: {list, numpy.ndarray}
+        :param cache_path: Path in which the infrared alignment maps are stored and reused across runs (if None, the
+        maps are computed at startup)
+        :type cache_path: str
+        :param delay: Define the delay (in seconds) with which rgb message and infrared message can be synchronized
+        :type delay: float
         """
         super().__init__("opendr_object_detection_2d_gem_node")
 
@@ -183,6 +193,13 @@ class ObjectDetectionGemNode(Node):
 
         # Estimating Homography matrix for aligning infra with rgb
         self.h, status = cv2.findHomography(pts_infra, pts_rgb)
+        # Remap tables equivalent to warping with self.h, built on the first frame (they depend on the rgb size)
+        self.ir_map_size = None
+        self.ir_map_1, self.ir_map_2 = None, None
+        self.cache_path = cache_path
+        # Align the infrared image on the GPU when OpenCV is built with CUDA support
+        self.use_cv_cuda = device == "cuda" and hasattr(cv2, "cuda") and cv2.cuda.getCudaEnabledDeviceCount() > 0
+        self.ir_gpu = cv2.cuda_GpuMat() if self.use_cv_cuda else None
 
         self.bridge = ROS2Bridge()
 
@@ -198,12 +215,64 @@ class ObjectDetectionGemNode(Node):
         self.gem_learner.download(path=".", verbose=True)
 
         # Subscribers
-        msg_rgb = message_filters.Subscriber(self, ROS_Image, input_rgb_image_topic)
-        msg_ir = message_filters.Subscriber(self, ROS_Image, input_infra_image_topic)
+        # Camera streams are subscribed best-effort, so stale frames are dropped instead of being retransmitted
+        msg_rgb = message_filters.Subscriber(self, ROS_Image, input_rgb_image_topic,
+                                             qos_profile=qos_profile_sensor_data)
+        msg_ir = message_filters.Subscriber(self, ROS_Image, input_infra_image_topic,
+                                            qos_profile=qos_profile_sensor_data)
 
-        sync = message_filters.TimeSynchronizer([msg_rgb, msg_ir], 1)
+        sync = message_filters.ApproximateTimeSynchronizer([msg_rgb, msg_ir], queue_size=5, slop=delay)
         sync.registerCallback(self.callback)
 
+    def update_ir_maps(self, width, height):
+        """
+        Precomputes the remap tables that align the infrared image with an rgb image of the given size, so that the
+        inverse homography is evaluated once instead of on every frame.
+        :param width: width of the rgb image
+        :type width: int
+        :param height: height of the rgb image
+        :type height: int
+        """
+        maps_path = None
+        if self.cache_path is not None:
+            h_hash = hashlib.sha1(self.h.tobytes()).hexdigest()[:12]
+            maps_path = os.path.join(self.cache_path, "gem_ir_maps_{}x{}_{}.npy".format(width, height, h_hash))
+        if maps_path is not None and os.path.exists(maps_path):
+            src_x, src_y = np.load(maps_path, mmap_mode="r")
+        else:
+            xs, ys = np.meshgrid(np.arange(width, dtype=np.float64), np.arange(height, dtype=np.float64))
+            dst = np.stack([xs, ys, np.ones_like(xs)], axis=-1)
+            src = dst @ np.linalg.inv(self.h).T
+            src_x = (src[..., 0] / src[..., 2]).astype(np.float32)
+            src_y = (src[..., 1] / src[..., 2]).astype(np.float32)
+            if maps_path is not None:
+                os.makedirs(self.cache_path, exist_ok=True)
+                np.save(maps_path, np.stack([src_x, src_y]))
+        if self.use_cv_cuda:
+            self.ir_map_1, self.ir_map_2 = cv2.cuda_GpuMat(), cv2.cuda_GpuMat()
+            self.ir_map_1.upload(src_x)
+            self.ir_map_2.upload(src_y)
+        else:
+            # Fixed-point maps allow OpenCV to use its fastest remap path
+            self.ir_map_1, self.ir_map_2 = cv2.convertMaps(src_x, src_y, cv2.CV_16SC2)
+        self.ir_map_size = (width, height)
+
+    def to_opencv_image(self, message, encoding="passthrough"):
+        """
+        Converts a ROS2 image message into an OpenCV image. 8-bit color messages that need no color conversion are
+        wrapped without copying, which gives the same result as going through an OpenDR image and back.
+        :param message: ROS2 image message to be converted
+        :type message: sensor_msgs.msg.Image
+        :param encoding: encoding to be used for the conversion (inherited from CvBridge)
+        :type encoding: str
+        :return: image in OpenCV format
+        :rtype: numpy.ndarray
+        """
+        if message.encoding in ("bgr8", "rgb8") and encoding in ("passthrough", message.encoding):
+            return np.ndarray(shape=(message.height, message.width, 3), dtype=np.uint8, buffer=message.data,
+                              strides=(message.step, 3, 1))
+        return self.bridge.from_ros_image(message, encoding).opencv()
+
     def callback(self, msg_rgb, msg_ir):
         """
         Callback that process the input data and publishes to the corresponding topics
@@ -215,9 +284,15 @@ class ObjectDetectionGemNode(Node):
         if self.performance_publisher:
             start_time = perf_counter()
         # Convert images to OpenDR standard
-        image_rgb = self.bridge.from_ros_image(msg_rgb).opencv()
-        image_ir_raw = self.bridge.from_ros_image(msg_ir, "bgr8").opencv()
-        image_ir = cv2.warpPerspective(image_ir_raw, self.h, (image_rgb.shape[1], image_rgb.shape[0]))
+        image_rgb = self.to_opencv_image(msg_rgb)
+        image_ir_raw = self.to_opencv_image(msg_ir, "bgr8")
+        if self.ir_map_size != (image_rgb.shape[1], image_rgb.shape[0]):
+            self.update_ir_maps(image_rgb.shape[1], image_rgb.shape[0])
+        if self.use_cv_cuda:
+            self.ir_gpu.upload(image_ir_raw)
+            image_ir = cv2.cuda.remap(self.ir_gpu, self.ir_map_1, self.ir_map_2, cv2.INTER_LINEAR).download()
+        else:
+            image_ir = cv2.remap(image_ir_raw, self.ir_map_1, self.ir_map_2, cv2.INTER_LINEAR)
 
         # Perform inference on images
         boxes, w_sensor1, _ = self.gem_learner.infer(image_rgb, image_ir)
@@ -236,14 +311,35 @@ class ObjectDetectionGemNode(Node):
             # We can get the data back using self.bridge.from_ros_bounding_box_list(ros_detection)
             # e.g., opendr_detection = self.bridge.from_ros_bounding_box_list(ros_detection)
 
+        if self.rgb_publisher is None and self.ir_publisher is None:
+            return
+        # Convert the detections once and draw them on both images
+        boxes_np = BoundingBoxListToNumpyArray()(boxes).astype(np.float32) if boxes.data else np.empty((0, 6))
+        classes = boxes_np[:, 5].astype(np.int32)
         if self.rgb_publisher is not None:
-            plot_rgb = draw_bounding_boxes(image_rgb, boxes, class_names=self.classes)
-            message = self.bridge.to_ros_image(Image(np.uint8(plot_rgb)))
-            self.rgb_publisher.publish(message)
+            plot_rgb = draw_detections(image_rgb, boxes_np[:, :4], boxes_np[:, 4], classes, class_names=self.classes)
+            self.rgb_publisher.publish(self.to_ros_image(plot_rgb.astype(np.uint8, copy=False)))
         if self.ir_publisher is not None:
-            plot_ir = draw_bounding_boxes(image_ir, boxes, class_names=self.classes)
-            message = self.bridge.to_ros_image(Image(np.uint8(plot_ir)))
-            self.ir_publisher.publish(message)
+            plot_ir = draw_detections(image_ir, boxes_np[:, :4], boxes_np[:, 4], classes, class_names=self.classes)
+            self.ir_publisher.publish(self.to_ros_image(plot_ir.astype(np.uint8, copy=False)))
+
+    @staticmethod
+    def to_ros_image(image, encoding="bgr8"):
+        """
+        Fills a ROS2 image message directly from an OpenCV image, avoiding the round-trip through an OpenDR image.
+        :param image: image in OpenCV (HWC) format
+        :type image: numpy.ndarray
+        :param encoding: encoding of the image data
+        :type encoding: str
+        :return: ROS2 image
+        :rtype: sensor_msgs.msg.Image
+        """
+        message = ROS_Image()
+        message.height, message.width = image.shape[:2]
+        message.encoding = encoding
+        message.step = image.shape[1] * image.shape[2] * image.itemsize
+        message.data.frombytes(image.tobytes())
+        return message
 
 
 def main(args=None):
@@ -267,6 +363,10 @@ def main(args=None):
                         type=str, default=None)
     parser.add_argument("--device", help='Device to use, either "cpu" or "cuda", defaults to "cuda"',
                         type=str, default="cuda", choices=["cuda", "cpu"])
+    parser.add_argument("--cache_path", help="Path for storing the infrared alignment maps, disabled (None) by default",
+                        type=str, default=None)
+    parser.add_argument("--delay", help="The delay (in seconds) with which RGB message and "
+                                        "infrared message can be synchronized", type=float, default=0.02)
     args = parser.parse_args()
 
     try:
@@ -290,6 +390,8 @@ def main(args=None):
         output_infra_image_topic=args.output_infra_image_topic,
         detections_topic=args.detections_topic,
         performance_topic=args.performance_topic,
+        cache_path=args.cache_path,
+        delay=args.delay,
     )
 
     rclpy.spin(gem_node)
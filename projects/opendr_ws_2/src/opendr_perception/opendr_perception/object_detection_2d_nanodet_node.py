@@ -33,7 +33,8 @@ from opendr.perception.object_detection_2d import draw_bounding_boxes
 class ObjectDetectionNanodetNode(Node):
 
     def __init__(self, input_rgb_image_topic="image_raw", output_rgb_image_topic="/opendr/image_objects_annotated",
-                 detections_topic="/opendr/objects", performance_topic=None, device="cuda", model="plus_m_1.5x_416"):
+                 detections_topic="/opendr/objects", performance_topic=None, device="cuda", model="plus_m_1.5x_416",
+                 half_precision=False):
         """
         Creates a ROS2 Node for object detection with Nanodet.
         :param input_rgb_image_topic: Topic from which we are reading the input image
@@ -51,6 +52,8 @@ class ObjectDetectionNanodetNode(Node):
         :type device: str
         :param model: the name of the model of which we want to load the config file
         :type model: str
+        :param half_precision: whether to run inference in FP16, only used on CUDA
+        :type half_precision: bool
         """
         super().__init__('object_detection_2d_nanodet_node')
 
@@ -74,6 +77,7 @@ class ObjectDetectionNanodetNode(Node):
         self.bridge = ROS2Bridge()
 
         # Initialize the object detector
+        self.half_precision = half_precision and device == "cuda"
         self.object_detector = NanodetLearner(model_to_use=model, device=device)
         self.object_detector.download(path=".", mode="pretrained", verbose=True)
         self.object_detector.load("./nanodet_{}".format(model))
@@ -92,7 +96,7 @@ class ObjectDetectionNanodetNode(Node):
         image = self.bridge.from_ros_image(data, encoding='bgr8')
 
         # Run object detection
-        boxes = self.object_detector.infer(image, conf_threshold=0.35)
+        boxes = self.object_detector.infer(image, conf_threshold=0.35, hf=self.half_precision)
 
         if self.performance_publisher:
             end_time = perf_counter()
@@ -130,6 +134,8 @@ def main(args=None):
                         type=str, default=None)
     parser.add_argument("--device", help="Device to use (cpu, cuda)", type=str, default="cuda", choices=["cuda", "cpu"])
     parser.add_argument("--model", help="Model that config file will be used", type=str, default="plus_m_1.5x_416")
+    parser.add_argument("--accelerate", help="Enables acceleration flags (e.g., half precision inference)",
+                        default=False, action="store_true")
     args = parser.parse_args()
 
     try:
@@ -146,6 +152,7 @@ def main(args=None):
         device = "cpu"
 
     object_detection_nanodet_node = ObjectDetectionNanodetNode(device=device, model=args.model,
+                                                               half_precision=args.accelerate,
                                                                input_rgb_image_topic=args.input_rgb_image_topic,
                                                                output_rgb_image_topic=args.output_rgb_image_topic,
                                                                detections_topic=args.detections_topic,
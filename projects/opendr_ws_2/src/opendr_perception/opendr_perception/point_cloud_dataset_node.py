@@ -15,6 +15,8 @@
 
 import argparse
 import os
+import queue
+import threading
 import rclpy
 from rclpy.node import Node
 from sensor_msgs.msg import PointCloud as ROS_PointCloud
@@ -37,27 +39,47 @@ class PointCloudDatasetNode(Node):
         super().__init__('opendr_point_cloud_dataset_node')
 
         self.dataset = dataset
+        self.dataset_length = len(dataset)
         self.bridge = ROS2Bridge()
+
+        # Samples are read from disk in the background, so that the timer only has to publish them
+        self.prefetched_samples = queue.Queue(maxsize=2)
+        threading.Thread(target=self.prefetch_samples, daemon=True).start()
         self.timer = self.create_timer(1.0 / data_fps, self.timer_callback)
-        self.sample_index = 0
 
         self.output_point_cloud_publisher = self.create_publisher(
             ROS_PointCloud, output_point_cloud_topic, 1
         )
         self.get_logger().info("Publishing point_cloud images.")
 
+    def prefetch_samples(self):
+        """
+        Reads the dataset samples in order, blocking while the prefetch queue is full.
+        If reading a sample fails, the exception is queued instead and prefetching stops.
+        """
+        index = 0
+        while True:
+            try:
+                # Dataset should have a (PointCloud, Target) pair as elements
+                point_cloud = self.dataset[index % self.dataset_length][0]
+            except Exception as e:
+                self.prefetched_samples.put(e)
+                return
+            self.prefetched_samples.put(point_cloud)
+            index += 1
+
     def timer_callback(self):
 
-        point_cloud = self.dataset[self.sample_index % len(self.dataset)][0]
-        # Dataset should have a (PointCloud, Target) pair as elements
+        point_cloud = self.prefetched_samples.get()
+        if isinstance(point_cloud, Exception):
+            self.get_logger().error(f"Failed to read a dataset sample: {point_cloud}")
+            raise point_cloud
 
         message = self.bridge.to_ros_point_cloud(
             point_cloud, self.get_clock().now().to_msg()
         )
         self.output_point_cloud_publisher.publish(message)
 
-        self.sample_index += 1
-
 
 def main(args=None):
     rclpy.init(args=args)
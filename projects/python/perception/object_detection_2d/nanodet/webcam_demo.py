@@ -13,6 +13,8 @@
 # limitations under the License.
 
 import argparse
+import queue
+import threading
 
 import cv2
 import time
@@ -23,15 +25,32 @@ from opendr.perception.object_detection_2d import draw_bounding_boxes
 
 
 class VideoReader(object):
-    def __init__(self, file_name):
+    def __init__(self, file_name, queue_size=4):
         self.file_name = file_name
-        self.cap = cv2.VideoCapture(self.file_name)
-        if not self.cap.isOpened():
-            raise IOError('Video {} cannot be opened'.format(self.file_name))
         try:  # OpenCV needs int to read from webcam
             self.file_name = int(file_name)
         except ValueError:
             pass
+        if isinstance(self.file_name, str) and hasattr(cv2, "CAP_PROP_HW_ACCELERATION"):
+            # Decode video files with FFmpeg on the hardware decoder (NVDEC, VA-API, ...) when one is available
+            self.cap = cv2.VideoCapture(self.file_name, cv2.CAP_FFMPEG,
+                                        [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY,
+                                         cv2.CAP_PROP_HW_DEVICE, 0])
+        else:
+            self.cap = cv2.VideoCapture(self.file_name)
+        if not self.cap.isOpened():
+            raise IOError('Video {} cannot be opened'.format(self.file_name))
+        # Frames are read ahead on a background thread, so that decoding overlaps with inference
+        self.frames = queue.Queue(maxsize=queue_size)
+        self.reader = threading.Thread(target=self._read_frames, daemon=True)
+        self.reader.start()
+
+    def _read_frames(self):
+        while True:
+            was_read, img = self.cap.read()
+            self.frames.put(img if was_read else None)
+            if not was_read:
+                break
 
     def __iter__(self):
         if not self.cap.isOpened():
@@ -39,12 +58,28 @@ class VideoReader(object):
         return self
 
     def __next__(self):
-        was_read, img = self.cap.read()
-        if not was_read:
+        img = self.frames.get()
+        if img is None:
             raise StopIteration
         return img
 
 
+def display_results(display_queue, class_names):
+    # Drawing and showing run on their own thread, so that the UI does not slow down inference
+    while True:
+        item = display_queue.get()
+        if item is None:
+            break
+        img, boxes, fps = item
+        if boxes:
+            draw_bounding_boxes(img, boxes, class_names=class_names, line_thickness=3)
+        if fps is not None:
+            img = cv2.putText(img, "FPS: %.2f" % (fps,), (50, 50), cv2.FONT_HERSHEY_SIMPLEX,
+                              1, (255, 0, 0), 2, cv2.LINE_AA)
+        cv2.imshow('Result', img)
+        cv2.waitKey(1)
+
+
 if __name__ == '__main__':
     parser = argparse.ArgumentParser()
     parser.add_argument("--device", help="Device to use (cpu, cuda)", type=str, default="cuda", choices=["cuda", "cpu"])
@@ -53,6 +88,8 @@ if __name__ == '__main__':
                                  "RepVGG_A0_416", "t", "g", "m", "m_416", "m_0.5x", "m_1.5x", "m_1.5x_416",
                                  "plus_m_320", "plus_m_1.5x_320", "plus_m_416", "plus_m_1.5x_416", "custom"])
     parser.add_argument("--optimize", help="", type=str, default="", choices=["", "onnx", "jit"])
+    parser.add_argument("--video", help="Path to a video file to use instead of the first camera", type=str, default="0")
+    parser.add_argument("--display_every", help="Show only every n-th frame", type=int, default=1)
     args = parser.parse_args()
 
     optimize, device, model = args.optimize, args.device, args.model
@@ -61,18 +98,23 @@ if __name__ == '__main__':
     nanodet.download("./predefined_examples", mode="pretrained")
     nanodet.load("./predefined_examples/nanodet_{}".format(args.model), verbose=True)
 
-    # Use the first camera available on the system
-    image_provider = VideoReader(0)
+    # Use the first camera available on the system, unless a video file is given
+    image_provider = VideoReader(args.video)
 
     if args.optimize != "":
         nanodet.optimize("./{}/nanodet_{}".format(args.optimize, args.model), optimization=args.optimize,
                          conf_threshold=0.35, iou_threshold=0.6, nms_max_num=20)
 
+    # Only the latest frame is kept for display, stale frames are dropped
+    display_queue = queue.Queue(maxsize=1)
+    display_thread = threading.Thread(target=display_results, args=(display_queue, nanodet.classes), daemon=True)
+    display_thread.start()
+
     try:
         counter, avg_fps = 0, 0
-        for img in image_provider:
+        for frame_idx, frame in enumerate(image_provider):
 
-            img = Image(img)
+            img = Image(frame)
 
             start_time = time.perf_counter()
 
@@ -84,19 +126,20 @@ if __name__ == '__main__':
             # Calculate a running average on FPS
             avg_fps = 0.8 * fps + 0.2 * avg_fps
 
-            img = img.opencv()
-
-            if boxes:
-                draw_bounding_boxes(img, boxes, class_names=nanodet.classes, line_thickness=3)
-
             # Wait a few frames for FPS to stabilize
             if counter < 5:
                 counter += 1
-            else:
-                img = cv2.putText(img, "FPS: %.2f" % (avg_fps,), (50, 50), cv2.FONT_HERSHEY_SIMPLEX,
-                                  1, (255, 0, 0), 2, cv2.LINE_AA)
 
-            cv2.imshow('Result', img)
-            cv2.waitKey(1)
+            if frame_idx % args.display_every == 0:
+                try:
+                    display_queue.put_nowait((frame, boxes, avg_fps if counter >= 5 else None))
+                except queue.Full:
+                    pass
     except:
         print("Average inference fps: ", avg_fps)
+    finally:
+        try:
+            display_queue.get_nowait()
+        except queue.Empty:
+            pass
+        display_queue.put(None)
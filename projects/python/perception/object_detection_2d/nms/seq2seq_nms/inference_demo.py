@@ -18,6 +18,7 @@ from opendr.perception.object_detection_2d import draw_bounding_boxes
 from opendr.engine.data import Image
 import os
 import argparse
+import torch
 OPENDR_HOME = os.environ['OPENDR_HOME']
 
 parser = argparse.ArgumentParser()
@@ -49,7 +50,7 @@ ssd = SingleShotDetectorLearner(device=args.device)
 ssd.download(".", mode="pretrained")
 ssd.load(args.ssd_model, verbose=True)
 img = Image.open(OPENDR_HOME + '/projects/python/perception/object_detection_2d/nms/img_temp/frame_0000.jpg')
-if not isinstance(img, Image):
-    img = Image(img)
-boxes = ssd.infer(img, threshold=0.3, custom_nms=seq2SeqNMSLearner)
+# Seq2Seq-NMS only runs forward passes here, so autograd tracking can be disabled altogether
+with torch.inference_mode():
+    boxes = ssd.infer(img, threshold=0.3, custom_nms=seq2SeqNMSLearner)
 draw_bounding_boxes(img.opencv(), boxes, class_names=ssd.classes, show=True)
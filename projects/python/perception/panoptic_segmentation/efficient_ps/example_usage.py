@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from opendr.engine.data import Image
@@ -21,6 +22,10 @@ from opendr.perception.panoptic_segmentation import EfficientPsLearner, Cityscap
 DATA_ROOT = '/home/USER/data/efficientPS'
 CITYSCAPES_ROOT = f'{DATA_ROOT}/converted_datasets/cityscapes'
 KITTI_ROOT = f'{DATA_ROOT}/converted_datasets/kitti_panoptic'
+CONFIG_DIR = Path(sys.modules[EfficientPsLearner.__module__].__file__).parent / 'configs'
+CITYSCAPES_CONFIG = str(CONFIG_DIR / 'singlegpu_cityscapes.py')
+KITTI_CONFIG = str(CONFIG_DIR / 'singlegpu_kitti.py')
+WORK_DIR = str(Path(__file__).parent / 'work_dir')
 
 
 def download_models():
@@ -38,31 +43,27 @@ def train():
     train_dataset = CityscapesDataset(path=f'{CITYSCAPES_ROOT}/train')
     val_dataset = CityscapesDataset(path=f'{CITYSCAPES_ROOT}/val')
 
-    config_file = Path(sys.modules[
-                           EfficientPsLearner.__module__].__file__).parent / 'configs' / 'singlegpu_cityscapes.py'
     learner = EfficientPsLearner(
-        str(config_file),
+        CITYSCAPES_CONFIG,
         iters=2,
         batch_size=1,
         checkpoint_after_iter=2
     )
     train_stats = learner.fit(train_dataset, val_dataset=val_dataset,
-                              logging_path=str(Path(__file__).parent / 'work_dir'))
+                              logging_path=WORK_DIR)
     learner.save(path=f'{DATA_ROOT}/checkpoints/efficientPS')
     assert train_stats  # This assert is just a workaround since pyflakes does not support the NOQA comment
 
 
 def evaluate():
     val_dataset = CityscapesDataset(path=f'{CITYSCAPES_ROOT}/val')
-    config_file = Path(sys.modules[EfficientPsLearner.__module__].__file__).parent / 'configs' / 'singlegpu_cityscapes.py'
-    learner = EfficientPsLearner(str(config_file))
+    learner = EfficientPsLearner(CITYSCAPES_CONFIG)
     learner.load(path=f'{DATA_ROOT}/checkpoints/model_cityscapes.pth')
     eval_stats = learner.eval(val_dataset, print_results=True)
     assert eval_stats  # This assert is just a workaround since pyflakes does not support the NOQA comment
 
     val_dataset = KittiDataset(path=f'{KITTI_ROOT}/val')
-    config_file = Path(sys.modules[EfficientPsLearner.__module__].__file__).parent / 'configs' / 'singlegpu_kitti.py'
-    learner = EfficientPsLearner(str(config_file))
+    learner = EfficientPsLearner(KITTI_CONFIG)
     learner.load(path=f'{DATA_ROOT}/checkpoints/model_kitti.pth')
     eval_stats = learner.eval(val_dataset, print_results=True)
     assert eval_stats  # This assert is just a workaround since pyflakes does not support the NOQA comment
@@ -74,10 +75,11 @@ def inference():
         f'{CITYSCAPES_ROOT}/val/images/lindau_000002_000019.png',
         f'{CITYSCAPES_ROOT}/val/images/lindau_000003_000019.png',
     ]
-    images = [Image.open(f) for f in image_filenames]
+    # OpenCV releases the GIL while decoding, so the images are read concurrently
+    with ThreadPoolExecutor(max_workers=min(8, len(image_filenames))) as executor:
+        images = list(executor.map(Image.open, image_filenames))
 
-    config_file = Path(sys.modules[EfficientPsLearner.__module__].__file__).parent / 'configs' / 'singlegpu_cityscapes.py'
-    learner = EfficientPsLearner(str(config_file))
+    learner = EfficientPsLearner(CITYSCAPES_CONFIG)
     learner.load(path=f'{DATA_ROOT}/checkpoints/model_cityscapes.pth')
     predictions = learner.infer(images)
     for image, prediction in zip(images, predictions):
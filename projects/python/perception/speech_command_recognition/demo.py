@@ -14,10 +14,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import math
 import numpy as np
 import torch
 import argparse
-import librosa
+import soundfile
+from scipy.signal import resample_poly
 from opendr.engine.data import Timeseries
 from opendr.perception.speech_recognition import MatchboxNetLearner, EdgeSpeechNetsLearner, QuadraticSelfOnnLearner
 
@@ -59,7 +61,14 @@ if __name__ == '__main__':
         learner.load(args.model_path)
 
     # Load the audio file and run speech command recognition
-    audio_input, _ = librosa.load(args.input, sr=learner.sample_rate)
-    data = Timeseries(np.expand_dims(audio_input, axis=0))
+    # Decode with libsndfile directly and only resample when the file rate differs from the model rate
+    audio_input, sample_rate = soundfile.read(args.input, dtype='float32')
+    if audio_input.ndim > 1:
+        audio_input = audio_input.mean(axis=1)
+    if sample_rate != learner.sample_rate:
+        gcd = math.gcd(sample_rate, learner.sample_rate)
+        audio_input = resample_poly(audio_input, learner.sample_rate // gcd, sample_rate // gcd).astype(np.float32)
+    # A contiguous float32 buffer lets Timeseries keep a view of it instead of copying
+    data = Timeseries(np.ascontiguousarray(audio_input, dtype=np.float32).reshape(1, -1))
     result = learner.infer(data)
     print(result)
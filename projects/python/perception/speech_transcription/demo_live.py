@@ -15,7 +15,8 @@
 
 from typing import Optional, Callable
 import argparse
-import time
+import re
+import threading
 
 import numpy as np
 import sounddevice as sd
@@ -26,6 +27,10 @@ from opendr.perception.speech_transcription import (
 )
 
 
+START_COMMAND = re.compile(r"\bstart\b", re.IGNORECASE)
+STOP_COMMAND = re.compile(r"\bstop\b", re.IGNORECASE)
+
+
 def str2bool(v):
     if isinstance(v, bool):
         return v
@@ -37,17 +42,52 @@ def str2bool(v):
         raise argparse.ArgumentTypeError("Boolean value expected.")
 
 
-def record_audio(duration: int, sample_rate: int) -> np.ndarray:
-    audio_data = sd.rec(
-        int(duration * sample_rate),
-        samplerate=sample_rate,
-        channels=1,
-        dtype="float32",
-    )
-    sd.wait()  # Wait for the recording to finish
-    audio_data = np.squeeze(audio_data, axis=-1)
+class AudioRingBuffer:
+    """
+    Fixed-size ring buffer fed by a sounddevice InputStream callback, so that recording continues on PortAudio's
+    thread while the main thread runs inference on the samples captured so far.
+    """
+
+    def __init__(self, max_seconds: int, sample_rate: int):
+        self.sample_rate = sample_rate
+        self.buffer = np.empty((max_seconds * sample_rate,), dtype=np.float32)
+        self.write_pos = 0
+        self.read_pos = 0
+        self.cond = threading.Condition()
+
+    def callback(self, indata, frames, time_info, status):
+        with self.cond:
+            size = len(self.buffer)
+            start = self.write_pos % size
+            first = min(frames, size - start)
+            np.copyto(self.buffer[start:start + first], indata[:first, 0])
+            np.copyto(self.buffer[:frames - first], indata[first:, 0])
+            self.write_pos += frames
+            # Drop the oldest samples if the consumer fell behind by more than the buffer length
+            self.read_pos = max(self.read_pos, self.write_pos - size)
+            self.cond.notify()
+
+    def available(self) -> int:
+        with self.cond:
+            return self.write_pos - self.read_pos
 
-    return audio_data
+    def read(self, num_samples: int) -> np.ndarray:
+        with self.cond:
+            self.cond.wait_for(lambda: self.write_pos - self.read_pos >= num_samples)
+            size = len(self.buffer)
+            start = self.read_pos % size
+            end = start + num_samples
+            if end <= size:
+                # Copied, since the callback keeps writing and overwrites this region if inference lags behind
+                audio_data = self.buffer[start:end].copy()
+            else:
+                audio_data = np.concatenate((self.buffer[start:], self.buffer[:end - size]))
+            self.read_pos += num_samples
+        return audio_data
+
+    def skip(self, num_samples: int):
+        with self.cond:
+            self.read_pos = min(self.read_pos + num_samples, self.write_pos)
 
 
 def transcribe_audio(audio_data: np.ndarray, initial_prompt: Optional[str], transcribe_function: Callable):
@@ -59,22 +99,27 @@ def transcribe_audio(audio_data: np.ndarray, initial_prompt: Optional[str], tran
     return output
 
 
-def wait_for_start_command(learner, sample_rate):
+def wait_for_start_command(learner, ring_buffer, energy_threshold=1e-4):
     while True:
-        audio_data = record_audio(1, sample_rate)
-        transcription = learner.infer(audio_data).text.lower()
+        audio_data = ring_buffer.read(ring_buffer.sample_rate)
+        # Only run the model on windows that contain sound, silence cannot hold the start command. A threshold of 0
+        # disables the gate.
+        if energy_threshold > 0 and np.dot(audio_data, audio_data) / len(audio_data) < energy_threshold:
+            continue
+        transcription = learner.infer(audio_data).text
         print(f"User said: {transcription}")
 
-        if "start" in transcription:
+        if START_COMMAND.search(transcription):
             print("Start command received. Starting transcribe.")
             break
 
 
 def main(
-    backbone, duration, interval, model_path, model_name, initial_prompt, language, download_dir, device
+    backbone, duration, interval, model_path, model_name, initial_prompt, language, download_dir, device,
+    backend="openai", compute_type="int8", start_model_name=None, energy_threshold=1e-4,
 ):
     if backbone == "whisper":
-        learner = WhisperLearner(language=language, device=device)
+        learner = WhisperLearner(language=language, device=device, backend=backend, compute_type=compute_type)
         learner.load(name=model_name, model_path=model_path, download_dir=download_dir)
     elif args.backbone == "vosk":
         learner = VoskLearner()
@@ -87,25 +132,43 @@ def main(
     else:
         raise ValueError("invalid backbone")
 
-    # Wait for the user to say "start" before starting the loop
+    # Listening for a single keyword does not need the transcription model, a smaller Whisper model can be used instead
+    if backbone == "whisper" and start_model_name is not None:
+        start_learner = WhisperLearner(language=language, device=device, backend=backend, compute_type=compute_type)
+        start_learner.load(name=start_model_name, download_dir=download_dir)
+    else:
+        start_learner = learner
+
+    # Record continuously in the background, the ring buffer holds two full Whisper windows so that the samples being
+    # transcribed are not overwritten while the next window is recorded
     sample_rate = 16000
-    print("Waiting for 'start' command. Say 'start' to start the transcribe loop.")
-    print("Say 'stop' to stop the transcribe loop.")
-    wait_for_start_command(learner, sample_rate)
+    window_seconds = 30
+    ring_buffer = AudioRingBuffer(2 * max(window_seconds, duration), sample_rate)
+    chunk_size = int(duration * sample_rate)
+    max_chunks = max(1, window_seconds // duration)
 
-    while True:
-        # Record the audio
-        audio_data = record_audio(duration, sample_rate)
+    with sd.InputStream(samplerate=sample_rate, channels=1, dtype="float32", callback=ring_buffer.callback):
+        # Wait for the user to say "start" before starting the loop
+        print("Waiting for 'start' command. Say 'start' to start the transcribe loop.")
+        print("Say 'stop' to stop the transcribe loop.")
+        wait_for_start_command(start_learner, ring_buffer, energy_threshold=energy_threshold)
+        ring_buffer.skip(ring_buffer.available())
 
-        # Transcribe the recorded audio and check for the "stop" command
-        transcription = transcribe_audio(audio_data, initial_prompt, learner.infer).lower()
+        while True:
+            # Chunks recorded while the previous inference was running are transcribed together in a single call,
+            # up to one 30 second window
+            num_chunks = min(max(1, ring_buffer.available() // chunk_size), max_chunks)
+            audio_data = ring_buffer.read(num_chunks * chunk_size)
 
-        if "stop" in transcription:
-            print("Stop command received. Exiting the program.")
-            break
+            # Transcribe the recorded audio and check for the "stop" command
+            transcription = transcribe_audio(audio_data, initial_prompt, learner.infer)
+
+            if STOP_COMMAND.search(transcription):
+                print("Stop command received. Exiting the program.")
+                break
 
-        # Wait for `interval` seconds before starting the next recording
-        time.sleep(interval)
+            # Discard `interval` seconds of audio before the next transcription
+            ring_buffer.skip(int(interval * sample_rate))
 
     print("Finished transcribe.")
 
@@ -140,6 +203,18 @@ if __name__ == "__main__":
         help="backbone to use for audio processing. Options: whisper, vosk",
         choices=["whisper", "vosk"],
     )
+    parser.add_argument(
+        "--backend",
+        default="openai",
+        help="Whisper inference backend. Options: openai, ctranslate2 (requires faster-whisper)",
+        choices=["openai", "ctranslate2"],
+    )
+    parser.add_argument(
+        "--compute_type",
+        type=str,
+        default="int8",
+        help="Weight and activation type for the ctranslate2 backend, e.g. int8, int8_float16, float16",
+    )
     parser.add_argument(
         "--model_path",
         type=str,
@@ -154,6 +229,20 @@ if __name__ == "__main__":
         "'medium.en', 'medium', 'large-v1', 'large-v2', 'large']",
         default=None,
     )
+    parser.add_argument(
+        "--start_model_name",
+        type=str,
+        help="Smaller Whisper model used only to listen for the 'start' command, e.g. tiny.en. "
+        "If not given, the transcription model is used",
+        default=None,
+    )
+    parser.add_argument(
+        "--energy_threshold",
+        type=float,
+        default=1e-4,
+        help="Mean signal energy below which one second windows are not checked for the 'start' command, "
+        "depends on the microphone gain. Set to 0 to transcribe every window",
+    )
     parser.add_argument(
         "--initial_prompt",
         default="",
@@ -182,4 +271,8 @@ if __name__ == "__main__":
         language=args.language,
         download_dir=args.download_dir,
         device=args.device,
+        backend=args.backend,
+        compute_type=args.compute_type,
+        start_model_name=args.start_model_name,
+        energy_threshold=args.energy_threshold,
     )
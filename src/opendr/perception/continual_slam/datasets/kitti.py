@@ -16,6 +16,7 @@ import numpy as np
 import os
 import re
 from datetime import datetime
+from functools import lru_cache
 from tqdm import tqdm
 from shutil import copyfile
 import argparse
@@ -74,6 +75,10 @@ class KittiDataset(ExternalDataset, DatasetIterator):
         # Now we simply put all sequences available on into a single list
         self._create_lists_from_sequences()
 
+        # Consecutive items share two of their three frames, keep the last decoded frames and speeds around
+        self._load_image = lru_cache(maxsize=4)(self._load_image)
+        self._load_speed = lru_cache(maxsize=4)(self._load_speed)
+
         self.sequence_check = None
 
     @staticmethod
@@ -193,13 +198,24 @@ class KittiDataset(ExternalDataset, DatasetIterator):
         previous_timestamp = self.timestamps[index - 1]
         current_timestamp = self.timestamps[index]
         delta_timestamp = current_timestamp - previous_timestamp  # s
-        # Compute speed as norm of forward, leftward, and upward elements
-        previous_speed = np.linalg.norm(np.loadtxt(str(self.velocities[index - 1]))[8:11])
-        current_speed = np.linalg.norm(np.loadtxt(str(self.velocities[index]))[8:11])
-        speed = (previous_speed + current_speed) / 2  # m/s
+        speed = (self._load_speed(index - 1) + self._load_speed(index)) / 2  # m/s
         distance = speed * delta_timestamp
         return distance
 
+    def _load_speed(self, index: int) -> float:
+        """
+        Speed in m/s, computed as the norm of the forward, leftward, and upward velocity elements.
+        """
+        return np.linalg.norm(np.loadtxt(str(self.velocities[index]))[8:11])
+
+    def _load_image(self, index: int) -> Image:
+        """
+        Load and resize the image at the given index, returned as an RGB image in CHW layout.
+        """
+        image = PILImage.open(str(self.images[index]))
+        image = Resize((self.height, self.width), interpolation=InterpolationMode.LANCZOS)(image)
+        return Image(np.ascontiguousarray(np.asarray(image).transpose(2, 0, 1)), guess_format=False)
+
     def _create_lists_from_sequences(self):
         """
         This method is used for creating a single list of images, velocities and timestamps from the sequences.
@@ -231,10 +247,7 @@ class KittiDataset(ExternalDataset, DatasetIterator):
         flag = False
         counter = 0
         for i in range(idx, idx+3):
-            image = PILImage.open(str(self.images[i]))
-            image = Resize((self.height, self.width), interpolation=InterpolationMode.LANCZOS)(image)
-            image = Image(image).opencv().transpose(2, 0, 1)
-            image = Image(image)
+            image = self._load_image(i)
             distance = self._load_relative_distance(i)
             image_id = self.images[i].name.split('.')[0]
             sequence_id = re.findall("sequences/\d\d", str(self.images[i]))[0].split('/')[1]
@@ -21,17 +21,11 @@ from collections import defaultdict
 from pycocotools.coco import COCO
 
 from opendr.perception.object_detection_2d.nanodet.algorithm.nanodet.data.dataset.coco import CocoDataset
+from opendr.perception.object_detection_2d.nanodet.algorithm.nanodet.util.path import scan_files
 
 
 def get_file_list(path, type=".xml"):
-    file_names = []
-    for maindir, subdir, file_name_list in os.walk(path):
-        for filename in file_name_list:
-            apath = os.path.join(maindir, filename)
-            ext = os.path.splitext(apath)[1]
-            if ext == type:
-                file_names.append(filename)
-    return file_names
+    return [entry.name for entry in scan_files(path) if os.path.splitext(entry.name)[1] == type]
 
 
 class CocoXML(COCO):
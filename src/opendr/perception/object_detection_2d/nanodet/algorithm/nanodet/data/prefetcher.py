@@ -0,0 +1,72 @@
+# Copyright 2020-2024 OpenDR European Project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import torch
+
+
+class _CUDAPrefetchIterator:
+    """Uploads the images of the next batch on a side stream while the current one is processed."""
+
+    def __init__(self, loader_iter, device):
+        self.loader_iter = loader_iter
+        self.device = device
+        self.stream = torch.cuda.Stream(device=device)
+        self.next_batch = None
+        self._preload()
+
+    def _preload(self):
+        try:
+            self.next_batch = next(self.loader_iter)
+        except StopIteration:
+            self.next_batch = None
+            return
+        with torch.cuda.stream(self.stream):
+            imgs = self.next_batch["img"]
+            if isinstance(imgs, list):
+                self.next_batch["img"] = [img.to(self.device, non_blocking=True) for img in imgs]
+            else:
+                self.next_batch["img"] = imgs.to(self.device, non_blocking=True)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.next_batch is None:
+            raise StopIteration
+        current_stream = torch.cuda.current_stream(self.device)
+        current_stream.wait_stream(self.stream)
+        batch = self.next_batch
+        imgs = batch["img"] if isinstance(batch["img"], list) else [batch["img"]]
+        for img in imgs:
+            # Tell the caching allocator the tensors are now used on the compute stream
+            img.record_stream(current_stream)
+        self._preload()
+        return batch
+
+
+class CUDAPrefetchLoader(torch.utils.data.DataLoader):
+    """
+    DataLoader that overlaps the host to device copy of the next batch with the computation of the current one.
+    Falls back to plain DataLoader iteration when the target device is not a CUDA device.
+    """
+
+    def __init__(self, *args, device="cuda", **kwargs):
+        super().__init__(*args, **kwargs)
+        self.device = torch.device(device)
+
+    def __iter__(self):
+        loader_iter = super().__iter__()
+        if self.device.type != "cuda" or not torch.cuda.is_available():
+            return loader_iter
+        return _CUDAPrefetchIterator(loader_iter, self.device)
@@ -320,11 +320,11 @@ class ShapeTransform:
         self.hard_pos = hard_pos
         self.hard_pos_ratio = hard_pos_ratio
 
-    def __call__(self, meta_data, dst_shape):
-        raw_img = meta_data["img"]
-        height = raw_img.shape[0]  # shape(h,w,c)
-        width = raw_img.shape[1]
-
+    def get_warp_matrix(self, width, height, dst_shape):
+        """
+        Samples the transformation matrix for an image of the given size.
+        :return: the warp matrix, the resize matrix alone and the output shape (w, h)
+        """
         # center
         C = np.eye(3)
         C[0, 2] = -width / 2
@@ -358,6 +358,14 @@ class ShapeTransform:
 
         ResizeM = get_resize_matrix((width, height), dst_shape, self.keep_ratio)
         M = ResizeM @ M
+        return M, ResizeM, dst_shape
+
+    def __call__(self, meta_data, dst_shape):
+        raw_img = meta_data["img"]
+        height = raw_img.shape[0]  # shape(h,w,c)
+        width = raw_img.shape[1]
+
+        M, ResizeM, dst_shape = self.get_warp_matrix(width, height, dst_shape)
         img = cv2.warpPerspective(raw_img, M, dsize=tuple(dst_shape))
         if "gt_bboxes" in meta_data:
             boxes = get_jitter_boxes(meta_data["gt_bboxes"], self.jitter_box_ratio)
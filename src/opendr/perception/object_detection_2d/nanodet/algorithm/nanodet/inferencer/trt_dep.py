@@ -85,7 +85,9 @@ class trt_model():
         s = self.bindings['data'].shape
         assert input.shape == s, f"input size {input.shape} not equal to max model size {s}"
         self.binding_addrs['data'] = int(input.data_ptr())
-        self.context.execute_v2(list(self.binding_addrs.values()))
+        # Enqueue on PyTorch's current stream, so the engine is ordered after the preprocessing kernels and the
+        # host is not blocked until the outputs are actually read
+        self.context.execute_async_v2(list(self.binding_addrs.values()), torch.cuda.current_stream(self.device).cuda_stream)
         y = [self.bindings[x].data for x in sorted(self.output_names)]
         if isinstance(y, (list, tuple)):
             return self.from_numpy(y[0]) if len(y) == 1 else [self.from_numpy(x) for x in y]
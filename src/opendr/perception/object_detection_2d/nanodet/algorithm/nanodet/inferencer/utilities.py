@@ -14,12 +14,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy as np
 import torch
 import torch.nn as nn
+import torch.nn.functional as F
 
 from opendr.perception.object_detection_2d.nanodet.algorithm.nanodet.data.batch_process import divisible_padding
 from opendr.perception.object_detection_2d.nanodet.algorithm.nanodet.data.transform import Pipeline
 from opendr.perception.object_detection_2d.nanodet.algorithm.nanodet.model.arch import build_model
+from opendr.perception.object_detection_2d.nanodet.algorithm.nanodet.model.module.conv import fuse_conv_bn
 
 
 class ScriptedPredictor(nn.Module):
@@ -41,7 +44,8 @@ class ScriptedPredictor(nn.Module):
 
 class Predictor(nn.Module):
     def __init__(self, cfg, model, device="cuda", conf_thresh=0.35, iou_thresh=0.6, nms_max_num=100,
-                 hf=False, dynamic=False, ch_l=False):
+                 hf=False, dynamic=False, ch_l=False, cuda_graph=False, compile_model=False, fuse=False,
+                 cudnn_benchmark=False):
         super(Predictor, self).__init__()
         self.cfg = cfg
         self.device = device
@@ -50,6 +54,13 @@ class Predictor(nn.Module):
         self.nms_max_num = nms_max_num
         self.hf = hf
         self.ch_l = ch_l
+        # torch.compile is only available from PyTorch 2.0 onwards
+        self.compile_model = compile_model and hasattr(torch, "compile") and torch.device(device).type == "cuda"
+        # The reduce-overhead mode of torch.compile already captures CUDA graphs
+        self.cuda_graph = cuda_graph and torch.device(device).type == "cuda" and not self.compile_model
+        self.graph = None
+        self.graph_input = None
+        self.graph_output = None
         self.dynamic = dynamic and self.cfg.data.val.keep_ratio
         if self.cfg.model.arch.backbone.name == "RepVGG":
             deploy_config = self.cfg.model
@@ -58,6 +69,10 @@ class Predictor(nn.Module):
             from opendr.perception.object_detection_2d.nanodet.algorithm.nanodet.model.backbone.repvgg\
                 import repvgg_det_model_convert
             model = repvgg_det_model_convert(model, deploy_model)
+        if fuse:
+            # Fold BatchNorm into the preceding convolutions on a copy, so that the learner's model stays trainable
+            import copy
+            model = fuse_conv_bn(copy.deepcopy(model).eval())
 
         for para in model.parameters():
             para.requires_grad = False
@@ -70,8 +85,31 @@ class Predictor(nn.Module):
         model.set_inference_mode(True)
 
         self.model = model.to(device).eval()
+        if cudnn_benchmark and torch.device(device).type == "cuda" and not self.dynamic:
+            # Input size is fixed, let cudnn pick the fastest convolution algorithms once. This is a process-wide
+            # setting, so it is only changed when requested.
+            torch.backends.cudnn.benchmark = True
+
+        self.compiled_inference = None
+        if self.compile_model:
+            self.compiled_inference = torch.compile(self.model.inference, mode="reduce-overhead", fullgraph=False)
+        if torch.device(device).type == "cuda":
+            # The Predictor is created once per learner, so CUDA context setup, cudnn algorithm selection and
+            # compilation are paid here instead of by the first frame
+            self._warmup()
 
         self.pipeline = Pipeline(self.cfg.data.val.pipeline, self.cfg.data.val.keep_ratio)
+        # Without color augmentations the validation pipeline reduces to a warp and a mean/std normalization, which is
+        # applied on the device to the uint8 image instead of going through float copies on the CPU
+        val_pipeline = self.cfg.data.val.pipeline
+        self.fast_norm = not any(aug in val_pipeline for aug in ("brightness", "contrast", "saturation"))
+        if self.fast_norm:
+            mean, std = val_pipeline["normalize"]
+            self.norm_mean = torch.tensor(mean, dtype=torch.float32, device=device).view(3, 1, 1)
+            self.norm_std = torch.tensor(std, dtype=torch.float32, device=device).view(3, 1, 1)
+        # On CUDA the raw uint8 frame is uploaded and warped on the device, so that the CPU only decodes frames
+        self.gpu_warp = self.fast_norm and torch.device(device).type == "cuda"
+        self._warp_grids = {}
 
     def trace_model(self, dummy_input):
         return torch.jit.trace(self, dummy_input[0])
@@ -85,17 +123,61 @@ class Predictor(nn.Module):
                                                 self.iou_thresh, self.nms_max_num, dynamic=self.dynamic)
         return torch.jit.script(jit_ready_predictor)
 
+    def _warmup(self):
+        """
+        Runs a dummy forward pass on an input of the validation size.
+        """
+        width, height = self.cfg.data.val.input_size
+        dummy_input = torch.zeros((1, 3, height, width), device=self.device,
+                                  dtype=torch.half if self.hf else torch.float32)
+        if self.ch_l:
+            dummy_input = dummy_input.to(memory_format=torch.channels_last)
+        with torch.inference_mode():
+            self.forward(dummy_input)
+
     def forward(self, img):
+        if self.compiled_inference is not None:
+            return self.compiled_inference(img)
         return self.model.inference(img)
 
+    def graph_forward(self, img):
+        """
+        Runs the model through a captured CUDA graph, so that the kernels of a forward pass are launched at once.
+        The graph is captured on the first call and captured again whenever the input shape or dtype changes.
+        """
+        if not self.cuda_graph:
+            return self.forward(img)
+        if self.graph is None or self.graph_input.shape != img.shape or self.graph_input.dtype != img.dtype:
+            self.graph_input = img.clone()
+            # Warm up on a side stream before capturing, as required by torch.cuda.graph
+            stream = torch.cuda.Stream()
+            stream.wait_stream(torch.cuda.current_stream())
+            with torch.cuda.stream(stream):
+                for _ in range(3):
+                    self.forward(self.graph_input)
+            torch.cuda.current_stream().wait_stream(stream)
+            self.graph = torch.cuda.CUDAGraph()
+            with torch.cuda.graph(self.graph):
+                self.graph_output = self.forward(self.graph_input)
+        self.graph_input.copy_(img)
+        self.graph.replay()
+        return self.graph_output
+
     def preprocessing(self, img):
         img_info = {"id": 0}
         height, width = img.shape[:2]
         img_info["height"] = height
         img_info["width"] = width
         meta = dict(img_info=img_info, raw_img=img, img=img)
-        meta = self.pipeline(None, meta, self.cfg.data.val.input_size)
-        meta["img"] = torch.from_numpy(meta["img"].transpose(2, 0, 1)).to(self.device)
+        if self.gpu_warp:
+            meta["warp_matrix"], meta["img"] = self.warp_on_device(img)
+        elif self.fast_norm:
+            meta = self.pipeline.shape_transform(meta, dst_shape=self.cfg.data.val.input_size)
+            meta["img"] = torch.from_numpy(meta["img"]).to(self.device).permute(2, 0, 1).float()
+            meta["img"] = (meta["img"] - self.norm_mean) / self.norm_std
+        else:
+            meta = self.pipeline(None, meta, self.cfg.data.val.input_size)
+            meta["img"] = torch.from_numpy(meta["img"].transpose(2, 0, 1)).to(self.device)
 
         meta["img"] = divisible_padding(
             meta["img"],
@@ -110,6 +192,38 @@ class Predictor(nn.Module):
 
         return _input, _height, _width, _warp_matrix
 
+    def warp_on_device(self, img):
+        """
+        Equivalent of the cv2.warpPerspective of the shape transform followed by the normalization, computed with
+        grid_sample on the device. The sampling grid is cached per input size and warp matrix.
+        :param img: image in HWC uint8 format
+        :type img: np.ndarray
+        :return: the warp matrix and the normalized CHW image tensor
+        """
+        height, width = img.shape[:2]
+        warp_matrix, _, dst_shape = self.pipeline.shape_transform.get_warp_matrix(
+            width, height, self.cfg.data.val.input_size)
+        key = (height, width, warp_matrix.tobytes())
+        grid = self._warp_grids.get(key)
+        if grid is None:
+            dst_w, dst_h = int(dst_shape[0]), int(dst_shape[1])
+            inv_matrix = torch.from_numpy(np.linalg.inv(warp_matrix)).to(self.device, torch.float32)
+            ys, xs = torch.meshgrid(torch.arange(dst_h, device=self.device, dtype=torch.float32),
+                                    torch.arange(dst_w, device=self.device, dtype=torch.float32), indexing="ij")
+            dst_points = torch.stack((xs, ys, torch.ones_like(xs)), dim=-1)
+            src_points = dst_points @ inv_matrix.T
+            src_points = src_points[..., :2] / src_points[..., 2:]
+            # Pixel centers to the [-1, 1] range of grid_sample with align_corners=False
+            scale = torch.tensor([2.0 / width, 2.0 / height], device=self.device)
+            grid = ((src_points + 0.5) * scale - 1).unsqueeze(0)
+            if len(self._warp_grids) >= 16:
+                self._warp_grids.clear()
+            self._warp_grids[key] = grid
+
+        _img = torch.from_numpy(img).to(self.device).permute(2, 0, 1).unsqueeze(0).float()
+        _img = F.grid_sample(_img, grid, mode="bilinear", padding_mode="zeros", align_corners=False)[0]
+        return warp_matrix, (_img - self.norm_mean) / self.norm_std
+
     def postprocessing(self, preds, input, height, width, warp_matrix):
         meta = dict(height=height, width=width, warp_matrix=warp_matrix, img=input)
         res = self.model.head.post_process(preds, meta, conf_thresh=self.conf_thresh, iou_thresh=self.iou_thresh,
@@ -7,6 +7,7 @@ import warnings
 import numpy as np
 import torch
 import torch.nn as nn
+from torch.nn.utils.fusion import fuse_conv_bn_eval
 
 from opendr.perception.object_detection_2d.nanodet.algorithm.nanodet.model.module.activation import act_layers
 from opendr.perception.object_detection_2d.nanodet.algorithm.nanodet.model.module.init_weights\
@@ -404,3 +405,32 @@ class RepVGGConvModule(nn.Module):
             kernel.detach().cpu().numpy(),
             bias.detach().cpu().numpy(),
         )
+
+
+def fuse_conv_bn(model):
+    """
+    Folds every BatchNorm2d that directly follows a Conv2d into the convolution, for ConvModule,
+    DepthwiseConvModule and nn.Sequential blocks. The model is modified in place and must be in eval mode.
+    """
+    for module in model.modules():
+        if isinstance(module, ConvModule):
+            if module.with_norm and isinstance(module.norm, nn.BatchNorm2d) and \
+                    module.order.index("norm") > module.order.index("conv"):
+                module.conv = fuse_conv_bn_eval(module.conv, module.norm)
+                setattr(module, module.norm_name, nn.Identity())
+                module.norm = getattr(module, module.norm_name)
+        elif isinstance(module, DepthwiseConvModule):
+            if module.with_norm and isinstance(module.dwnorm, nn.BatchNorm2d) and \
+                    module.order.index("dwnorm") > module.order.index("depthwise"):
+                module.depthwise = fuse_conv_bn_eval(module.depthwise, module.dwnorm)
+                module.dwnorm = nn.Identity()
+            if module.with_norm and isinstance(module.pwnorm, nn.BatchNorm2d) and \
+                    module.order.index("pwnorm") > module.order.index("pointwise"):
+                module.pointwise = fuse_conv_bn_eval(module.pointwise, module.pwnorm)
+                module.pwnorm = nn.Identity()
+        elif isinstance(module, nn.Sequential):
+            for idx in range(len(module) - 1):
+                if isinstance(module[idx], nn.Conv2d) and isinstance(module[idx + 1], nn.BatchNorm2d):
+                    module[idx] = fuse_conv_bn_eval(module[idx], module[idx + 1])
+                    module[idx + 1] = nn.Identity()
+    return model
@@ -61,6 +61,8 @@ class TrainingTask(LightningModule):
             batch_imgs = [img.to(self.device) for img in batch_imgs]
             batch_img_tensor = stack_batch_img(batch_imgs, divisible=32)
             batch["img"] = batch_img_tensor
+        if self.cfg.model.arch.ch_l:
+            batch["img"] = batch["img"].contiguous(memory_format=torch.channels_last)
         return batch
 
     def forward(self, x):
@@ -291,7 +293,9 @@ class TrainingTask(LightningModule):
         """
         # warm up lr
         if self.trainer.current_epoch < self.cfg.schedule.warmup.steps:
-            warmup_batches = (self.cfg.schedule.warmup.steps * self.trainer.num_training_batches)
+            # global_step counts optimizer steps, which are fewer than batches when gradients are accumulated
+            warmup_batches = max(self.cfg.schedule.warmup.steps * self.trainer.num_training_batches //
+                                 max(self.trainer.accumulate_grad_batches, 1), 1)
             if self.cfg.schedule.warmup.name == "constant":
                 k = self.cfg.schedule.warmup.ratio
             elif self.cfg.schedule.warmup.name == "linear":
@@ -2,6 +2,7 @@ from opendr.perception.object_detection_2d.nanodet.algorithm.nanodet.util.box_tr
     import bbox2distance, distance2bbox
 from opendr.perception.object_detection_2d.nanodet.algorithm.nanodet.util.check_point import (
     convert_avg_params,
+    load_checkpoint,
     load_model_weight,
     save_model,
 )
@@ -21,6 +22,7 @@ from opendr.perception.object_detection_2d.nanodet.algorithm.nanodet.util.common
 __all__ = [
     "distance2bbox",
     "bbox2distance",
+    "load_checkpoint",
     "load_model_weight",
     "save_model",
     "cfg",
@@ -14,10 +14,32 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from opendr.perception.object_detection_2d.nanodet.algorithm.nanodet.util.rank_filter import rank_filter
+import pickle
+import warnings
 from typing import Any, Dict
 import torch
 
 
+def load_checkpoint(path, map_location="cpu"):
+    """
+    Loads a checkpoint memory-mapped and without executing arbitrary pickle code where supported (PyTorch >= 2.1).
+    Older PyTorch versions, which lack these arguments, fall back to a plain torch.load and legacy file formats, which
+    cannot be memory-mapped, are loaded with weights_only only. Checkpoints holding non-tensor objects are loaded
+    without restrictions after a warning.
+    """
+    try:
+        try:
+            return torch.load(path, map_location=map_location, weights_only=True, mmap=True)
+        except TypeError:
+            return torch.load(path, map_location=map_location)
+        except RuntimeError:
+            return torch.load(path, map_location=map_location, weights_only=True)
+    except pickle.UnpicklingError:
+        warnings.warn("Checkpoint {} holds objects other than tensors and is loaded without weights_only restrictions, "
+                      "only load checkpoints from trusted sources.".format(path))
+        return torch.load(path, map_location=map_location, weights_only=False)
+
+
 def load_model_weight(model, checkpoint, verbose=None):
     state_dict = checkpoint["state_dict"].copy()
     for k in checkpoint["state_dict"]:
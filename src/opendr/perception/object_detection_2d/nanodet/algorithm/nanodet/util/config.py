@@ -20,6 +20,8 @@ cfg.device = CfgNode(new_allowed=True)
 cfg.device.precision = 32
 cfg.device.batchsize_per_gpu = -1
 cfg.device.effective_batchsize = 1
+cfg.device.prefetch_factor = 2
+cfg.device.persistent_workers = True
 # train
 cfg.schedule = CfgNode(new_allowed=True)
 
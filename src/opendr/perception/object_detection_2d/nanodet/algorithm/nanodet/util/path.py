@@ -23,12 +23,17 @@ def mkdir(path, exist_ok=False):
         os.makedirs(path, exist_ok=exist_ok)
 
 
+def scan_files(path):
+    """Recursively yield the os.DirEntry of every file under path, reusing the file type read with each directory
+    listing instead of issuing a stat call per entry."""
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from scan_files(entry.path)
+            elif entry.is_file():
+                yield entry
+
+
 def collect_files(path, exts):
-    file_paths = []
-    for maindir, subdir, filename_list in os.walk(path):
-        for filename in filename_list:
-            file_path = os.path.join(maindir, filename)
-            ext = os.path.splitext(file_path)[1]
-            if ext in exts:
-                file_paths.append(file_path)
-    return file_paths
+    exts = frozenset(exts)
+    return [entry.path for entry in scan_files(path) if os.path.splitext(entry.name)[1] in exts]
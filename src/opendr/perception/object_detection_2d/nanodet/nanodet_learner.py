@@ -37,8 +37,10 @@ except ImportError:
 
 from opendr.perception.object_detection_2d.nanodet.algorithm.nanodet.util.check_point import save_model_state
 from opendr.perception.object_detection_2d.nanodet.algorithm.nanodet.model.arch import build_model
+from opendr.perception.object_detection_2d.nanodet.algorithm.nanodet.data.batch_process import stack_batch_img
 from opendr.perception.object_detection_2d.nanodet.algorithm.nanodet.data.collate import naive_collate
 from opendr.perception.object_detection_2d.nanodet.algorithm.nanodet.data.dataset import build_dataset
+from opendr.perception.object_detection_2d.nanodet.algorithm.nanodet.data.prefetcher import CUDAPrefetchLoader
 from opendr.perception.object_detection_2d.nanodet.algorithm.nanodet.trainer.task import TrainingTask
 from opendr.perception.object_detection_2d.nanodet.algorithm.nanodet.evaluator import build_evaluator
 from opendr.perception.object_detection_2d.nanodet.algorithm.nanodet.inferencer.utilities import Predictor
@@ -46,6 +48,7 @@ from opendr.perception.object_detection_2d.nanodet.algorithm.nanodet.util import
     NanoDetLightningLogger,
     cfg,
     load_config,
+    load_checkpoint,
     load_model_weight,
     mkdir,
     autobatch,
@@ -68,16 +71,35 @@ _MODEL_NAMES = {"EfficientNet_Lite0_320", "EfficientNet_Lite1_416", "EfficientNe
 class NanodetLearner(Learner):
     def __init__(self, model_to_use="m", iters=None, lr=None, batch_size=None, checkpoint_after_iter=None,
                  checkpoint_load_iter=None, temp_path='', device='cuda', weight_decay=None, warmup_steps=None,
-                 warmup_ratio=None, lr_schedule_T_max=None, lr_schedule_eta_min=None, grad_clip=None):
+                 warmup_ratio=None, lr_schedule_T_max=None, lr_schedule_eta_min=None, grad_clip=None, precision=None,
+                 ch_l=None, compile_model=None, prefetch_factor=None, persistent_workers=None, effective_batchsize=None,
+                 cudnn_benchmark=False):
 
         """Initialise the Nanodet Learner"""
 
         self.cfg = self._load_hparam(model_to_use)
+        # Mixed precision (16) by default on CUDA, so that training and evaluation run on Tensor Cores
+        if precision is None and device != "cpu" and torch.cuda.is_available():
+            precision = 16
+        self.precision = precision
+        # Channels last convolutions avoid the NCHW <-> NHWC transposes of cuDNN's Tensor Core kernels
+        if ch_l is None:
+            ch_l = device != "cpu" and torch.cuda.is_available()
+        self.ch_l = ch_l
+        # Compile the PyTorch inference model by default on CUDA when torch.compile is available (PyTorch >= 2.0)
+        if compile_model is None:
+            compile_model = device != "cpu" and hasattr(torch, "compile")
+        self.compile_model = compile_model
+        # Enables the process-wide cudnn autotuner when a fixed input size predictor is created for inference
+        self.cudnn_benchmark = cudnn_benchmark
         self.lr_schedule_T_max = lr_schedule_T_max
         self.lr_schedule_eta_min = lr_schedule_eta_min
         self.warmup_steps = warmup_steps
         self.warmup_ratio = warmup_ratio
         self.grad_clip = grad_clip
+        self.prefetch_factor = prefetch_factor
+        self.persistent_workers = persistent_workers
+        self.effective_batchsize = effective_batchsize
 
         self.overwrite_config(lr=lr, weight_decay=weight_decay, iters=iters, batch_size=batch_size,
                               checkpoint_after_iter=checkpoint_after_iter, checkpoint_load_iter=checkpoint_load_iter,
@@ -173,6 +195,15 @@ class NanodetLearner(Learner):
             self.cfg.schedule.lr_schedule.eta_min = self.lr_schedule_eta_min
         if self.grad_clip is not None:
             self.cfg.grad_clip = self.grad_clip
+        if self.precision is not None:
+            self.cfg.device.precision = self.precision
+        self.cfg.model.arch.ch_l = self.ch_l
+        if self.prefetch_factor is not None:
+            self.cfg.device.prefetch_factor = self.prefetch_factor
+        if self.persistent_workers is not None:
+            self.cfg.device.persistent_workers = self.persistent_workers
+        if self.effective_batchsize is not None:
+            self.cfg.device.effective_batchsize = self.effective_batchsize
 
         # OpenDR
         if lr is not None:
@@ -251,7 +282,7 @@ class NanodetLearner(Learner):
                 self._load_jit(os.path.join(path, metadata["model_paths"][0]), verbose=verbose)
                 self._info("Loaded JIT model.", True)
         else:
-            ckpt = torch.load(os.path.join(path, metadata["model_paths"][0]), map_location=torch.device(self.device))
+            ckpt = load_checkpoint(os.path.join(path, metadata["model_paths"][0]), map_location=torch.device(self.device))
             self.model = load_model_weight(self.model, ckpt, verbose)
         self._info("Loaded model weights from {}".format(path), verbose)
         pass
@@ -399,31 +430,41 @@ class NanodetLearner(Learner):
         )
         return dummy_input
 
-    def _save_onnx(self, onnx_path, predictor, do_constant_folding=False, verbose=True):
+    def _save_onnx(self, onnx_path, predictor, do_constant_folding=True, dynamic_batch=False, int8=False,
+                   fp16=False, verbose=True):
 
         os.makedirs(onnx_path, exist_ok=True)
         export_path = os.path.join(onnx_path, "nanodet_{}.onnx".format(self.cfg.check_point_name))
+        int8_name = "nanodet_{}_int8.onnx".format(self.cfg.check_point_name)
+        fp16_name = "nanodet_{}_fp16.onnx".format(self.cfg.check_point_name)
 
         dummy_input = self.__dummy_input(hf=predictor.hf)
-        dynamic = None
+        dynamic = {}
         if predictor.dynamic:
             assert not predictor.hf, '--hf not compatible with --dynamic, i.e. use either --hf or --dynamic but not both'
             dynamic = {"data": {2: 'width', 3: 'height'}, "output": {1: "feature_points"}}
+        if dynamic_batch:
+            dynamic.setdefault("data", {})[0] = "batch"
+            dynamic.setdefault("output", {})[0] = "batch"
 
         if verbose is False:
             ort.set_default_logger_severity(3)
-        torch.onnx.export(
-            predictor,
-            dummy_input[0],
-            export_path,
-            verbose=verbose,
-            keep_initializers_as_inputs=True,
-            do_constant_folding=do_constant_folding,
-            opset_version=11,
-            input_names=['data'],
-            output_names=['output'],
-            dynamic_axes=dynamic or None
-        )
+        # Trace in eval mode, so that BatchNorm statistics are exported as constants and can be folded
+        predictor.eval()
+        with torch.no_grad():
+            torch.onnx.export(
+                predictor,
+                dummy_input[0],
+                export_path,
+                verbose=False,
+                training=torch.onnx.TrainingMode.EVAL,
+                keep_initializers_as_inputs=False,
+                do_constant_folding=do_constant_folding,
+                opset_version=17,
+                input_names=['data'],
+                output_names=['output'],
+                dynamic_axes=dynamic or None
+            )
 
         metadata = {"model_paths": ["nanodet_{}.onnx".format(self.cfg.check_point_name)], "framework": "pytorch",
                     "format": "onnx", "has_data": False, "optimized": True, "optimizer_info": {},
@@ -440,17 +481,47 @@ class NanodetLearner(Learner):
             import onnxsim
         except:
             self._info("For compression in optimized models, install onnxsim and rerun optimize.", True)
-            return
-
-        import onnx
-        self._info("Simplifying ONNX model...", verbose)
-        input_data = {"data": dummy_input[0].detach().cpu().numpy()}
-        model_sim, flag = onnxsim.simplify(export_path, input_data=input_data)
-        if flag:
-            onnx.save(model_sim, export_path)
-            self._info("ONNX simplified successfully.", verbose)
-        else:
-            self._info("ONNX simplified failed.", verbose)
+            onnxsim = None
+
+        if onnxsim is not None:
+            import onnx
+            self._info("Simplifying ONNX model...", verbose)
+            input_data = {"data": dummy_input[0].detach().cpu().numpy()}
+            model_sim, flag = onnxsim.simplify(export_path, input_data=input_data)
+            if flag:
+                onnx.save(model_sim, export_path)
+                self._info("ONNX simplified successfully.", verbose)
+            else:
+                self._info("ONNX simplified failed.", verbose)
+
+        if int8 and not predictor.hf:
+            try:
+                from onnxruntime.quantization import quantize_dynamic, QuantType
+            except ImportError:
+                self._info("For an INT8 ONNX model, install onnxruntime with quantization support and rerun optimize.",
+                           True)
+            else:
+                self._info("Quantizing ONNX model weights to INT8...", verbose)
+                quantize_dynamic(export_path, os.path.join(onnx_path, int8_name), weight_type=QuantType.QInt8)
+                metadata["optimizer_info"]["int8"] = int8_name
+
+        if fp16 and not predictor.hf:
+            try:
+                import onnx
+                from onnxconverter_common import float16
+            except ImportError:
+                self._info("For an FP16 ONNX model, install onnxconverter-common and rerun optimize.", True)
+            else:
+                self._info("Converting ONNX model to FP16...", verbose)
+                # Inputs and outputs stay in FP32, so the FP16 model is a drop-in replacement for the FP32 one
+                model_fp16 = float16.convert_float_to_float16(onnx.load(export_path), keep_io_types=True)
+                onnx.save(model_fp16, os.path.join(onnx_path, fp16_name))
+                metadata["optimizer_info"]["fp16"] = fp16_name
+
+        if metadata["optimizer_info"]:
+            with open(os.path.join(onnx_path, "nanodet_{}.json".format(self.cfg.check_point_name)),
+                      'w', encoding='utf-8') as f:
+                json.dump(metadata, f, ensure_ascii=False, indent=4)
 
     def _load_onnx(self, onnx_path, verbose=True):
         onnx_path = onnx_path[0]
@@ -577,7 +648,7 @@ class NanodetLearner(Learner):
         self.jit_model = torch.jit.load(jit_path, map_location=self.device)
 
     def optimize(self, export_path, verbose=True, optimization="jit", conf_threshold=0.35, iou_threshold=0.6,
-                 nms_max_num=100, hf=False, dynamic=False, ch_l=False, lazy_load=True):
+                 nms_max_num=100, hf=False, dynamic=False, ch_l=False, lazy_load=True, int8=False, fp16=False):
         """
         Method for optimizing the model with ONNX, JIT or TensorRT.
         :param export_path: The file path to the folder where the optimized model will be saved. If a model already
@@ -601,13 +672,20 @@ class NanodetLearner(Learner):
         :type ch_l: bool, optional
         :param lazy_load: enables loading optimized model from predetermined path without exporting it each time.
         :type lazy_load: bool, optional
+        :param int8: if set to True, an ONNX model with dynamically quantized INT8 weights is also exported and loaded
+         instead of the FP32 one. Only used with onnx optimization.
+        :type int8: bool, optional
+        :param fp16: if set to True, an ONNX model converted to FP16 with FP32 inputs and outputs is also exported and
+         loaded instead of the FP32 one. Only used with onnx optimization.
+        :type fp16: bool, optional
         """
 
         optimization = optimization.lower()
         ch_l = ch_l and (optimization == "jit")
         if not os.path.exists(export_path) or not lazy_load:
             predictor = Predictor(self.cfg, self.model, device=self.device, conf_thresh=conf_threshold,
-                                  iou_thresh=iou_threshold, nms_max_num=nms_max_num, hf=hf, dynamic=dynamic, ch_l=ch_l)
+                                  iou_thresh=iou_threshold, nms_max_num=nms_max_num, hf=hf, dynamic=dynamic, ch_l=ch_l,
+                                  fuse=True)
             # Initialization run for legacy_post_process = False
             _ = predictor(self.__dummy_input(hf=hf, ch_l=ch_l)[0])
             if optimization == "trt":
@@ -615,7 +693,8 @@ class NanodetLearner(Learner):
             elif optimization == "jit":
                 self._save_jit(export_path, verbose=verbose, predictor=predictor)
             elif optimization == "onnx":
-                self._save_onnx(export_path, verbose=verbose, predictor=predictor)
+                self._save_onnx(export_path, verbose=verbose, predictor=predictor, dynamic_batch=True,
+                                int8=int8, fp16=fp16)
             else:
                 assert NotImplementedError
         with open(os.path.join(export_path, f"nanodet_{self.cfg.check_point_name}.json")) as f:
@@ -625,7 +704,17 @@ class NanodetLearner(Learner):
         elif optimization == "jit":
             self._load_jit([os.path.join(export_path, path) for path in metadata["model_paths"]], verbose)
         elif optimization == "onnx":
-            self._load_onnx([os.path.join(export_path, path) for path in metadata["model_paths"]], verbose)
+            if int8:
+                assert "int8" in metadata["optimizer_info"], \
+                    "No INT8 model was exported, rerun optimize with int8=True, lazy_load=False and without hf"
+                self._load_onnx([os.path.join(export_path, metadata["optimizer_info"]["int8"])], verbose)
+            elif fp16:
+                assert "fp16" in metadata["optimizer_info"], \
+                    "No FP16 model was exported, install onnxconverter-common and rerun optimize with fp16=True and " \
+                    "lazy_load=False"
+                self._load_onnx([os.path.join(export_path, metadata["optimizer_info"]["fp16"])], verbose)
+            else:
+                self._load_onnx([os.path.join(export_path, path) for path in metadata["model_paths"]], verbose)
         else:
             assert NotImplementedError
 
@@ -688,24 +777,34 @@ class NanodetLearner(Learner):
                        f"Batch size will be: {self.batch_size}\n"
                        f"With accumulation: {accumulate}.", verbose)
 
-        train_dataloader = torch.utils.data.DataLoader(
+        if self.cfg.device.gpu_ids == -1 or self.device == "cpu":
+            # Native AMP is only available on CUDA devices
+            gpu_ids, precision = (None, 32)
+        else:
+            gpu_ids, precision = (self.cfg.device.gpu_ids, self.cfg.device.precision)
+            assert len(gpu_ids) == 1, ("Distributed learning is not implemented, please use only"
+                                       " one gpu device.")
+
+        prefetch_device = "cpu" if gpu_ids is None else "cuda:{}".format(gpu_ids[0])
+        loader_kwargs = self._loader_kwargs()
+        train_dataloader = CUDAPrefetchLoader(
             train_dataset,
             batch_size=self.batch_size,
             shuffle=True,
-            num_workers=self.cfg.device.workers_per_gpu,
             pin_memory=True,
-            persistent_workers=True,
             collate_fn=naive_collate,
+            device=prefetch_device,
+            **loader_kwargs,
             drop_last=True,
         )
-        val_dataloader = torch.utils.data.DataLoader(
+        val_dataloader = CUDAPrefetchLoader(
             val_dataset,
             batch_size=self.batch_size,
             shuffle=False,
-            num_workers=self.cfg.device.workers_per_gpu,
             pin_memory=True,
-            persistent_workers=True,
             collate_fn=naive_collate,
+            device=prefetch_device,
+            **loader_kwargs,
             drop_last=False,
         )
 
@@ -717,15 +816,10 @@ class NanodetLearner(Learner):
 
         self._info("Creating task...", verbose)
 
+        if self.cfg.model.arch.ch_l:
+            self.model = self.model.to(memory_format=torch.channels_last)
         self.task = TrainingTask(self.cfg, self.model, evaluator)
 
-        if self.cfg.device.gpu_ids == -1 or self.device == "cpu":
-            gpu_ids, precision = (None, self.cfg.device.precision)
-        else:
-            gpu_ids, precision = (self.cfg.device.gpu_ids, self.cfg.device.precision)
-            assert len(gpu_ids) == 1, ("Distributed learning is not implemented, please use only"
-                                       " one gpu device.")
-
         trainer = pl.Trainer(
             default_root_dir=self.temp_path,
             max_epochs=self.iters,
@@ -781,28 +875,34 @@ class NanodetLearner(Learner):
 
             self.batch_size = ((self.batch_size + 32 - 1) // 32) * 32
 
-        val_dataloader = torch.utils.data.DataLoader(
+        if self.cfg.device.gpu_ids == -1 or self.device == "cpu":
+            # Native AMP is only available on CUDA devices
+            gpu_ids, precision = (None, 32)
+        else:
+            gpu_ids, precision = (self.cfg.device.gpu_ids, self.cfg.device.precision)
+            assert len(gpu_ids) == 1, ("Distributed learning is not implemented, please use only"
+                                       " one gpu device.")
+
+        prefetch_device = "cpu" if gpu_ids is None else "cuda:{}".format(gpu_ids[0])
+        loader_kwargs = self._loader_kwargs()
+        val_dataloader = CUDAPrefetchLoader(
             val_dataset,
             batch_size=self.batch_size,
             shuffle=False,
-            num_workers=self.cfg.device.workers_per_gpu,
             pin_memory=True,
             collate_fn=naive_collate,
+            device=prefetch_device,
+            **loader_kwargs,
             drop_last=False,
         )
         evaluator = build_evaluator(self.cfg.evaluator, val_dataset, logger=self.logger)
 
         self._info("Creating task...", verbose)
 
+        if self.cfg.model.arch.ch_l:
+            self.model = self.model.to(memory_format=torch.channels_last)
         self.task = TrainingTask(self.cfg, self.model, evaluator)
 
-        if self.cfg.device.gpu_ids == -1 or self.device == "cpu":
-            gpu_ids, precision = (None, self.cfg.device.precision)
-        else:
-            gpu_ids, precision = (self.cfg.device.gpu_ids, self.cfg.device.precision)
-            assert len(gpu_ids) == 1, ("Distributed learning is not implemented, please use only"
-                                       " one gpu device.")
-
         trainer = pl.Trainer(
             default_root_dir=save_dir,
             gpus=gpu_ids,
@@ -817,11 +917,13 @@ class NanodetLearner(Learner):
         test_results = (verbose or logging)
         return trainer.test(self.task, val_dataloader, verbose=test_results)
 
-    def infer(self, input, conf_threshold=0.35, iou_threshold=0.6, nms_max_num=100, hf=False, dynamic=True, ch_l=False):
+    def infer(self, input, conf_threshold=0.35, iou_threshold=0.6, nms_max_num=100, hf=False, dynamic=True, ch_l=False,
+              cuda_graph=False):
         """
         Performs inference
-        :param input: input image to perform inference on
-        :type input: opendr.data.Image
+        :param input: input image to perform inference on, or a list of images which are run through the PyTorch
+         model as a single batch
+        :type input: opendr.data.Image or list[opendr.data.Image]
         :param conf_threshold: confidence threshold
         :type conf_threshold: float, optional
         :param iou_threshold: iou threshold
@@ -835,60 +937,110 @@ class NanodetLearner(Learner):
         :type dynamic: bool, optional
         :param ch_l: determines if inference will run in channel-last format.
         :type ch_l: bool, optional
-        :return: list of bounding boxes of last image of input or last frame of the video
-        :rtype: opendr.engine.target.BoundingBoxList
+        :param cuda_graph: determines if the PyTorch model is replayed from a captured CUDA graph, only used on CUDA
+         devices. It works best with dynamic=False, since the graph is captured again for every new input size.
+        :type cuda_graph: bool, optional
+        :return: list of bounding boxes of last image of input or last frame of the video, or one list per image if
+         a list of images was given
+        :rtype: opendr.engine.target.BoundingBoxList or list[opendr.engine.target.BoundingBoxList]
         """
 
         ch_l = ch_l and self.jit_model is not None
         if not self.predictor:
             self.predictor = Predictor(self.cfg, self.model, device=self.device, conf_thresh=conf_threshold,
                                        iou_thresh=iou_threshold, nms_max_num=nms_max_num, hf=hf, dynamic=dynamic,
-                                       ch_l=ch_l)
+                                       ch_l=ch_l, cuda_graph=cuda_graph, compile_model=self.compile_model,
+                                       cudnn_benchmark=self.cudnn_benchmark)
+
+        if isinstance(input, list):
+            if self.trt_model or self.jit_model or self.ort_session:
+                # Optimized models are exported with a batch size of one
+                return [self.infer(img, conf_threshold, iou_threshold, nms_max_num, hf, dynamic, ch_l, cuda_graph)
+                        for img in input]
+            self.predictor.model = self.predictor.model.half() if hf else self.predictor.model.float()
+            return self._infer_batch(input)
 
         if not isinstance(input, Image):
             input = Image(input)
         _input = input.opencv()
 
-        _input, *metadata = self.predictor.preprocessing(_input)
-
-        if self.trt_model:
-            if self.jit_model or self.ort_session:
-                warnings.warn(
-                    "Warning: More than one optimization types are initialized, "
-                    "inference will run in TensorRT mode by default.\n"
-                    "To run in a specific optimization please delete the self.ort_session, self.jit_model or "
-                    "self.trt_model like: detector.ort_session = None.")
-            preds = self.trt_model(_input)
-        elif self.jit_model:
-            if self.ort_session:
-                warnings.warn(
-                    "Warning: Both JIT and ONNX models are initialized, inference will run in JIT mode by default.\n"
-                    "To run in JIT please delete the self.ort_session like: detector.ort_session = None.")
+        # Cast weights outside of inference mode, so that the model parameters remain usable for training
+        if not self.trt_model and self.jit_model:
             self.jit_model = self.jit_model.half() if hf else self.jit_model.float()
-
-            preds = self.jit_model(_input, *metadata)
-        elif self.ort_session:
-            preds = self.ort_session.run(['output'], {'data': _input.cpu().numpy()})
-            preds = torch.from_numpy(preds[0]).to(self.device, torch.half if hf else torch.float32)
-        else:
+        elif not self.trt_model and not self.ort_session:
             self.predictor.model = self.predictor.model.half() if hf else self.predictor.model.float()
-            preds = self.predictor(_input)
-        res = self.predictor.postprocessing(preds, _input, *metadata)
 
+        with torch.inference_mode():
+            _input, *metadata = self.predictor.preprocessing(_input)
+
+            if self.trt_model:
+                if self.jit_model or self.ort_session:
+                    warnings.warn(
+                        "Warning: More than one optimization types are initialized, "
+                        "inference will run in TensorRT mode by default.\n"
+                        "To run in a specific optimization please delete the self.ort_session, self.jit_model or "
+                        "self.trt_model like: detector.ort_session = None.")
+                preds = self.trt_model(_input)
+            elif self.jit_model:
+                if self.ort_session:
+                    warnings.warn(
+                        "Warning: Both JIT and ONNX models are initialized, inference will run in JIT mode by default.\n"
+                        "To run in JIT please delete the self.ort_session like: detector.ort_session = None.")
+                preds = self.jit_model(_input, *metadata)
+            elif self.ort_session:
+                preds = self.ort_session.run(['output'], {'data': _input.cpu().numpy()})
+                preds = torch.from_numpy(preds[0]).to(self.device, torch.half if hf else torch.float32)
+            else:
+                preds = self.predictor.graph_forward(_input)
+            res = self.predictor.postprocessing(preds, _input, *metadata)
+
+        return self._to_bounding_box_list(res)
+
+    def _infer_batch(self, inputs):
+        """
+        Runs a list of images through the PyTorch model in a single forward pass. Images of different sizes are padded
+        to a common size, which leaves the box coordinates unchanged.
+        """
+        with torch.inference_mode():
+            batch_inputs, batch_metadata = [], []
+            for img in inputs:
+                if not isinstance(img, Image):
+                    img = Image(img)
+                _input, *metadata = self.predictor.preprocessing(img.opencv())
+                batch_inputs.append(_input[0])
+                batch_metadata.append(metadata)
+            batch = stack_batch_img(batch_inputs, divisible=32)
+            if self.predictor.ch_l:
+                batch = batch.contiguous(memory_format=torch.channels_last)
+            preds = self.predictor.graph_forward(batch)
+            results = [self.predictor.postprocessing(preds[i:i + 1], batch[i:i + 1], *metadata)
+                       for i, metadata in enumerate(batch_metadata)]
+
+        return [self._to_bounding_box_list(res) for res in results]
+
+    @staticmethod
+    def _to_bounding_box_list(res):
         bounding_boxes = []
         if res.numel() != 0:
-            for box in res:
-                box = box.to("cpu")
-                bbox = BoundingBox(left=box[0], top=box[1],
-                                   width=box[2] - box[0],
-                                   height=box[3] - box[1],
-                                   name=box[5],
-                                   score=box[4])
-                bounding_boxes.append(bbox)
-        bounding_boxes = BoundingBoxList(bounding_boxes)
-        bounding_boxes.data.sort(key=lambda v: v.confidence)
-
-        return bounding_boxes
+            # Sort by confidence on the device and copy all boxes to the host at once
+            res = res[torch.argsort(res[:, 4])].cpu().tolist()
+            bounding_boxes = [BoundingBox(left=box[0], top=box[1],
+                                          width=box[2] - box[0],
+                                          height=box[3] - box[1],
+                                          name=int(box[5]),
+                                          score=box[4]) for box in res]
+        return BoundingBoxList(bounding_boxes)
+
+    def _loader_kwargs(self):
+        """
+        Returns the worker related DataLoader arguments. Workers are kept alive between epochs and prefetch
+        cfg.device.prefetch_factor batches each, both of which are only valid when worker processes are used.
+        """
+        num_workers = self.cfg.device.workers_per_gpu
+        if num_workers == 0:
+            return dict(num_workers=0)
+        return dict(num_workers=num_workers, persistent_workers=self.cfg.device.persistent_workers,
+                    prefetch_factor=self.cfg.device.prefetch_factor)
 
     def _info(self, msg, verbose=True):
         if self.logger and verbose:
@@ -19,7 +19,8 @@ from opendr.perception.object_detection_2d.nms.fseq2_nms.algorithm.fseq2_model i
 from opendr.perception.object_detection_2d.nms.utils import NMSCustom
 from opendr.perception.object_detection_2d.nms.utils.nms_dataset import Dataset_NMS
 from opendr.perception.object_detection_2d.nms.utils.nms_utils import drop_dets, det_matching, \
-    run_coco_eval, filter_iou_boxes, bb_intersection_over_union, compute_class_weights, apply_torchNMS
+    run_coco_eval, bb_intersection_over_union, compute_class_weights, apply_torchNMS, \
+    apply_fastNMS
 import torch
 import torch.nn.functional as F
 import pickle
@@ -30,15 +31,93 @@ import torch.nn as nn
 from tensorboardX import SummaryWriter
 import torch.optim as optim
 from tqdm import tqdm
-import collections
 import json
 import zipfile
+import hashlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _geometrical_feats(boxes: torch.Tensor, scores: torch.Tensor, ious: torch.Tensor, scale_div_x: float,
+                       scale_div_y: float) -> torch.Tensor:
+    # Pairwise terms are computed on broadcasted [N, 1] / [1, N] views, so that the whole function is a single
+    # pointwise pattern that torch.compile (or the TorchScript fuser) can fuse and only the final [N, N, 14] tensor
+    # is materialized
+    boxAs = boxes[:, None, :]
+    boxBs = boxes[None, :, :]
+    scoresAs = scores[:, None]
+    scoresBs = scores[None, :]
+    wAs = boxAs[:, :, 2] - boxAs[:, :, 0]
+    hAs = boxAs[:, :, 3] - boxAs[:, :, 1]
+    wBs = boxBs[:, :, 2] - boxBs[:, :, 0]
+    hBs = boxBs[:, :, 3] - boxBs[:, :, 1]
+
+    dx = (boxBs[:, :, 0] - boxAs[:, :, 0] + boxBs[:, :, 2] - boxAs[:, :, 2]) / 2
+    dy = (boxBs[:, :, 1] - boxAs[:, :, 1] + boxBs[:, :, 3] - boxAs[:, :, 3]) / 2
+    dxy = (dx * dx + dy * dy) / (scale_div_x * scale_div_x + scale_div_y * scale_div_y)
+    dx = dx / scale_div_x
+    dy = dy / scale_div_y
+    sx_1 = wBs / wAs
+    sx_2 = wBs / scale_div_x
+    sy_1 = hBs / hAs
+    sy_2 = hBs / scale_div_y
+    scl_1 = (wBs * hBs) / (wAs * hAs)
+    scl_2 = (wBs * hBs) / (scale_div_x * scale_div_y)
+
+    scr_1 = 5 * scoresBs
+    scr_2 = scr_1 - 5 * scoresAs
+
+    sr_1 = hBs / wBs
+    sr_2 = (hBs / wBs) / (hAs / wAs)
+
+    feats = [dx, dy, dxy, sx_1, sx_2, sy_1, sy_2, 5 * ious, scl_1, scl_2, scr_1, scr_2, sr_1, sr_2]
+    return torch.stack([feat.expand_as(ious) for feat in feats], dim=2)
+
+
+def _attention_mask(ious: torch.Tensor, iou_thres: float, extra: float) -> torch.Tensor:
+    # Lower triangle (with the diagonal) keeps the relations as 1, the upper one is scaled by extra, in one buffer
+    relations = ious >= iou_thres
+    mask = relations.float()
+    mask.triu_(diagonal=1).mul_(extra).add_(relations.tril())
+    return mask
+
+
+def _fast_prefilter(boxes, scores, iou_thres: float, max_dt_boxes: int):
+    # Fast NMS over the score-sorted boxes, followed by the max_dt_boxes cut
+    boxes, scores = apply_fastNMS(boxes, scores, iou_thres)
+    return boxes[:max_dt_boxes], scores[:max_dt_boxes]
+
+
+class _NMSTrainingSamples(torch.utils.data.Dataset):
+    """Loads the detections, ground truth and pickled SSD maps of a sample, so that DataLoader workers can prepare the
+    next samples while the current one is processed."""
+
+    def __init__(self, dataset_nms, maps_folder, class_index):
+        self.src_data = dataset_nms.src_data
+        self.maps_folder = maps_folder
+        self.class_index = class_index
+
+    def __len__(self):
+        return len(self.src_data)
+
+    def __getitem__(self, sample_id):
+        sample = self.src_data[sample_id]
+        dt_dets = sample['dt_boxes'][self.class_index]
+        map = None
+        if len(dt_dets) > 0:
+            with open(os.path.join(self.maps_folder, sample['ssd_maps']), 'rb') as f:
+                map = np.asarray(pickle.load(f))
+        return {'dt_dets': dt_dets, 'gt_boxes': sample['gt_boxes'][self.class_index], 'map': map,
+                'resolution': sample['resolution'][::-1]}
 
 
 class FSeq2NMSLearner(Learner, NMSCustom):
     def __init__(self, lr=0.0001, epochs=8, device='cuda', temp_path='./temp', checkpoint_after_iter=0,
-                 checkpoint_load_iter=0, log_after=10000, iou_filtering=0.8, dropout=0.025, app_input_dim=315):
-        super(FSeq2NMSLearner, self).__init__(lr=lr, batch_size=1, checkpoint_after_iter=checkpoint_after_iter,
+                 checkpoint_load_iter=0, log_after=10000, iou_filtering=0.8, dropout=0.025, app_input_dim=315,
+                 batch_size=1, compile_model=None, fast_prefilter=False, amp_dtype=None):
+        super(FSeq2NMSLearner, self).__init__(lr=lr, batch_size=batch_size, checkpoint_after_iter=checkpoint_after_iter,
                                               checkpoint_load_iter=checkpoint_load_iter, temp_path=temp_path,
                                               device=device)
         self.epochs = epochs
@@ -56,8 +135,28 @@ class FSeq2NMSLearner(Learner, NMSCustom):
         self.checkpoint_load_iter = checkpoint_load_iter
         self.log_after = log_after
         self.iou_filtering = iou_filtering
+        # Fast NMS runs the IoU prefiltering as a few matrix ops instead of the sequential greedy NMS
+        self.fast_prefilter = fast_prefilter
         self.classes = None
         self.class_ids = None
+        # Compile by default on CUDA. The model is only compiled when torch.compile is available (PyTorch >= 2.0),
+        # while the feature/mask helpers fall back to TorchScript so that their pointwise ops are still fused
+        if compile_model is None:
+            compile_model = "cuda" in self.device
+        self.compile_model = compile_model
+        # Runs the model forward under torch.autocast with the given dtype (e.g. torch.bfloat16) on CUDA
+        self.amp_dtype = amp_dtype
+        self.model_forward = None
+        self.geometrical_feats = _geometrical_feats
+        self.attention_mask = _attention_mask
+        self.fast_prefilter_dets = _fast_prefilter
+        if self.compile_model and hasattr(torch, "compile"):
+            self.fast_prefilter_dets = torch.compile(_fast_prefilter, dynamic=True)
+            self.geometrical_feats = torch.compile(_geometrical_feats, fullgraph=True, dynamic=True)
+            self.attention_mask = torch.compile(_attention_mask, fullgraph=True, dynamic=True)
+        elif self.compile_model:
+            self.geometrical_feats = torch.jit.script(_geometrical_feats)
+            self.attention_mask = torch.jit.script(_attention_mask)
 
         self.init_model()
         if "cuda" in self.device:
@@ -65,7 +164,7 @@ class FSeq2NMSLearner(Learner, NMSCustom):
 
     def fit(self, dataset, logging_path='', logging_flush_secs=30, silent=True,
             verbose=True, nms_gt_iou=0.5, max_dt_boxes=400, datasets_folder='./datasets',
-            use_ssd=True, ssd_model=None, lr_step=True):
+            use_ssd=True, ssd_model=None, lr_step=True, num_workers=4):
 
         dataset_nms = Dataset_NMS(path=datasets_folder, dataset_name=dataset, split='train', use_ssd=use_ssd,
                                   ssd_model=ssd_model, device=self.device, use_maps=True)
@@ -104,9 +203,12 @@ class FSeq2NMSLearner(Learner, NMSCustom):
                 drop_after_epoch.append(int(self.epochs * 0.7))
 
         train_ids = np.arange(len(dataset_nms.src_data))
-        total_loss_iter = 0
-        total_loss_epoch = 0
+        # Running losses are kept on the device and only read back when they are reported
+        total_loss_iter = torch.zeros((), device=self.device)
+        total_loss_epoch = torch.zeros((), device=self.device)
         optimizer = optim.Adam(self.model.parameters(), lr=self.lr, betas=(0.9, 0.99), eps=1e-9)  # HERE
+        # FP16 gradients need loss scaling, BF16 has the FP32 range and is trained unscaled
+        scaler = torch.cuda.amp.GradScaler(enabled=self.__use_amp() and self.amp_dtype == torch.float16)
         scheduler = None
         if len(drop_after_epoch) > 0:
             scheduler = optim.lr_scheduler.MultiStepLR(optimizer, milestones=drop_after_epoch, gamma=0.1)
@@ -115,48 +217,49 @@ class FSeq2NMSLearner(Learner, NMSCustom):
         training_weights = compute_class_weights(pos_weights=[0.9, 0.1], max_dets=max_dt_boxes, dataset_nms=dataset_nms)
         # Single class NMS only.
         class_index = 1
+        class_weights = torch.tensor(training_weights[class_index], dtype=torch.float32, device=self.device)
+        class_weights_diff = class_weights[1] - class_weights[0]
+        # Per-detection scratch buffers, reused across iterations (at most max_dt_boxes detections are kept)
+        weights_buffer = torch.empty((max_dt_boxes, 1), device=self.device)
+        noise_buffer = torch.empty((max_dt_boxes, 1), device=self.device)
+        self.__cast_dets(dataset_nms, class_index)
+        # batch_size=None keeps samples unbatched, as their number of detections differs
+        train_loader = torch.utils.data.DataLoader(
+            _NMSTrainingSamples(dataset_nms, os.path.join(datasets_folder, dataset), class_index), batch_size=None,
+            shuffle=True, num_workers=num_workers, pin_memory="cuda" in self.device,
+            persistent_workers=num_workers > 0)
         training_dict = {"cross_entropy_loss": []}
+        # Losses of batch_size samples are accumulated before each optimizer step
+        accumulated = 0
         for epoch in range(start_epoch, self.epochs):
             pbar = None
             if not silent:
                 pbarDesc = "Epoch #" + str(epoch) + " progress"
                 pbar = tqdm(desc=pbarDesc, total=len(train_ids))
-            np.random.shuffle(train_ids)
-            for sample_id in train_ids:
-                maps_fln = dataset_nms.src_data[sample_id]['ssd_maps']
-                with open(os.path.join(datasets_folder, dataset, maps_fln), 'rb') as f:
-                    map = pickle.load(f)
-                map = torch.tensor(map).to(self.device)
+            for sample in train_loader:
                 if self.log_after != 0 and num_iter > 0 and num_iter % self.log_after == 0:
+                    loss_iter = total_loss_iter.item() / self.log_after
                     if logging:
                         file_writer.add_scalar(tag="cross_entropy_loss",
-                                               scalar_value=total_loss_iter/self.log_after,
+                                               scalar_value=loss_iter,
                                                global_step=num_iter)
                     if verbose:
                         print(''.join(['\nEpoch: {}',
-                                       ' Iter: {}, cross_entropy_loss: {}']).format(epoch, num_iter,
-                                                                                    total_loss_iter/self.log_after))
-                    total_loss_iter = 0
-                if len(dataset_nms.src_data[sample_id]['dt_boxes'][class_index]) > 0:
-                    dt_boxes = torch.tensor(
-                        dataset_nms.src_data[sample_id]['dt_boxes'][class_index][:, 0:4]).float()
-                    dt_scores = torch.tensor(dataset_nms.src_data[sample_id]['dt_boxes'][class_index][:, 4]).float()
-                    dt_scores, dt_scores_ids = torch.sort(dt_scores, descending=True)
-                    dt_boxes = dt_boxes[dt_scores_ids]
+                                       ' Iter: {}, cross_entropy_loss: {}']).format(epoch, num_iter, loss_iter))
+                    total_loss_iter.zero_()
+                if sample['dt_dets'].shape[0] > 0:
+                    dt_dets = sample['dt_dets'].to(self.device, non_blocking=True)
+                    map = sample['map'].to(self.device, non_blocking=True)
+                    # No sorting is needed here, drop_dets returns the kept detections sorted by score
+                    dt_boxes = dt_dets[:, 0:4]
+                    dt_scores = dt_dets[:, 4]
                 else:
                     if not silent:
                         pbar.update(1)
                     num_iter = num_iter + 1
                     continue
-                gt_boxes = torch.tensor([]).float()
-                if len(dataset_nms.src_data[sample_id]['gt_boxes'][class_index]) > 0:
-                    gt_boxes = torch.tensor(dataset_nms.src_data[sample_id]['gt_boxes'][class_index]).float()
-                img_res = dataset_nms.src_data[sample_id]['resolution'][::-1]
-
-                if "cuda" in self.device:
-                    dt_boxes = dt_boxes.to(self.device)
-                    dt_scores = dt_scores.to(self.device)
-                    gt_boxes = gt_boxes.to(self.device)
+                gt_boxes = sample['gt_boxes'].to(self.device, non_blocking=True)
+                img_res = sample['resolution']
 
                 val_ids = torch.logical_and((dt_boxes[:, 2] - dt_boxes[:, 0]) > 4,
                                             (dt_boxes[:, 3] - dt_boxes[:, 1]) > 4)
@@ -169,51 +272,56 @@ class FSeq2NMSLearner(Learner, NMSCustom):
                         pbar.update(1)
                     num_iter = num_iter + 1
                     continue
-                if self.iou_filtering is not None and 1.0 > self.iou_filtering > 0:
-                    dt_boxes, dt_scores = apply_torchNMS(boxes=dt_boxes, scores=dt_scores,
-                                                         iou_thres=self.iou_filtering)
-
-                dt_boxes = dt_boxes[:max_dt_boxes]
-                dt_scores = dt_scores[:max_dt_boxes]
-                msk = self.__compute_mask(dt_boxes, iou_thres=0.2, extra=0.1)
+                dt_boxes, dt_scores = self.__prefilter(dt_boxes, dt_scores, max_dt_boxes)
+                # The pairwise IoUs are shared by the attention mask and the geometrical features
+                ious = bb_intersection_over_union(dt_boxes[:, None, :], dt_boxes[None, :, :])
+                msk = self.__compute_mask(ious, iou_thres=0.2, extra=0.1)
                 q_geom_feats, k_geom_feats = self.__compute_geometrical_feats(boxes=dt_boxes,
                                                                               scores=dt_scores,
-                                                                              resolution=img_res)
-                preds = self.model(q_geom_feats=q_geom_feats, k_geom_feats=k_geom_feats, msk=msk,
-                                   maps=map, img_res=img_res, boxes=dt_boxes)
-                preds = torch.clamp(preds, 0.001, 1 - 0.001)
+                                                                              resolution=img_res, ious=ious)
+                with torch.autocast(device_type="cuda", dtype=self.amp_dtype, enabled=self.__use_amp()):
+                    preds = self.model_forward(q_geom_feats=q_geom_feats, k_geom_feats=k_geom_feats, msk=msk,
+                                               maps=map, img_res=img_res, boxes=dt_boxes)
+                preds = torch.clamp(preds.float(), 0.001, 1 - 0.001)
 
                 labels = det_matching(scores=preds, dt_boxes=dt_boxes, gt_boxes=gt_boxes,
                                       iou_thres=nms_gt_iou, device=self.device)
-                weights = (training_weights[class_index][1] * labels + training_weights[class_index][0] * (
-                        1 - labels))
-
-                e = torch.distributions.uniform.Uniform(0.001, 0.005).sample([labels.shape[0], 1])
-                if "cuda" in self.device:
-                    weights = weights.to(self.device)
-                    e = e.to(self.device)
-                labels = labels * (1 - e) + (1 - labels) * e
+                num_dets = labels.shape[0]
+                weights = torch.addcmul(class_weights[0], labels, class_weights_diff, out=weights_buffer[:num_dets])
+
+                e = noise_buffer[:num_dets].uniform_(0.001, 0.005)
+                # Equivalent to labels * (1 - e) + (1 - labels) * e
+                labels = torch.lerp(labels, 1 - labels, e)
                 ce_loss = F.binary_cross_entropy(preds, labels, reduction="none")
                 loss = (ce_loss * weights).sum()
 
-                optimizer.zero_grad()
-                loss.backward()
-                optimizer.step()
+                if accumulated == 0:
+                    optimizer.zero_grad()
+                scaler.scale(loss / self.batch_size).backward()
+                accumulated = accumulated + 1
+                if accumulated == self.batch_size:
+                    scaler.step(optimizer)
+                    scaler.update()
+                    accumulated = 0
 
                 # Memory leak if not loss not detached in total_loss_iter and total_loss_epoch computations
-                loss_t = loss.detach().cpu().numpy()
-                total_loss_iter = total_loss_iter + loss_t
-                total_loss_epoch = total_loss_epoch + loss_t
+                loss_t = loss.detach()
+                total_loss_iter += loss_t
+                total_loss_epoch += loss_t
                 num_iter = num_iter + 1
                 if not silent:
                     pbar.update(1)
+            if accumulated > 0:
+                scaler.step(optimizer)
+                scaler.update()
+                accumulated = 0
             if not silent:
                 pbar.close()
+            loss_epoch = total_loss_epoch.item() / len(train_ids)
             if verbose:
                 print(''.join(['\nEpoch: {}',
-                               ' cross_entropy_loss: {}\n']).format(epoch,
-                                                                    total_loss_epoch/len(train_ids)))
-            training_dict['cross_entropy_loss'].append(total_loss_epoch/len(train_ids))
+                               ' cross_entropy_loss: {}\n']).format(epoch, loss_epoch))
+            training_dict['cross_entropy_loss'].append(loss_epoch)
             if self.checkpoint_after_iter != 0 and epoch % self.checkpoint_after_iter == self.checkpoint_after_iter - 1:
                 snapshot_name = '{}/checkpoint_epoch_{}'.format(checkpoints_folder, epoch)
                 self.save(path=snapshot_name, optimizer=optimizer, scheduler=scheduler,
@@ -221,7 +329,7 @@ class FSeq2NMSLearner(Learner, NMSCustom):
                 snapshot_name_lw = '{}/last_weights'.format(checkpoints_folder)
                 self.save(path=snapshot_name_lw, optimizer=optimizer, scheduler=scheduler,
                           current_epoch=epoch, max_dt_boxes=max_dt_boxes)
-            total_loss_epoch = 0
+            total_loss_epoch.zero_()
             if scheduler is not None:
                 scheduler.step()
         if logging:
@@ -229,7 +337,7 @@ class FSeq2NMSLearner(Learner, NMSCustom):
         return training_dict
 
     def eval(self, dataset, split='test', verbose=True, max_dt_boxes=400, threshold=0.0,
-             datasets_folder='./datasets', use_ssd=True, ssd_model=None):
+             datasets_folder='./datasets', use_ssd=True, ssd_model=None, boxes_sorted=False):
 
         dataset_nms = Dataset_NMS(path=datasets_folder, dataset_name=dataset, split=split, use_ssd=use_ssd,
                                   device=self.device, use_maps=True, ssd_model=ssd_model)
@@ -250,70 +358,80 @@ class FSeq2NMSLearner(Learner, NMSCustom):
         if "cuda" in self.device:
             self.model = self.model.to(self.device)
 
+        maps_data, maps_index = self.__materialize_maps(datasets_folder=datasets_folder, dataset=dataset,
+                                                        dataset_nms=dataset_nms,
+                                                        cache_name='maps_{}_{}'.format(ssd_model, split))
+
         eval_ids = np.arange(len(dataset_nms.src_data))
-        nms_results = []
+        # Single class NMS only.
+        class_index = 1
+        self.__cast_dets(dataset_nms, class_index)
+        results_ids = []
+        results_boxes = []
+        results_scores = []
         pbar_eval = None
         if verbose:
             pbarDesc = "Evaluation progress"
             pbar_eval = tqdm(desc=pbarDesc, total=len(eval_ids))
         for sample_id in eval_ids:
-            maps_fln = dataset_nms.src_data[sample_id]['ssd_maps']
-            with open(os.path.join(datasets_folder, dataset, maps_fln), 'rb') as f:
-                map = pickle.load(f)
-            map = torch.tensor(map).to(self.device)
             img_res = dataset_nms.src_data[sample_id]['resolution'][::-1]
-            # Single class NMS only.
-            class_index = 1
             if len(dataset_nms.src_data[sample_id]['dt_boxes'][class_index]) > 0:
-                dt_boxes = torch.tensor(dataset_nms.src_data[sample_id]['dt_boxes'][class_index][:, 0:4]).float()
-                dt_scores = torch.tensor(dataset_nms.src_data[sample_id]['dt_boxes'][class_index][:, 4]).float()
-                dt_scores, dt_scores_ids = torch.sort(dt_scores, descending=True)
-                dt_boxes = dt_boxes[dt_scores_ids]
+                # Small boxes are dropped and the rest sorted on the host, so that only the kept ones are uploaded
+                dt_dets = dataset_nms.src_data[sample_id]['dt_boxes'][class_index]
+                dt_dets = dt_dets[np.logical_and((dt_dets[:, 2] - dt_dets[:, 0]) > 4,
+                                                 (dt_dets[:, 3] - dt_dets[:, 1]) > 4)]
+                if not boxes_sorted:
+                    dt_dets = dt_dets[np.argsort(-dt_dets[:, 4], kind='stable')]
+                dt_dets = torch.as_tensor(dt_dets, device=self.device)
+                dt_boxes = dt_dets[:, 0:4]
+                dt_scores = dt_dets[:, 4]
             else:
                 pbar_eval.update(1)
                 continue
 
+            offset, ndim = maps_index[sample_id, 0], maps_index[sample_id, 1]
+            map_shape = tuple(maps_index[sample_id, 2:2 + ndim])
+            map = torch.from_numpy(np.array(maps_data[offset:offset + int(np.prod(map_shape))]).reshape(map_shape))
             if "cuda" in self.device:
-                dt_boxes = dt_boxes.to(self.device)
-                dt_scores = dt_scores.to(self.device)
+                map = map.pin_memory().to(self.device, non_blocking=True)
 
-            val_ids = torch.logical_and((dt_boxes[:, 2] - dt_boxes[:, 0]) > 4,
-                                        (dt_boxes[:, 3] - dt_boxes[:, 1]) > 4)
-            dt_boxes = dt_boxes[val_ids, :]
-            dt_scores = dt_scores[val_ids]
+            dt_boxes, dt_scores = self.__prefilter(dt_boxes, dt_scores, max_dt_boxes)
 
-            if self.iou_filtering is not None and 1.0 > self.iou_filtering > 0:
-                dt_boxes, dt_scores = apply_torchNMS(boxes=dt_boxes, scores=dt_scores, iou_thres=self.iou_filtering)
-
-            dt_boxes = dt_boxes[:max_dt_boxes]
-            dt_scores = dt_scores[:max_dt_boxes]
-
-            msk = self.__compute_mask(dt_boxes, iou_thres=0.2, extra=0.1)
+            ious = bb_intersection_over_union(dt_boxes[:, None, :], dt_boxes[None, :, :])
+            msk = self.__compute_mask(ious, iou_thres=0.2, extra=0.1)
             q_geom_feats, k_geom_feats = self.__compute_geometrical_feats(boxes=dt_boxes,
                                                                           scores=dt_scores,
-                                                                          resolution=img_res)
-            with torch.no_grad():
-                preds = self.model(q_geom_feats=q_geom_feats, k_geom_feats=k_geom_feats, msk=msk,
-                                   maps=map, img_res=img_res, boxes=dt_boxes)
+                                                                          resolution=img_res, ious=ious)
+            with torch.no_grad(), torch.autocast(device_type="cuda", dtype=self.amp_dtype, enabled=self.__use_amp()):
+                preds = self.model_forward(q_geom_feats=q_geom_feats, k_geom_feats=k_geom_feats, msk=msk,
+                                           maps=map, img_res=img_res, boxes=dt_boxes).float()
                 bboxes = dt_boxes.cpu().numpy().astype('float64')
             preds = preds.cpu().detach()
             if threshold > 0.0:
                 ids = (preds > threshold)
                 preds = preds[ids]
                 bboxes = bboxes[ids.numpy().squeeze(-1), :]
-            for j in range(len(preds)):
-                nms_results.append({
-                    'image_id': dataset_nms.src_data[sample_id]['id'],
-                    'bbox': [bboxes[j][0], bboxes[j][1], bboxes[j][2] - bboxes[j][0], bboxes[j][3] - bboxes[j][1]],
-                    'category_id': class_index,
-                    'score': np.float64(preds[j])
-                })
+            # Boxes are converted to COCO [x, y, w, h] format for the whole image at once
+            bboxes[:, 2:] = bboxes[:, 2:] - bboxes[:, :2]
+            results_ids.append(np.full(len(bboxes), dataset_nms.src_data[sample_id]['id']))
+            results_boxes.append(bboxes)
+            results_scores.append(preds.numpy().reshape(-1).astype('float64'))
             pbar_eval.update(1)
         pbar_eval.close()
+        nms_results = []
+        if len(results_ids) > 0:
+            nms_results = [{'image_id': image_id, 'bbox': bbox, 'category_id': class_index, 'score': score}
+                           for image_id, bbox, score in zip(np.concatenate(results_ids).tolist(),
+                                                            np.concatenate(results_boxes).tolist(),
+                                                            np.concatenate(results_scores).tolist())]
         if verbose:
             print('Writing results json to {}'.format(output_file))
-        with open(output_file, 'w') as fid:
-            json.dump(nms_results, fid, indent=2)
+        if orjson is not None:
+            with open(output_file, 'wb') as fid:
+                fid.write(orjson.dumps(nms_results, option=orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(output_file, 'w') as fid:
+                json.dump(nms_results, fid)
         eval_result = run_coco_eval(gt_file_path=os.path.join(dataset_nms.path, 'annotations', annotations_filename),
                                     dt_file_path=output_file, only_classes=[1],
                                     verbose=verbose, max_dets=[max_dt_boxes])
@@ -337,10 +455,8 @@ class FSeq2NMSLearner(Learner, NMSCustom):
             raise ValueError('Multi-class NMS is not supported in Seq2Seq-NMS yet.')
         if boxes.shape[0] != scores.shape[0]:
             raise ValueError('Scores and boxes must have the same size in dim 0.')
-        if "cuda" in self.device:
-            boxes = boxes.to(self.device)
-            scores = scores.to(self.device)
 
+        # Host inputs are filtered and sorted before being moved to the device
         scores = scores.squeeze(-1)
         keep_ids = torch.where(scores > 0.05)[0]
         scores = scores[keep_ids]
@@ -353,21 +469,21 @@ class FSeq2NMSLearner(Learner, NMSCustom):
                                     (boxes[:, 3] - boxes[:, 1]) > 4)
         boxes = boxes[val_ids, :]
         scores = scores[val_ids]
+        if "cuda" in self.device:
+            boxes = boxes.to(self.device)
+            scores = scores.to(self.device)
 
-        if self.iou_filtering is not None and 1.0 > self.iou_filtering > 0:
-            boxes, scores = apply_torchNMS(boxes=boxes, scores=scores, iou_thres=self.iou_filtering)
-
-        boxes = boxes[:max_dt_boxes]
-        scores = scores[:max_dt_boxes]
+        boxes, scores = self.__prefilter(boxes, scores, max_dt_boxes)
 
-        msk = self.__compute_mask(boxes, iou_thres=0.2, extra=0.1)
+        ious = bb_intersection_over_union(boxes[:, None, :], boxes[None, :, :])
+        msk = self.__compute_mask(ious, iou_thres=0.2, extra=0.1)
         q_geom_feats, k_geom_feats = self.__compute_geometrical_feats(boxes=boxes,
                                                                       scores=scores,
-                                                                      resolution=img_res)
+                                                                      resolution=img_res, ious=ious)
 
-        with torch.no_grad():
-            preds = self.model(q_geom_feats=q_geom_feats, k_geom_feats=k_geom_feats, msk=msk,
-                               maps=map, img_res=img_res, boxes=boxes)
+        with torch.no_grad(), torch.autocast(device_type="cuda", dtype=self.amp_dtype, enabled=self.__use_amp()):
+            preds = self.model_forward(q_geom_feats=q_geom_feats, k_geom_feats=k_geom_feats, msk=msk,
+                                       maps=map, img_res=img_res, boxes=boxes).float()
 
         mask = torch.where(preds > threshold)[0]
         if mask.size == 0:
@@ -385,22 +501,13 @@ class FSeq2NMSLearner(Learner, NMSCustom):
         return bounding_boxes, [boxes, np.zeros(scores.shape[0]), preds]
 
     def run_nms(self, boxes=None, scores=None, boxes_sorted=False, top_k=400, img=None, threshold=0.2, map=None):
+        # Boxes and scores are moved to the device by infer, after the invalid ones are dropped
         if isinstance(boxes, np.ndarray):
-            boxes = torch.tensor(boxes, device=self.device)
-        elif torch.is_tensor(boxes):
-            if "cuda" in self.device:
-                boxes = boxes.to(self.device)
-
+            boxes = torch.from_numpy(boxes)
         if isinstance(scores, np.ndarray):
-            scores = torch.tensor(scores, device=self.device)
-        elif torch.is_tensor(scores):
-            if "cuda" in self.device:
-                scores = scores.to(self.device)
-        if isinstance(map, np.ndarray):
-            map = torch.tensor(map, device=self.device)
-        elif torch.is_tensor(map):
-            if "cuda" in self.device:
-                map = map.to(self.device)
+            scores = torch.from_numpy(scores)
+        if map is not None:
+            map = torch.as_tensor(map, device=self.device)
         boxes = self.infer(boxes=boxes, scores=scores, boxes_sorted=boxes_sorted, max_dt_boxes=top_k,
                            img_res=img.opencv().shape[::-1][1:], map=map)
         return boxes
@@ -449,7 +556,7 @@ class FSeq2NMSLearner(Learner, NMSCustom):
             e.strerror = "File " + pth_path + "not found."
             raise e
         self.__assign_params(metadata=metadata, verbose=verbose)
-        self.__load_state(checkpoint)
+        self.__load_state(checkpoint, verbose=verbose)
         if verbose:
             print("Loaded parameters and metadata.")
         return True
@@ -492,6 +599,10 @@ class FSeq2NMSLearner(Learner, NMSCustom):
             for p in self.model.parameters():
                 if p.dim() > 1:
                     nn.init.xavier_uniform_(p)
+            # The compiled wrapper shares its parameters with self.model, which is still used for saving and loading
+            self.model_forward = self.model
+            if self.compile_model and hasattr(torch, "compile"):
+                self.model_forward = torch.compile(self.model, mode="reduce-overhead", fullgraph=False, dynamic=True)
         else:
             raise UserWarning("Tried to initialize model while model is already initialized.")
 
@@ -520,7 +631,45 @@ class FSeq2NMSLearner(Learner, NMSCustom):
         if verbose and 'max_dt_boxes' in metadata:
             print('Model is trained with ' + str(metadata['max_dt_boxes']) + ' as the maximum number of detections.')
 
-    def __load_state(self, checkpoint=None):
+    def __materialize_maps(self, datasets_folder, dataset, dataset_nms, cache_name, max_dims=6):
+        """
+        Gathers the per-image pickled SSD maps of a dataset into a single float32 file that is memory-mapped, together
+        with an index holding the offset, the number of dimensions and the shape of each map. The files are reused as
+        long as the list of pickled maps and their modification times are unchanged.
+        """
+        maps_path = os.path.join(datasets_folder, dataset, cache_name + '.bin')
+        index_path = os.path.join(datasets_folder, dataset, cache_name + '_index.npy')
+        key_path = os.path.join(datasets_folder, dataset, cache_name + '_key.txt')
+        key = hashlib.sha1()
+        for sample in dataset_nms.src_data:
+            maps_fln = sample['ssd_maps']
+            mtime = os.stat(os.path.join(datasets_folder, dataset, maps_fln)).st_mtime_ns
+            key.update('{}:{}\n'.format(maps_fln, mtime).encode())
+        key = key.hexdigest()
+        if os.path.exists(maps_path) and os.path.exists(index_path) and os.path.exists(key_path):
+            with open(key_path) as f:
+                if f.read() == key:
+                    return np.memmap(maps_path, dtype=np.float32, mode='r'), np.load(index_path)
+
+        maps_index = np.zeros((len(dataset_nms.src_data), 2 + max_dims), dtype=np.int64)
+        offset = 0
+        with open(maps_path, 'wb') as f_maps:
+            for sample_id in range(len(dataset_nms.src_data)):
+                maps_fln = dataset_nms.src_data[sample_id]['ssd_maps']
+                with open(os.path.join(datasets_folder, dataset, maps_fln), 'rb') as f:
+                    map = np.ascontiguousarray(pickle.load(f), dtype=np.float32)
+                maps_index[sample_id, 0] = offset
+                maps_index[sample_id, 1] = map.ndim
+                maps_index[sample_id, 2:2 + map.ndim] = map.shape
+                f_maps.write(map.tobytes())
+                offset = offset + map.size
+        np.save(index_path, maps_index)
+        # Written last, so that an interrupted run is not mistaken for a complete cache
+        with open(key_path, 'w') as f:
+            f.write(key)
+        return np.memmap(maps_path, dtype=np.float32, mode='r'), maps_index
+
+    def __load_state(self, checkpoint=None, verbose=False):
         if checkpoint is None:
             for p in self.model.parameters():
                 if p.dim() > 1:
@@ -531,14 +680,12 @@ class FSeq2NMSLearner(Learner, NMSCustom):
             except KeyError:
                 source_state = checkpoint
             target_state = self.model.state_dict()
-            new_target_state = collections.OrderedDict()
-            for target_key, target_value in target_state.items():
-                if target_key in source_state and source_state[target_key].size() == target_state[target_key].size():
-                    new_target_state[target_key] = source_state[target_key]
-                else:
-                    new_target_state[target_key] = target_state[target_key]
-
-            self.model.load_state_dict(new_target_state)
+            # Parameters missing from the checkpoint or with a different shape keep their current values
+            new_target_state = {key: value for key, value in source_state.items()
+                                if key in target_state and value.shape == target_state[key].shape}
+            missing_keys, _ = self.model.load_state_dict(new_target_state, strict=False)
+            if verbose and len(missing_keys) > 0:
+                print("Parameters not loaded from the checkpoint:", missing_keys)
 
     def __count_parameters(self):
 
@@ -554,48 +701,27 @@ class FSeq2NMSLearner(Learner, NMSCustom):
         """This method is not used in this implementation."""
         return NotImplementedError
 
-    def __compute_mask(self, boxes=None, iou_thres=0.2, extra=0.1):
-        relations = filter_iou_boxes(boxes, iou_thres=iou_thres)
-        mask1 = torch.tril(relations).float()
-        mask2 = extra * torch.triu(relations, diagonal=1).float()
-        mask = mask1 + mask2
-        return mask
-
-    def __compute_geometrical_feats(self, boxes, scores, resolution):
-        boxBs = boxes.clone().unsqueeze(0).repeat(boxes.shape[0], 1, 1)
-        boxAs = boxes.unsqueeze(1).repeat(1, boxes.shape[0], 1)
-        scoresBs = scores.unsqueeze(0).unsqueeze(-1).repeat(scores.shape[0], 1, 1)
-        scoresAs = scores.unsqueeze(1).unsqueeze(1).repeat(1, scores.shape[0], 1)
-
-        scale_div = [resolution[1] / 20, resolution[0] / 20]
-        dx = ((boxBs[:, :, 0] - boxAs[:, :, 0] + boxBs[:, :, 2] - boxAs[:, :, 2]) / 2).unsqueeze(-1)
-        dy = ((boxBs[:, :, 1] - boxAs[:, :, 1] + boxBs[:, :, 3] - boxAs[:, :, 3]) / 2).unsqueeze(-1)
-        dxy = dx * dx + dy * dy
-        dxy = dxy / (scale_div[0] * scale_div[0] + scale_div[1] * scale_div[1])
-        dx = (dx / scale_div[0])
-        dy = (dy / scale_div[1])
-        sx = boxBs[:, :, 2] - boxBs[:, :, 0]
-        sx_1 = (sx / (boxAs[:, :, 2] - boxAs[:, :, 0])).unsqueeze(-1)
-        sx_2 = (sx / scale_div[0]).unsqueeze(-1)
-        sy = boxBs[:, :, 3] - boxBs[:, :, 1]
-        sy_1 = (sy / (boxAs[:, :, 3] - boxAs[:, :, 1])).unsqueeze(-1)
-        sy_2 = (sy / scale_div[1]).unsqueeze(-1)
-        scl = (boxBs[:, :, 2] - boxBs[:, :, 0]) * (boxBs[:, :, 3] - boxBs[:, :, 1])
-        scl_1 = (scl / ((boxAs[:, :, 2] - boxAs[:, :, 0]) * (boxAs[:, :, 3] - boxAs[:, :, 1]))).unsqueeze(-1)
-        scl_2 = (scl / (scale_div[0] * scale_div[1])).unsqueeze(-1)
-        del scl
-
-        scr_1 = 5 * scoresBs
-        scr_2 = scr_1 - 5 * scoresAs
-
-        sr_1 = torch.unsqueeze((boxBs[:, :, 3] - boxBs[:, :, 1]) / (boxBs[:, :, 2] - boxBs[:, :, 0]), dim=-1)
-        sr_2 = torch.unsqueeze(((boxBs[:, :, 3] - boxBs[:, :, 1]) / (boxBs[:, :, 2] - boxBs[:, :, 0])) / (
-                (boxAs[:, :, 3] - boxAs[:, :, 1]) / (boxAs[:, :, 2] - boxAs[:, :, 0])), dim=-1)
-
-        ious = 5 * (bb_intersection_over_union(boxes.unsqueeze(1).repeat(1, boxes.shape[0], 1),
-                                               boxes.clone().unsqueeze(0).repeat(boxes.shape[0], 1, 1))).unsqueeze(-1)
-        enc_vers_all = torch.cat((dx, dy, dxy, sx_1, sx_2, sy_1, sy_2, ious, scl_1, scl_2, scr_1, scr_2, sr_1,
-                                  sr_2),
-                                 dim=2)
+    @staticmethod
+    def __cast_dets(dataset_nms, class_index):
+        # Boxes are cast to float32 once, so that the training/evaluation loops can wrap them with torch.from_numpy
+        for sample in dataset_nms.src_data:
+            for key in ['dt_boxes', 'gt_boxes']:
+                sample[key][class_index] = np.ascontiguousarray(sample[key][class_index], dtype=np.float32)
+
+    def __prefilter(self, boxes, scores, max_dt_boxes):
+        if self.iou_filtering is not None and 1.0 > self.iou_filtering > 0:
+            if self.fast_prefilter:
+                return self.fast_prefilter_dets(boxes, scores, self.iou_filtering, max_dt_boxes)
+            boxes, scores = apply_torchNMS(boxes=boxes, scores=scores, iou_thres=self.iou_filtering)
+        return boxes[:max_dt_boxes], scores[:max_dt_boxes]
+
+    def __use_amp(self):
+        return self.amp_dtype is not None and "cuda" in self.device
+
+    def __compute_mask(self, ious=None, iou_thres=0.2, extra=0.1):
+        return self.attention_mask(ious, iou_thres, extra)
+
+    def __compute_geometrical_feats(self, boxes, scores, resolution, ious):
+        enc_vers_all = self.geometrical_feats(boxes, scores, ious, resolution[1] / 20, resolution[0] / 20)
         enc_vers = enc_vers_all.diagonal(dim1=0, dim2=1).transpose(0, 1).unsqueeze(1)
         return enc_vers, enc_vers_all
@@ -134,28 +134,26 @@ def distance(box_a, box_b, iscrowd: bool = False):
 
 
 def det_matching(scores, dt_boxes, gt_boxes, iou_thres, device='cuda'):
-    sorted_indices = torch.argsort(-scores, dim=0)
-    labels = torch.zeros(len(dt_boxes))
-    if device == 'cuda':
-        labels = labels.cuda()
+    labels = torch.zeros((len(dt_boxes), 1), device=dt_boxes.device)
     if gt_boxes.shape[0] == 0:
-        return labels.unsqueeze(-1)
-    assigned_GT = -torch.ones(len(gt_boxes))
-    r = torch.tensor([-1, -1, -1, -1]).float().unsqueeze(0).unsqueeze(0)
-    if device == 'cuda':
-        r = r.cuda()
+        return labels
+    # The IoUs of all detection/ground truth pairs are computed at once on the device. The greedy assignment in
+    # score order is inherently sequential, so it runs on the host over a single copy of the matrix instead of
+    # synchronizing once per detection.
+    ious = bb_intersection_over_union(dt_boxes[:, None, :], gt_boxes[None, :, :]).cpu().numpy()
+    sorted_indices = torch.argsort(-scores.detach().view(-1)).cpu().numpy()
+    # Detections that do not overlap any ground truth enough can never be matched
+    sorted_indices = sorted_indices[(ious[sorted_indices] > iou_thres).any(axis=1)]
+    assigned_GT = np.zeros(len(gt_boxes), dtype=bool)
+    matched = np.zeros(len(dt_boxes), dtype=bool)
     for s in sorted_indices:
-        gt_boxes_c = gt_boxes.clone().unsqueeze(0)
-        gt_boxes_c[0, assigned_GT > -1, :] = r
-        ious = bb_intersection_over_union(boxAs=dt_boxes[s].clone().unsqueeze(0), boxBs=gt_boxes_c)
-        annot_iou, annot_box_id = torch.sort(ious.squeeze(), descending=True)
-        if annot_box_id.ndim > 0:
-            annot_box_id = annot_box_id[0]
-            annot_iou = annot_iou[0]
-        if annot_iou > iou_thres:
-            assigned_GT[annot_box_id] = s
-            labels[s] = 1
-    return labels.unsqueeze(-1)
+        annot_ious = np.where(assigned_GT, -1.0, ious[s])
+        annot_box_id = annot_ious.argmax()
+        if annot_ious[annot_box_id] > iou_thres:
+            assigned_GT[annot_box_id] = True
+            matched[s] = True
+    labels[torch.from_numpy(matched).to(labels.device)] = 1
+    return labels
 
 
 def run_coco_eval(dt_file_path=None, gt_file_path=None, only_classes=None, max_dets=None,
@@ -241,8 +239,7 @@ def drop_dets(boxes, scores, keep_ratio=0.85):
 
 
 def filter_iou_boxes(boxes=None, iou_thres=0.2):
-    ious = bb_intersection_over_union(boxes.unsqueeze(1).repeat(1, boxes.shape[0], 1),
-                                      boxes.clone().unsqueeze(0).repeat(boxes.shape[0], 1, 1))
+    ious = bb_intersection_over_union(boxes[:, None, :], boxes[None, :, :])
     ids_boxes = ious >= iou_thres
     return ids_boxes
 
@@ -252,7 +249,7 @@ def bb_intersection_over_union(boxAs=None, boxBs=None):
     yA = torch.maximum(boxAs[:, :, 1], boxBs[:, :, 1])
     xB = torch.minimum(boxAs[:, :, 2], boxBs[:, :, 2])
     yB = torch.minimum(boxAs[:, :, 3], boxBs[:, :, 3])
-    interAreas = torch.maximum(torch.zeros_like(xB), xB - xA + 1) * torch.maximum(torch.zeros_like(yB), yB - yA + 1)
+    interAreas = (xB - xA + 1).clamp(min=0) * (yB - yA + 1).clamp(min=0)
     boxAAreas = (boxAs[:, :, 2] - boxAs[:, :, 0] + 1) * (boxAs[:, :, 3] - boxAs[:, :, 1] + 1)
     boxBAreas = (boxBs[:, :, 2] - boxBs[:, :, 0] + 1) * (boxBs[:, :, 3] - boxBs[:, :, 1] + 1)
     ious = interAreas / (boxAAreas + boxBAreas - interAreas)
@@ -284,3 +281,13 @@ def apply_torchNMS(boxes, scores, iou_thres):
     scores = scores[ids_nms]
     boxes = boxes[ids_nms]
     return boxes, scores
+
+
+def apply_fastNMS(boxes, scores, iou_thres):
+    # Fast NMS: boxes must be sorted by descending score. A box is suppressed if any higher scoring box overlaps it
+    # more than iou_thres, including boxes that are themselves suppressed, so it may remove slightly more than greedy NMS.
+    if boxes.shape[0] == 0:
+        return boxes, scores
+    ious = jaccard(boxes, boxes).triu_(diagonal=1)
+    keep = ious.max(dim=0)[0] <= iou_thres
+    return boxes[keep], scores[keep]
@@ -94,21 +94,25 @@ def draw_detections(img, boxes, scores, classes, class_names=None, show=False, l
     palette = VOC_COLORS
     n_classes = len(palette)
 
+    if len(boxes) > 0:
+        img = np.ascontiguousarray(img, dtype=np.uint8)
+        tl = line_thickness or int(0.003 * max(img.shape[:2]))
+    # labels and their rendered sizes only depend on the class, so they are built once per class
+    labels = {}
+
     for idx, pred_box in enumerate(boxes):
         # pred_box_w, pred_box_h = pred_box[2] - pred_box[0], pred_box[3] - pred_box[1]
-        tl = line_thickness or int(0.003 * max(img.shape[:2]))
         c1 = (max(0, int(pred_box[0])), max(0, int(pred_box[1])))
         c2 = (min(img.shape[1], int(pred_box[2])), min(img.shape[0], int(pred_box[3])))
         color = tuple(palette[classes[idx] % n_classes])
 
-        img = np.ascontiguousarray(img, dtype=np.uint8)
         cv2.rectangle(img, c1, c2, color, thickness=2)
 
         if class_names is not None:
-            label = "{}".format(class_names[classes[idx]])
-
-            t_size = cv2.getTextSize(
-                label, 0, fontScale=float(tl) / 5, thickness=1)[0]
+            if classes[idx] not in labels:
+                label = "{}".format(class_names[classes[idx]])
+                labels[classes[idx]] = label, cv2.getTextSize(label, 0, fontScale=float(tl) / 5, thickness=1)[0]
+            label, t_size = labels[classes[idx]]
 
             c2 = c1[0] + t_size[0], c1[1] - t_size[1] - 3
             t = - 2
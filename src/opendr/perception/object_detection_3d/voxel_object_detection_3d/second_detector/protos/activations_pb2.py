@@ -1,14 +1,11 @@
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: second/protos/activations.proto
 
-import sys
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
 from google.protobuf import reflection as _reflection
 from google.protobuf import symbol_database as _symbol_database
 
-_b = sys.version_info[0] < 3 and (lambda x: x) or (lambda x: x.encode("latin1"))
-
 # @@protoc_insertion_point(imports)
 
 _sym_db = _symbol_database.Default()
@@ -19,18 +16,17 @@ DESCRIPTOR = _descriptor.FileDescriptor(
     package="second.protos",
     syntax="proto3",
     serialized_options=None,
-    serialized_pb=_b(
-        '\n\x1fsecond/protos/activations.proto\x12\rsecond.protos"\x06\n\x04ReLU"\x1d\n\tLeakyReL' +
-        'U\x12\x10\n\x08leakness\x18\x01 \x01(\x02"\x07\n\x05Swish"\x14\n\x03\x45LU\x12\r\n\x05\x61lph' +
-        'a\x18\x01 \x01(\x02"+\n\x08Softplus\x12\x0c\n\x04\x62\x65ta\x18\x01 \x01(\x02\x12\x11\n\tthre' +
-        'shold\x18\x02 \x01(\x02"\n\n\x08Softsign"\x07\n\x05ReLU6"\x06\n\x04SELU"\xdf\x02\n\nActivatio' +
-        'n\x12#\n\x04relu\x18\x01 \x01(\x0b\x32\x13.second.protos.ReLUH\x00\x12.\n\nleaky_re' +
-        'lu\x18\x02 \x01(\x0b\x32\x18.second.protos.LeakyReLUH\x00\x12%\n\x05swish\x18\x03 \x01(\x0b\x32\x14.sec' +
-        'ond.protos.SwishH\x00\x12!\n\x03\x65lu\x18\x04 \x01(\x0b\x32\x12.second.protos.' +
-        'ELUH\x00\x12+\n\x08softplus\x18\x05 \x01(\x0b\x32\x17.second.protos.Softplus' +
-        'H\x00\x12+\n\x08softsign\x18\x06 \x01(\x0b\x32\x17.second.protos.SoftsignH\x00\x12%\n\x05r' +
-        'elu6\x18\x07 \x01(\x0b\x32\x14.second.protos.ReLU6H\x00\x12#\n\x04selu\x18\x08 \x01(\x0b\x32\x13.se' +
-        'cond.protos.SELUH\x00\x42\x0c\n\nactivationb\x06proto3'
+    serialized_pb=(
+        b'\n\x1fsecond/protos/activations.proto\x12\rsecond.protos"\x06\n\x04ReLU"\x1d\n\tLeakyReLU\x12'
+        b'\x10\n\x08leakness\x18\x01 \x01(\x02"\x07\n\x05Swish"\x14\n\x03ELU\x12\r\n\x05alpha\x18\x01 '
+        b'\x01(\x02"+\n\x08Softplus\x12\x0c\n\x04beta\x18\x01 \x01(\x02\x12\x11\n\tthreshold\x18\x02 '
+        b'\x01(\x02"\n\n\x08Softsign"\x07\n\x05ReLU6"\x06\n\x04SELU"\xdf\x02\n\nActivation\x12#\n\x04re'
+        b"lu\x18\x01 \x01(\x0b2\x13.second.protos.ReLUH\x00\x12.\n\nleaky_relu\x18\x02 \x01(\x0b2\x18.s"
+        b"econd.protos.LeakyReLUH\x00\x12%\n\x05swish\x18\x03 \x01(\x0b2\x14.second.protos.SwishH\x00"
+        b"\x12!\n\x03elu\x18\x04 \x01(\x0b2\x12.second.protos.ELUH\x00\x12+\n\x08softplus\x18\x05 \x01("
+        b"\x0b2\x17.second.protos.SoftplusH\x00\x12+\n\x08softsign\x18\x06 \x01(\x0b2\x17.second.protos"
+        b".SoftsignH\x00\x12%\n\x05relu6\x18\x07 \x01(\x0b2\x14.second.protos.ReLU6H\x00\x12#\n\x04selu"
+        b"\x18\x08 \x01(\x0b2\x13.second.protos.SELUH\x00B\x0c\n\nactivationb\x06proto3"
     ),
 )
 
@@ -1,14 +1,11 @@
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: second/protos/anchors.proto
 
-import sys
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
 from google.protobuf import reflection as _reflection
 from google.protobuf import symbol_database as _symbol_database
 
-_b = sys.version_info[0] < 3 and (lambda x: x) or (lambda x: x.encode("latin1"))
-
 # @@protoc_insertion_point(imports)
 
 _sym_db = _symbol_database.Default()
@@ -19,30 +16,28 @@ DESCRIPTOR = _descriptor.FileDescriptor(
     package="second.protos",
     syntax="proto3",
     serialized_options=None,
-    serialized_pb=_b(
-        '\n\x1bsecond/protos/anchors.proto\x12\rsecond.protos"\xa2\x01\n\x12\x41nchorGeneratorOld\x12\x12\n\nclas' +
-        's_name\x18\x01 \x01(\t\x12\x11\n\tbev_range\x18\x02 \x03(\x02\x12\x17\n\x0f\x61nchor_center' +
-        '_z\x18\x03 \x01(\x02\x12\x14\n\x0c\x61nchor_sizes\x18\x04 \x03(\x02\x12\x19\n\x11matched_thresh' +
-        'old\x18\x05 \x01(\x02\x12\x1b\n\x13unmatched_threshold\x18\x06 \x01(\x02"\xa7\x01\n\x15\x41nchor' +
-        'GeneratorStride\x12\x12\n\nclass_name\x18\x01 \x01(\t\x12\r\n\x05siz' +
-        'es\x18\x02 \x03(\x02\x12\x0f\n\x07strides\x18\x03 \x03(\x02\x12\x0f\n\x07offse' +
-        'ts\x18\x04 \x03(\x02\x12\x11\n\trotations\x18\x05 \x03(\x02\x12\x19\n\x11matched' +
-        '_threshold\x18\x06 \x01(\x02\x12\x1b\n\x13unmatched_threshold\x18\x07 \x01(\x02"\x9b\x01\n\x14\x41ncho' +
-        'rGeneratorRange\x12\x12\n\nclass_name\x18\x01 \x01(\t\x12\r\n\x05siz' +
-        'es\x18\x02 \x03(\x02\x12\x15\n\ranchor_ranges\x18\x03 \x03(\x02\x12\x11\n\tr' +
-        'otations\x18\x04 \x03(\x02\x12\x19\n\x11matched_threshold\x18\x05 \x01(\x02\x12\x1b\n\x13unmatch' +
-        'ed_threshold\x18\x06 \x01(\x02"\x82\x02\n\x19\x41nchorGeneratorCollection\x12G\n\x17\x61nchor_' +
-        'generator_stride\x18\x01 \x01(\x0b\x32$.second.protos.AnchorGeneratorSt' +
-        'rideH\x00\x12\x45\n\x16\x61nchor_generator_range\x18\x02 \x01(\x0b\x32#.second.pr' +
-        'otos.AnchorGeneratorRangeH\x00\x12\x41\n\x14\x61nchor_generator_' +
-        'old\x18\x03 \x01(\x0b\x32!.second.protos.AnchorGeneratorOldH\x00\x42\x12\n\x10\x61nchor' +
-        '_generator"\xa8\x01\n\x16\x41nchorGenerator_depara\x12\x12\n\nclass_' +
-        'name\x18\x01 \x01(\t\x12\r\n\x05sizes\x18\x02 \x03(\x02\x12\x0f\n\x07stride' +
-        's\x18\x03 \x03(\x02\x12\x0f\n\x07offsets\x18\x04 \x03(\x02\x12\x11\n\trot' +
-        'ations\x18\x05 \x03(\x02\x12\x19\n\x11matched_threshold\x18\x06 \x01(\x02\x12\x1b\n\x13un' +
-        'matched_threshold\x18\x07 \x01(\x02"z\n\x11\x41nchorGeneratorV1\x12\x17\n\x0f\x61nchor_' +
-        'center_z\x18\x01 \x01(\x02\x12\x14\n\x0c\x61nchor_sizes\x18\x02 \x03(\x02\x12\x19\n\x11matc' +
-        'hed_threshold\x18\x03 \x01(\x02\x12\x1b\n\x13unmatched_threshold\x18\x04 \x01(\x02\x62\x06proto3'
+    serialized_pb=(
+        b'\n\x1bsecond/protos/anchors.proto\x12\rsecond.protos"\xa2\x01\n\x12AnchorGeneratorOld\x12\x12'
+        b"\n\nclass_name\x18\x01 \x01(\t\x12\x11\n\tbev_range\x18\x02 \x03(\x02\x12\x17\n\x0fanchor_cen"
+        b"ter_z\x18\x03 \x01(\x02\x12\x14\n\x0canchor_sizes\x18\x04 \x03(\x02\x12\x19\n\x11matched_thre"
+        b'shold\x18\x05 \x01(\x02\x12\x1b\n\x13unmatched_threshold\x18\x06 \x01(\x02"\xa7\x01\n\x15Anch'
+        b"orGeneratorStride\x12\x12\n\nclass_name\x18\x01 \x01(\t\x12\r\n\x05sizes\x18\x02 \x03(\x02"
+        b"\x12\x0f\n\x07strides\x18\x03 \x03(\x02\x12\x0f\n\x07offsets\x18\x04 \x03(\x02\x12\x11\n\trot"
+        b"ations\x18\x05 \x03(\x02\x12\x19\n\x11matched_threshold\x18\x06 \x01(\x02\x12\x1b\n\x13unmatc"
+        b'hed_threshold\x18\x07 \x01(\x02"\x9b\x01\n\x14AnchorGeneratorRange\x12\x12\n\nclass_name\x18'
+        b"\x01 \x01(\t\x12\r\n\x05sizes\x18\x02 \x03(\x02\x12\x15\n\ranchor_ranges\x18\x03 \x03(\x02"
+        b"\x12\x11\n\trotations\x18\x04 \x03(\x02\x12\x19\n\x11matched_threshold\x18\x05 \x01(\x02\x12"
+        b'\x1b\n\x13unmatched_threshold\x18\x06 \x01(\x02"\x82\x02\n\x19AnchorGeneratorCollection\x12G'
+        b"\n\x17anchor_generator_stride\x18\x01 \x01(\x0b2$.second.protos.AnchorGeneratorStrideH\x00"
+        b"\x12E\n\x16anchor_generator_range\x18\x02 \x01(\x0b2#.second.protos.AnchorGeneratorRangeH\x00"
+        b"\x12A\n\x14anchor_generator_old\x18\x03 \x01(\x0b2!.second.protos.AnchorGeneratorOldH\x00B"
+        b'\x12\n\x10anchor_generator"\xa8\x01\n\x16AnchorGenerator_depara\x12\x12\n\nclass_name\x18\x01'
+        b" \x01(\t\x12\r\n\x05sizes\x18\x02 \x03(\x02\x12\x0f\n\x07strides\x18\x03 \x03(\x02\x12\x0f\n"
+        b"\x07offsets\x18\x04 \x03(\x02\x12\x11\n\trotations\x18\x05 \x03(\x02\x12\x19\n\x11matched_thr"
+        b'eshold\x18\x06 \x01(\x02\x12\x1b\n\x13unmatched_threshold\x18\x07 \x01(\x02"z\n\x11AnchorGene'
+        b"ratorV1\x12\x17\n\x0fanchor_center_z\x18\x01 \x01(\x02\x12\x14\n\x0canchor_sizes\x18\x02 \x03"
+        b"(\x02\x12\x19\n\x11matched_threshold\x18\x03 \x01(\x02\x12\x1b\n\x13unmatched_threshold\x18"
+        b"\x04 \x01(\x02b\x06proto3"
     ),
 )
 
@@ -63,7 +58,7 @@ _ANCHORGENERATOROLD = _descriptor.Descriptor(
             cpp_type=9,
             label=1,
             has_default_value=False,
-            default_value=_b("").decode("utf-8"),
+            default_value=b"".decode("utf-8"),
             message_type=None,
             enum_type=None,
             containing_type=None,
@@ -192,7 +187,7 @@ _ANCHORGENERATORSTRIDE = _descriptor.Descriptor(
             cpp_type=9,
             label=1,
             has_default_value=False,
-            default_value=_b("").decode("utf-8"),
+            default_value=b"".decode("utf-8"),
             message_type=None,
             enum_type=None,
             containing_type=None,
@@ -339,7 +334,7 @@ _ANCHORGENERATORRANGE = _descriptor.Descriptor(
             cpp_type=9,
             label=1,
             has_default_value=False,
-            default_value=_b("").decode("utf-8"),
+            default_value=b"".decode("utf-8"),
             message_type=None,
             enum_type=None,
             containing_type=None,
@@ -551,7 +546,7 @@ _ANCHORGENERATOR_DEPARA = _descriptor.Descriptor(
             cpp_type=9,
             label=1,
             has_default_value=False,
-            default_value=_b("").decode("utf-8"),
+            default_value=b"".decode("utf-8"),
             message_type=None,
             enum_type=None,
             containing_type=None,
@@ -1,14 +1,11 @@
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: second/protos/box_coder.proto
 
-import sys
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
 from google.protobuf import reflection as _reflection
 from google.protobuf import symbol_database as _symbol_database
 
-_b = sys.version_info[0] < 3 and (lambda x: x) or (lambda x: x.encode("latin1"))
-
 # @@protoc_insertion_point(imports)
 
 _sym_db = _symbol_database.Default()
@@ -18,15 +15,14 @@ DESCRIPTOR = _descriptor.FileDescriptor(
     package="second.protos",
     syntax="proto3",
     serialized_options=None,
-    serialized_pb=_b(
-        '\n\x1dsecond/protos/box_coder.proto\x12\rsecond.protos"\x8b\x01\n\x08\x42oxCo' +
-        'der\x12=\n\x12ground_box3d_coder\x18\x01 \x01(\x0b\x32\x1f.second.protos.GroundBox3dC' +
-        'oderH\x00\x12\x33\n\rbev_box_coder\x18\x02 \x01(\x0b\x32\x1a.second.protos.BevBoxCode' +
-        'rH\x00\x42\x0b\n\tbox_coder"C\n\x10GroundBox3dCoder\x12\x12\n\nlinear_dim\x18\x01 ' +
-        '\x01(\x08\x12\x1b\n\x13\x65ncode_angle_vector\x18\x02 \x01(\x08"`\n\x0b\x42\x65vBox' +
-        'Coder\x12\x12\n\nlinear_dim\x18\x01 \x01(\x08\x12\x1b\n\x13\x65ncode_angle_vecto' +
-        'r\x18\x02 \x01(\x08\x12\x0f\n\x07z_fixed\x18\x03 \x01(\x02\x12\x0f\n\x07h_fixe' +
-        'd\x18\x04 \x01(\x02\x62\x06proto3'
+    serialized_pb=(
+        b'\n\x1dsecond/protos/box_coder.proto\x12\rsecond.protos"\x8b\x01\n\x08BoxCoder\x12=\n\x12groun'
+        b"d_box3d_coder\x18\x01 \x01(\x0b2\x1f.second.protos.GroundBox3dCoderH\x00\x123\n\rbev_box_code"
+        b'r\x18\x02 \x01(\x0b2\x1a.second.protos.BevBoxCoderH\x00B\x0b\n\tbox_coder"C\n\x10GroundBox3dC'
+        b"oder\x12\x12\n\nlinear_dim\x18\x01 \x01(\x08\x12\x1b\n\x13encode_angle_vector\x18\x02 \x01("
+        b'\x08"`\n\x0bBevBoxCoder\x12\x12\n\nlinear_dim\x18\x01 \x01(\x08\x12\x1b\n\x13encode_angle_vec'
+        b"tor\x18\x02 \x01(\x08\x12\x0f\n\x07z_fixed\x18\x03 \x01(\x02\x12\x0f\n\x07h_fixed\x18\x04 "
+        b"\x01(\x02b\x06proto3"
     ),
 )
 
@@ -1,7 +1,6 @@
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: second/protos/input_reader.proto
 
-import sys
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
 from google.protobuf import reflection as _reflection
@@ -17,8 +16,6 @@ from opendr.perception.object_detection_3d.voxel_object_detection_3d.second_dete
     sampler_pb2 as second_dot_protos_dot_sampler__pb2,
 )
 
-_b = sys.version_info[0] < 3 and (lambda x: x) or (lambda x: x.encode("latin1"))
-
 # @@protoc_insertion_point(imports)
 
 _sym_db = _symbol_database.Default()
@@ -28,34 +25,26 @@ DESCRIPTOR = _descriptor.FileDescriptor(
     package="second.protos",
     syntax="proto3",
     serialized_options=None,
-    serialized_pb=_b(
-        '\n second/protos/input_reader.proto\x12\rsecond.protos\x1a\x1asecond/proto' +
-        's/target.proto\x1a\x1esecond/pr' +
-        'otos/preprocess.proto\x1a\x1bsecond/protos/sampler.proto"\xc7\x07\n\x0bInputR' +
-        'eader\x12\x18\n\x10record_file_pa' +
-        'th\x18\x01 \x01(\t\x12\x13\n\x0b\x63lass_names\x18\x02 \x03(\t\x12\x12\n\nbatch' +
-        '_size\x18\x03 \x01(\r\x12\x16\n\x0emax_n' +
-        'um_epochs\x18\x04 \x01(\r\x12\x15\n\rprefetch_size\x18\x05 \x01(\r\x12\x1c\n\x14max_n' +
-        'umber_of_voxels\x18\x06 \x01(\r\x12\x36\n\x0ftarge' +
-        't_assigner\x18\x07 \x01(\x0b\x32\x1d.second.protos.TargetAssigner\x12\x17\n\x0fkitti' +
-        '_info_path\x18\x08 \x01(\t\x12\x17\n\x0fkitti_ro' +
-        'ot_path\x18\t \x01(\t\x12\x16\n\x0eshuffle_points\x18\n \x01(\x08\x12*\n"groundtr' +
-        'uth_localization_noise_std\x18\x0b \x03(\x02\x12*\n"groundt' +
-        'ruth_rotation_uniform_noise\x18\x0c \x03(\x02\x12%\n\x1dglobal_rotation_uniform_' +
-        'noise\x18\r \x03(\x02\x12$\n\x1cglobal_scaling_uniform_n' +
-        'oise\x18\x0e \x03(\x02\x12\x1f\n\x17remove_unknown_examples\x18\x0f \x01(\x08\x12\x13\n\x0bnu' +
-        'm_workers\x18\x10 \x01(\r\x12\x1d\n\x15\x61nch' +
-        'or_area_threshold\x18\x11 \x01(\x02\x12"\n\x1aremove_points_after_sample\x18\x12 \x01(\x08\x12*\n"g' +
-        'roundtruth_points_drop_percenta' +
-        'ge\x18\x13 \x01(\x02\x12(\n groundtruth_drop_max_keep_points\x18\x14 \x01(\r\x12\x1a\n\x12remov' +
-        'e_environment\x18\x15 \x01(\x08\x12\x1a\n\x12u' +
-        'nlabeled_training\x18\x16 \x01(\x08\x12/\n\'global_random_rotation_range_per_obj' +
-        'ect\x18\x17 \x03(\x02\x12\x45\n\x13\x64\x61tabase_prep' +
-        '_steps\x18\x18 \x03(\x0b\x32(.second.protos.DatabasePreproces' +
-        'singStep\x12\x30\n\x10\x64\x61tabase_sampler\x18\x19 \x01(\x0b\x32\x16.sec' +
-        'ond.protos.Sampler\x12\x14\n\x0cuse_group_id\x18\x1a \x01(\x08\x12:\n\x1aunla' +
-        'beled_database_sampler\x18\x1b \x01(\x0b\x32\x16.second.p' +
-        'rotos.Samplerb\x06proto3'
+    serialized_pb=(
+        b"\n second/protos/input_reader.proto\x12\rsecond.protos\x1a\x1asecond/protos/target.proto\x1a"
+        b'\x1esecond/protos/preprocess.proto\x1a\x1bsecond/protos/sampler.proto"\xc7\x07\n\x0bInputRead'
+        b"er\x12\x18\n\x10record_file_path\x18\x01 \x01(\t\x12\x13\n\x0bclass_names\x18\x02 \x03(\t\x12"
+        b"\x12\n\nbatch_size\x18\x03 \x01(\r\x12\x16\n\x0emax_num_epochs\x18\x04 \x01(\r\x12\x15\n\rpre"
+        b"fetch_size\x18\x05 \x01(\r\x12\x1c\n\x14max_number_of_voxels\x18\x06 \x01(\r\x126\n\x0ftarget"
+        b"_assigner\x18\x07 \x01(\x0b2\x1d.second.protos.TargetAssigner\x12\x17\n\x0fkitti_info_path"
+        b"\x18\x08 \x01(\t\x12\x17\n\x0fkitti_root_path\x18\t \x01(\t\x12\x16\n\x0eshuffle_points\x18\n"
+        b' \x01(\x08\x12*\n"groundtruth_localization_noise_std\x18\x0b \x03(\x02\x12*\n"groundtruth_rot'
+        b"ation_uniform_noise\x18\x0c \x03(\x02\x12%\n\x1dglobal_rotation_uniform_noise\x18\r \x03(\x02"
+        b"\x12$\n\x1cglobal_scaling_uniform_noise\x18\x0e \x03(\x02\x12\x1f\n\x17remove_unknown_example"
+        b"s\x18\x0f \x01(\x08\x12\x13\n\x0bnum_workers\x18\x10 \x01(\r\x12\x1d\n\x15anchor_area_thresho"
+        b'ld\x18\x11 \x01(\x02\x12"\n\x1aremove_points_after_sample\x18\x12 \x01(\x08\x12*\n"groundtrut'
+        b"h_points_drop_percentage\x18\x13 \x01(\x02\x12(\n groundtruth_drop_max_keep_points\x18\x14 "
+        b"\x01(\r\x12\x1a\n\x12remove_environment\x18\x15 \x01(\x08\x12\x1a\n\x12unlabeled_training\x18"
+        b"\x16 \x01(\x08\x12/\n'global_random_rotation_range_per_object\x18\x17 \x03(\x02\x12E\n\x13dat"
+        b"abase_prep_steps\x18\x18 \x03(\x0b2(.second.protos.DatabasePreprocessingStep\x120\n\x10databa"
+        b"se_sampler\x18\x19 \x01(\x0b2\x16.second.protos.Sampler\x12\x14\n\x0cuse_group_id\x18\x1a "
+        b"\x01(\x08\x12:\n\x1aunlabeled_database_sampler\x18\x1b \x01(\x0b2\x16.second.protos.Samplerb"
+        b"\x06proto3"
     ),
     dependencies=[
         second_dot_protos_dot_target__pb2.DESCRIPTOR,
@@ -81,7 +70,7 @@ _INPUTREADER = _descriptor.Descriptor(
             cpp_type=9,
             label=1,
             has_default_value=False,
-            default_value=_b("").decode("utf-8"),
+            default_value=b"".decode("utf-8"),
             message_type=None,
             enum_type=None,
             containing_type=None,
@@ -207,7 +196,7 @@ _INPUTREADER = _descriptor.Descriptor(
             cpp_type=9,
             label=1,
             has_default_value=False,
-            default_value=_b("").decode("utf-8"),
+            default_value=b"".decode("utf-8"),
             message_type=None,
             enum_type=None,
             containing_type=None,
@@ -225,7 +214,7 @@ _INPUTREADER = _descriptor.Descriptor(
             cpp_type=9,
             label=1,
             has_default_value=False,
-            default_value=_b("").decode("utf-8"),
+            default_value=b"".decode("utf-8"),
             message_type=None,
             enum_type=None,
             containing_type=None,
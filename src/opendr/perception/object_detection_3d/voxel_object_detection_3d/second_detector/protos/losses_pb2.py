@@ -1,14 +1,11 @@
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: second/protos/losses.proto
 
-import sys
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
 from google.protobuf import reflection as _reflection
 from google.protobuf import symbol_database as _symbol_database
 
-_b = sys.version_info[0] < 3 and (lambda x: x) or (lambda x: x.encode("latin1"))
-
 # @@protoc_insertion_point(imports)
 
 _sym_db = _symbol_database.Default()
@@ -19,40 +16,37 @@ DESCRIPTOR = _descriptor.FileDescriptor(
     package="second.protos",
     syntax="proto3",
     serialized_options=None,
-    serialized_pb=_b(
-        '\n\x1asecond/protos/losses.proto\x12\rsecond.protos"\xfb\x01\n\x04Loss\x12:\n\x11localiza' +
-        'tion_loss\x18\x01 \x01(\x0b\x32\x1f.second.protos.LocalizationLoss\x12>\n\x13\x63lassification_l' +
-        'oss\x18\x02 \x01(\x0b\x32!.second.protos.ClassificationLoss\x12;\n\x12hard_example_mine' +
-        'r\x18\x03 \x01(\x0b\x32\x1f.second.protos.HardExampleMiner\x12\x1d\n\x15\x63lassification_' +
-        'weight\x18\x04 \x01(\x02\x12\x1b\n\x13localization_weight\x18\x05 \x01(\x02"\xd9\x01\n\x10Locali' +
-        'zationLoss\x12@\n\x0bweighted_l2\x18\x01 \x01(\x0b\x32).second.protos.WeightedL2Localization' +
-        'LossH\x00\x12M\n\x12weighted_smooth_l1\x18\x02 \x01(\x0b\x32/.second.protos.WeightedSmoothL1L' +
-        'ocalizationLossH\x00\x12\x1f\n\x17\x65ncode_rad_error_by_sin\x18\x03 \x01(\x08\x42\x13\n\x11local' +
-        'ization_loss"L\n\x1aWeightedL2LocalizationLoss\x12\x19\n\x11\x61nchorwise_out' +
-        'put\x18\x01 \x01(\x08\x12\x13\n\x0b\x63ode_weight\x18\x02 \x03(\x02"a\n WeightedSmoothL1Loc' +
-        'alizationLoss\x12\x19\n\x11\x61nchorwise_output\x18\x01 \x01(\x08\x12\r\n\x05sigm' +
-        'a\x18\x02 \x01(\x02\x12\x13\n\x0b\x63ode_weight\x18\x03 \x03(\x02"\xbf\x03\n\x12\x43lassif' +
-        'icationLoss\x12L\n\x10weighted_sigmoid\x18\x01 \x01(\x0b\x32\x30.second.protos.WeightedSigm' +
-        'oidClassificationLossH\x00\x12L\n\x10weighted_softmax\x18\x02 \x01(\x0b\x32\x30.second.pr' +
-        'otos.WeightedSoftmaxClassificationLossH\x00\x12T\n\x14\x62ootstrapped_sigmoid\x18\x03 \x01(\x0b\x32\x34.s' +
-        'econd.protos.BootstrappedSigmoidClassificationLossH\x00\x12O\n\x16weighted_sigmoid_foc' +
-        'al\x18\x04 \x01(\x0b\x32-.second.protos.SigmoidFocalClassificationLossH\x00\x12O\n\x16weight' +
-        'ed_softmax_focal\x18\x05 \x01(\x0b\x32-.second.protos.SoftmaxFocalClassification' +
-        'LossH\x00\x42\x15\n\x13\x63lassification_loss">\n!WeightedSigmoidClassification' +
-        'Loss\x12\x19\n\x11\x61nchorwise_output\x18\x01 \x01(\x08"Y\n\x1eSigmoidFocalCla' +
-        'ssificationLoss\x12\x19\n\x11\x61nchorwise_output\x18\x01 \x01(\x08\x12\r\n\x05ga' +
-        'mma\x18\x02 \x01(\x02\x12\r\n\x05\x61lpha\x18\x03 \x01(\x02"Y\n\x1eSoftmaxFocalClassi' +
-        'ficationLoss\x12\x19\n\x11\x61nchorwise_output\x18\x01 \x01(\x08\x12\r\n\x05gam' +
-        'ma\x18\x02 \x01(\x02\x12\r\n\x05\x61lpha\x18\x03 \x01(\x02"S\n!WeightedSoftmaxClas' +
-        'sificationLoss\x12\x19\n\x11\x61nchorwise_output\x18\x01 \x01(\x08\x12\x13\n\x0blogit_' +
-        'scale\x18\x02 \x01(\x02"i\n%BootstrappedSigmoidClassificationLoss\x12\r\n\x05\x61lp' +
-        'ha\x18\x01 \x01(\x02\x12\x16\n\x0ehard_bootstrap\x18\x02 \x01(\x08\x12\x19\n\x11\x61ncho' +
-        'rwise_output\x18\x03 \x01(\x08"\x82\x02\n\x10HardExampleMiner\x12\x19\n\x11num_hard_exa' +
-        'mples\x18\x01 \x01(\x05\x12\x15\n\riou_threshold\x18\x02 \x01(\x02\x12;\n\tloss_' +
-        'type\x18\x03 \x01(\x0e\x32(.second.protos.HardExampleMiner.LossType\x12"\n\x1amax_negativ' +
-        'es_per_positive\x18\x04 \x01(\x05\x12\x1f\n\x17min_negatives_per_image\x18\x05 \x01(\x05":\n\x08Los' +
-        'sType\x12\x08\n\x04\x42OTH\x10\x00\x12\x12\n\x0e\x43LASSIFICATI' +
-        'ON\x10\x01\x12\x10\n\x0cLOCALIZATION\x10\x02\x62\x06proto3'
+    serialized_pb=(
+        b'\n\x1asecond/protos/losses.proto\x12\rsecond.protos"\xfb\x01\n\x04Loss\x12:\n\x11localization'
+        b"_loss\x18\x01 \x01(\x0b2\x1f.second.protos.LocalizationLoss\x12>\n\x13classification_loss\x18"
+        b"\x02 \x01(\x0b2!.second.protos.ClassificationLoss\x12;\n\x12hard_example_miner\x18\x03 \x01("
+        b"\x0b2\x1f.second.protos.HardExampleMiner\x12\x1d\n\x15classification_weight\x18\x04 \x01(\x02"
+        b'\x12\x1b\n\x13localization_weight\x18\x05 \x01(\x02"\xd9\x01\n\x10LocalizationLoss\x12@\n\x0b'
+        b"weighted_l2\x18\x01 \x01(\x0b2).second.protos.WeightedL2LocalizationLossH\x00\x12M\n\x12weigh"
+        b"ted_smooth_l1\x18\x02 \x01(\x0b2/.second.protos.WeightedSmoothL1LocalizationLossH\x00\x12\x1f"
+        b'\n\x17encode_rad_error_by_sin\x18\x03 \x01(\x08B\x13\n\x11localization_loss"L\n\x1aWeightedL2'
+        b"LocalizationLoss\x12\x19\n\x11anchorwise_output\x18\x01 \x01(\x08\x12\x13\n\x0bcode_weight"
+        b'\x18\x02 \x03(\x02"a\n WeightedSmoothL1LocalizationLoss\x12\x19\n\x11anchorwise_output\x18'
+        b'\x01 \x01(\x08\x12\r\n\x05sigma\x18\x02 \x01(\x02\x12\x13\n\x0bcode_weight\x18\x03 \x03(\x02"'
+        b"\xbf\x03\n\x12ClassificationLoss\x12L\n\x10weighted_sigmoid\x18\x01 \x01(\x0b20.second.protos"
+        b".WeightedSigmoidClassificationLossH\x00\x12L\n\x10weighted_softmax\x18\x02 \x01(\x0b20.second"
+        b".protos.WeightedSoftmaxClassificationLossH\x00\x12T\n\x14bootstrapped_sigmoid\x18\x03 \x01("
+        b"\x0b24.second.protos.BootstrappedSigmoidClassificationLossH\x00\x12O\n\x16weighted_sigmoid_fo"
+        b"cal\x18\x04 \x01(\x0b2-.second.protos.SigmoidFocalClassificationLossH\x00\x12O\n\x16weighted_"
+        b"softmax_focal\x18\x05 \x01(\x0b2-.second.protos.SoftmaxFocalClassificationLossH\x00B\x15\n"
+        b'\x13classification_loss">\n!WeightedSigmoidClassificationLoss\x12\x19\n\x11anchorwise_output'
+        b'\x18\x01 \x01(\x08"Y\n\x1eSigmoidFocalClassificationLoss\x12\x19\n\x11anchorwise_output\x18'
+        b'\x01 \x01(\x08\x12\r\n\x05gamma\x18\x02 \x01(\x02\x12\r\n\x05alpha\x18\x03 \x01(\x02"Y\n\x1eS'
+        b"oftmaxFocalClassificationLoss\x12\x19\n\x11anchorwise_output\x18\x01 \x01(\x08\x12\r\n\x05gam"
+        b'ma\x18\x02 \x01(\x02\x12\r\n\x05alpha\x18\x03 \x01(\x02"S\n!WeightedSoftmaxClassificationLoss'
+        b'\x12\x19\n\x11anchorwise_output\x18\x01 \x01(\x08\x12\x13\n\x0blogit_scale\x18\x02 \x01(\x02"'
+        b"i\n%BootstrappedSigmoidClassificationLoss\x12\r\n\x05alpha\x18\x01 \x01(\x02\x12\x16\n\x0ehar"
+        b'd_bootstrap\x18\x02 \x01(\x08\x12\x19\n\x11anchorwise_output\x18\x03 \x01(\x08"\x82\x02\n\x10'
+        b"HardExampleMiner\x12\x19\n\x11num_hard_examples\x18\x01 \x01(\x05\x12\x15\n\riou_threshold"
+        b"\x18\x02 \x01(\x02\x12;\n\tloss_type\x18\x03 \x01(\x0e2(.second.protos.HardExampleMiner.LossT"
+        b'ype\x12"\n\x1amax_negatives_per_positive\x18\x04 \x01(\x05\x12\x1f\n\x17min_negatives_per_ima'
+        b'ge\x18\x05 \x01(\x05":\n\x08LossType\x12\x08\n\x04BOTH\x10\x00\x12\x12\n\x0eCLASSIFICATION'
+        b"\x10\x01\x12\x10\n\x0cLOCALIZATION\x10\x02b\x06proto3"
     ),
 )
 
@@ -1,14 +1,11 @@
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: second/protos/optimizer.proto
 
-import sys
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
 from google.protobuf import reflection as _reflection
 from google.protobuf import symbol_database as _symbol_database
 
-_b = sys.version_info[0] < 3 and (lambda x: x) or (lambda x: x.encode("latin1"))
-
 # @@protoc_insertion_point(imports)
 
 _sym_db = _symbol_database.Default()
@@ -18,39 +15,33 @@ DESCRIPTOR = _descriptor.FileDescriptor(
     package="second.protos",
     syntax="proto3",
     serialized_options=None,
-    serialized_pb=_b(
-        '\n\x1dsecond/protos/optimizer.proto\x12\rsecond.protos"\x89\x02\n\tOptimiz' +
-        'er\x12=\n\x12rms_prop_optimizer\x18\x01 \x01(\x0b\x32\x1f.second.protos.RMSPropOp' +
-        'timizerH\x00\x12>\n\x12momentum_optimizer\x18\x02 \x01(\x0b\x32 .second.protos.M' +
-        'omentumOptimizerH\x00\x12\x36\n\x0e\x61\x64\x61m_optimizer\x18\x03 \x01(\x0b\x32\x1c.sec' +
-        'ond.protos.AdamOptimizerH\x00\x12\x1a\n\x12use_moving_avera' +
-        'ge\x18\x04 \x01(\x08\x12\x1c\n\x14moving_average_decay\x18\x05 \x01(\x02\x42\x0b\n\toptimi' +
-        'zer"\x9e\x01\n\x10RMSPropOptimizer\x12\x32\n\rlearning_rate\x18\x01 \x01(\x0b\x32\x1b.s' +
-        'econd.protos.LearningRate\x12 \n\x18momentum_optimizer_va' +
-        'lue\x18\x02 \x01(\x02\x12\r\n\x05\x64\x65\x63\x61y\x18\x03 \x01(\x02\x12\x0f\n\x07\x65psilo' +
-        'n\x18\x04 \x01(\x02\x12\x14\n\x0cweight_decay\x18\x05 \x01(\x02"\x7f\n\x11Mom' +
-        'entumOptimizer\x12\x32\n\rlearning_rate\x18\x01 \x01(\x0b\x32\x1b.second.protos' +
-        '.LearningRate\x12 \n\x18momentum_optimizer_value\x18\x02 \x01(\x02\x12\x14\n\x0cwe' +
-        'ight_decay\x18\x03 \x01(\x02"Y\n\rAdamOptimizer\x12\x32\n\rlearning_rat' +
-        'e\x18\x01 \x01(\x0b\x32\x1b.second.protos.LearningRate\x12\x14\n\x0cweight_d' +
-        'ecay\x18\x02 \x01(\x02"\xd8\x02\n\x0cLearningRate\x12\x45\n\x16\x63onstant' +
-        '_learning_rate\x18\x01 \x01(\x0b\x32#.second.protos.ConstantLearningR' +
-        'ateH\x00\x12V\n\x1f\x65xponential_decay_learning_rate\x18\x02 \x01(\x0b\x32+.secon' +
-        'd.protos.ExponentialDecayLearningRateH\x00\x12J\n\x19manual_step_learning_rat' +
-        'e\x18\x03 \x01(\x0b\x32%.second.protos.ManualStepLearningRateH\x00\x12L\n\x1a\x63osine' +
-        '_decay_learning_rate\x18\x04 \x01(\x0b\x32&.second.protos.CosineDecayLearning' +
-        'RateH\x00\x42\x0f\n\rlearning_rate"-\n\x14\x43onstantLearningRate\x12\x15\n\rlea' +
-        'rning_rate\x18\x01 \x01(\x02"{\n\x1c\x45xponentialDecayLearningRate\x12\x1d\n\x15ini' +
-        'tial_learning_rate\x18\x01 \x01(\x02\x12\x13\n\x0b\x64\x65\x63\x61y_st' +
-        'eps\x18\x02 \x01(\r\x12\x14\n\x0c\x64\x65\x63\x61y_factor\x18\x03 \x01(\x02\x12\x11\n\tsta' +
-        'ircase\x18\x04 \x01(\x08"\xc2\x01\n\x16ManualStepLearningRate\x12\x1d\n\x15initia' +
-        'l_learning_rate\x18\x01 \x01(\x02\x12L\n\x08schedule\x18\x02 \x03(\x0b\x32:.second' +
-        '.protos.ManualStepLearningRate.LearningRateSchedule\x1a;\n\x14LearningRateSc' +
-        'hedule\x12\x0c\n\x04step\x18\x01 \x01(\r\x12\x15\n\rlearning_' +
-        'rate\x18\x02 \x01(\x02"~\n\x17\x43osineDecayLearningRate\x12\x1a\n\x12lea' +
-        'rning_rate_base\x18\x01 \x01(\x02\x12\x13\n\x0btotal_step' +
-        's\x18\x02 \x01(\r\x12\x1c\n\x14warmup_learning_rate\x18\x03 \x01(\x02\x12\x14\n\x0cwarmup' +
-        '_steps\x18\x04 \x01(\rb\x06proto3'
+    serialized_pb=(
+        b'\n\x1dsecond/protos/optimizer.proto\x12\rsecond.protos"\x89\x02\n\tOptimizer\x12=\n\x12rms_pr'
+        b"op_optimizer\x18\x01 \x01(\x0b2\x1f.second.protos.RMSPropOptimizerH\x00\x12>\n\x12momentum_op"
+        b"timizer\x18\x02 \x01(\x0b2 .second.protos.MomentumOptimizerH\x00\x126\n\x0eadam_optimizer\x18"
+        b"\x03 \x01(\x0b2\x1c.second.protos.AdamOptimizerH\x00\x12\x1a\n\x12use_moving_average\x18\x04 "
+        b'\x01(\x08\x12\x1c\n\x14moving_average_decay\x18\x05 \x01(\x02B\x0b\n\toptimizer"\x9e\x01\n'
+        b"\x10RMSPropOptimizer\x122\n\rlearning_rate\x18\x01 \x01(\x0b2\x1b.second.protos.LearningRate"
+        b"\x12 \n\x18momentum_optimizer_value\x18\x02 \x01(\x02\x12\r\n\x05decay\x18\x03 \x01(\x02\x12"
+        b'\x0f\n\x07epsilon\x18\x04 \x01(\x02\x12\x14\n\x0cweight_decay\x18\x05 \x01(\x02"\x7f\n\x11Mom'
+        b"entumOptimizer\x122\n\rlearning_rate\x18\x01 \x01(\x0b2\x1b.second.protos.LearningRate\x12 \n"
+        b'\x18momentum_optimizer_value\x18\x02 \x01(\x02\x12\x14\n\x0cweight_decay\x18\x03 \x01(\x02"Y'
+        b"\n\rAdamOptimizer\x122\n\rlearning_rate\x18\x01 \x01(\x0b2\x1b.second.protos.LearningRate\x12"
+        b'\x14\n\x0cweight_decay\x18\x02 \x01(\x02"\xd8\x02\n\x0cLearningRate\x12E\n\x16constant_learni'
+        b"ng_rate\x18\x01 \x01(\x0b2#.second.protos.ConstantLearningRateH\x00\x12V\n\x1fexponential_dec"
+        b"ay_learning_rate\x18\x02 \x01(\x0b2+.second.protos.ExponentialDecayLearningRateH\x00\x12J\n"
+        b"\x19manual_step_learning_rate\x18\x03 \x01(\x0b2%.second.protos.ManualStepLearningRateH\x00"
+        b"\x12L\n\x1acosine_decay_learning_rate\x18\x04 \x01(\x0b2&.second.protos.CosineDecayLearningRa"
+        b'teH\x00B\x0f\n\rlearning_rate"-\n\x14ConstantLearningRate\x12\x15\n\rlearning_rate\x18\x01 '
+        b'\x01(\x02"{\n\x1cExponentialDecayLearningRate\x12\x1d\n\x15initial_learning_rate\x18\x01 \x01'
+        b"(\x02\x12\x13\n\x0bdecay_steps\x18\x02 \x01(\r\x12\x14\n\x0cdecay_factor\x18\x03 \x01(\x02"
+        b'\x12\x11\n\tstaircase\x18\x04 \x01(\x08"\xc2\x01\n\x16ManualStepLearningRate\x12\x1d\n\x15ini'
+        b"tial_learning_rate\x18\x01 \x01(\x02\x12L\n\x08schedule\x18\x02 \x03(\x0b2:.second.protos.Man"
+        b"ualStepLearningRate.LearningRateSchedule\x1a;\n\x14LearningRateSchedule\x12\x0c\n\x04step\x18"
+        b'\x01 \x01(\r\x12\x15\n\rlearning_rate\x18\x02 \x01(\x02"~\n\x17CosineDecayLearningRate\x12'
+        b"\x1a\n\x12learning_rate_base\x18\x01 \x01(\x02\x12\x13\n\x0btotal_steps\x18\x02 \x01(\r\x12"
+        b"\x1c\n\x14warmup_learning_rate\x18\x03 \x01(\x02\x12\x14\n\x0cwarmup_steps\x18\x04 \x01(\rb"
+        b"\x06proto3"
     ),
 )
 
@@ -1,14 +1,11 @@
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: second/protos/preprocess.proto
 
-import sys
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
 from google.protobuf import reflection as _reflection
 from google.protobuf import symbol_database as _symbol_database
 
-_b = sys.version_info[0] < 3 and (lambda x: x) or (lambda x: x.encode("latin1"))
-
 # @@protoc_insertion_point(imports)
 
 _sym_db = _symbol_database.Default()
@@ -19,26 +16,25 @@ DESCRIPTOR = _descriptor.FileDescriptor(
     package="second.protos",
     syntax="proto3",
     serialized_options=None,
-    serialized_pb=_b(
-        '\n\x1esecond/protos/preprocess.proto\x12\rsecond.protos"\xb1\x02\n\nPreprocess\x12&\n\x1era' +
-        'ndom_global_rotation_min_rad\x18\x01 \x01(\x02\x12&\n\x1erandom_global_rotation_max_r' +
-        'ad\x18\x02 \x01(\x02\x12!\n\x19random_global_scaling_min\x18\x03 \x01(\x02\x12!\n\x19random_gl' +
-        'obal_scaling_max\x18\x04 \x01(\x02\x12,\n$random_noise_per_groundtruth_min_rad\x18\x05 \x01(\x02\x12,\n$random' +
-        '_noise_per_groundtruth_max_rad\x18\x06 \x01(\x02\x12\x31\n)random_noise_per_groundtruth_po' +
-        'sition_std\x18\x07 \x01(\x02"\xd6\x01\n\x19\x44\x61tabasePreprocessingStep\x12\x43\n\x14\x66ilter_' +
-        'by_difficulty\x18\x01 \x01(\x0b\x32#.second.protos.DBFilterByDifficultyH\x00\x12U\n\x18\x66ilte' +
-        'r_by_min_num_points\x18\x02 \x01(\x0b\x32\x31.second.protos.DBFilterByMinNumPointInGroundTru' +
-        'thH\x00\x42\x1d\n\x1b\x64\x61tabase_preprocessing_step"4\n\x14\x44\x42\x46ilterByDiff' +
-        'iculty\x12\x1c\n\x14removed_difficulties\x18\x01 \x03(\x05"\xc3\x01\n"DBFilterByMinNumPo' +
-        'intInGroundTruth\x12\x64\n\x13min_num_point_pairs\x18\x01 \x03(\x0b\x32G.second.protos.DBF' +
-        'ilterByMinNumPointInGroundTruth.MinNumPointPairsEntry\x1a\x37\n\x15MinNumPointPairsE' +
-        'ntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\r:\x02\x38\x01"\xb5\x01\n\x11P' +
-        'reprocessingStep\x12\x43\n\x15random_global_scaling\x18\x01 \x01(\x0b\x32".second.pr' +
-        'otos.RandomGlobalScalingH\x00\x12\x45\n\x16random_global_rotation\x18\x02 \x01(\x0b\x32#.secon' +
-        'd.protos.RandomGlobalRotationH\x00\x42\x14\n\x12preprocessing_step";\n\x13RandomGloba' +
-        'lScaling\x12\x11\n\tmin_scale\x18\x01 \x01(\x02\x12\x11\n\tmax_scale\x18\x02 \x01(\x02"8\n\x14Rand' +
-        'omGlobalRotation\x12\x0f\n\x07min_rad\x18\x01 \x01(\x02\x12\x0f\n\x07ma' +
-        'x_rad\x18\x02 \x01(\x02\x62\x06proto3'
+    serialized_pb=(
+        b'\n\x1esecond/protos/preprocess.proto\x12\rsecond.protos"\xb1\x02\n\nPreprocess\x12&\n\x1erand'
+        b"om_global_rotation_min_rad\x18\x01 \x01(\x02\x12&\n\x1erandom_global_rotation_max_rad\x18\x02"
+        b" \x01(\x02\x12!\n\x19random_global_scaling_min\x18\x03 \x01(\x02\x12!\n\x19random_global_scal"
+        b"ing_max\x18\x04 \x01(\x02\x12,\n$random_noise_per_groundtruth_min_rad\x18\x05 \x01(\x02\x12,"
+        b"\n$random_noise_per_groundtruth_max_rad\x18\x06 \x01(\x02\x121\n)random_noise_per_groundtruth"
+        b'_position_std\x18\x07 \x01(\x02"\xd6\x01\n\x19DatabasePreprocessingStep\x12C\n\x14filter_by_d'
+        b"ifficulty\x18\x01 \x01(\x0b2#.second.protos.DBFilterByDifficultyH\x00\x12U\n\x18filter_by_min"
+        b"_num_points\x18\x02 \x01(\x0b21.second.protos.DBFilterByMinNumPointInGroundTruthH\x00B\x1d\n"
+        b'\x1bdatabase_preprocessing_step"4\n\x14DBFilterByDifficulty\x12\x1c\n\x14removed_difficulties'
+        b'\x18\x01 \x03(\x05"\xc3\x01\n"DBFilterByMinNumPointInGroundTruth\x12d\n\x13min_num_point_pair'
+        b"s\x18\x01 \x03(\x0b2G.second.protos.DBFilterByMinNumPointInGroundTruth.MinNumPointPairsEntry"
+        b"\x1a7\n\x15MinNumPointPairsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 "
+        b'\x01(\r:\x028\x01"\xb5\x01\n\x11PreprocessingStep\x12C\n\x15random_global_scaling\x18\x01 '
+        b'\x01(\x0b2".second.protos.RandomGlobalScalingH\x00\x12E\n\x16random_global_rotation\x18\x02 '
+        b'\x01(\x0b2#.second.protos.RandomGlobalRotationH\x00B\x14\n\x12preprocessing_step";\n\x13Rando'
+        b'mGlobalScaling\x12\x11\n\tmin_scale\x18\x01 \x01(\x02\x12\x11\n\tmax_scale\x18\x02 \x01(\x02"'
+        b"8\n\x14RandomGlobalRotation\x12\x0f\n\x07min_rad\x18\x01 \x01(\x02\x12\x0f\n\x07max_rad\x18"
+        b"\x02 \x01(\x02b\x06proto3"
     ),
 )
 
@@ -310,7 +306,7 @@ _DBFILTERBYMINNUMPOINTINGROUNDTRUTH_MINNUMPOINTPAIRSENTRY = _descriptor.Descript
             cpp_type=9,
             label=1,
             has_default_value=False,
-            default_value=_b("").decode("utf-8"),
+            default_value=b"".decode("utf-8"),
             message_type=None,
             enum_type=None,
             containing_type=None,
@@ -341,7 +337,7 @@ _DBFILTERBYMINNUMPOINTINGROUNDTRUTH_MINNUMPOINTPAIRSENTRY = _descriptor.Descript
     extensions=[],
     nested_types=[],
     enum_types=[],
-    serialized_options=_b("8\001"),
+    serialized_options=b"8\x01",
     is_extendable=False,
     syntax="proto3",
     extension_ranges=[],
@@ -1,7 +1,6 @@
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: second/protos/sampler.proto
 
-import sys
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
 from google.protobuf import reflection as _reflection
@@ -11,8 +10,6 @@ from opendr.perception.object_detection_3d.voxel_object_detection_3d.second_dete
     preprocess_pb2 as second_dot_protos_dot_preprocess__pb2,
 )
 
-_b = sys.version_info[0] < 3 and (lambda x: x) or (lambda x: x.encode("latin1"))
-
 # @@protoc_insertion_point(imports)
 
 _sym_db = _symbol_database.Default()
@@ -22,15 +19,14 @@ DESCRIPTOR = _descriptor.FileDescriptor(
     package="second.protos",
     syntax="proto3",
     serialized_options=None,
-    serialized_pb=_b(
-        '\n\x1bsecond/protos/sampler.proto\x12\rsecond.protos\x1a\x1esecond/protos/preprocess.p' +
-        'roto"}\n\x05Group\x12?\n\x0fname_to_max_num\x18\x01 \x03(\x0b\x32&.second.protos.Group.NameT' +
-        'oMaxNumEntry\x1a\x33\n\x11NameToMaxNumEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05val' +
-        'ue\x18\x02 \x01(\r:\x02\x38\x01"\xd8\x01\n\x07Sampler\x12\x1a\n\x12\x64\x61tabase_info_p' +
-        'ath\x18\x01 \x01(\t\x12+\n\rsample_groups\x18\x02 \x03(\x0b\x32\x14.second.protos.G' +
-        'roup\x12\x45\n\x13\x64\x61tabase_prep_steps\x18\x03 \x03(\x0b\x32(.second.protos.DatabasePr' +
-        'eprocessingStep\x12/\n\'global_random_rotation_range_per_obje' +
-        'ct\x18\x04 \x03(\x02\x12\x0c\n\x04rate\x18\x05 \x01(\x02\x62\x06proto3'
+    serialized_pb=(
+        b'\n\x1bsecond/protos/sampler.proto\x12\rsecond.protos\x1a\x1esecond/protos/preprocess.proto"}'
+        b"\n\x05Group\x12?\n\x0fname_to_max_num\x18\x01 \x03(\x0b2&.second.protos.Group.NameToMaxNumEnt"
+        b"ry\x1a3\n\x11NameToMaxNumEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01"
+        b'(\r:\x028\x01"\xd8\x01\n\x07Sampler\x12\x1a\n\x12database_info_path\x18\x01 \x01(\t\x12+\n\rs'
+        b"ample_groups\x18\x02 \x03(\x0b2\x14.second.protos.Group\x12E\n\x13database_prep_steps\x18\x03"
+        b" \x03(\x0b2(.second.protos.DatabasePreprocessingStep\x12/\n'global_random_rotation_range_per_"
+        b"object\x18\x04 \x03(\x02\x12\x0c\n\x04rate\x18\x05 \x01(\x02b\x06proto3"
     ),
     dependencies=[second_dot_protos_dot_preprocess__pb2.DESCRIPTOR],
 )
@@ -52,7 +48,7 @@ _GROUP_NAMETOMAXNUMENTRY = _descriptor.Descriptor(
             cpp_type=9,
             label=1,
             has_default_value=False,
-            default_value=_b("").decode("utf-8"),
+            default_value=b"".decode("utf-8"),
             message_type=None,
             enum_type=None,
             containing_type=None,
@@ -83,7 +79,7 @@ _GROUP_NAMETOMAXNUMENTRY = _descriptor.Descriptor(
     extensions=[],
     nested_types=[],
     enum_types=[],
-    serialized_options=_b("8\001"),
+    serialized_options=b"8\x01",
     is_extendable=False,
     syntax="proto3",
     extension_ranges=[],
@@ -147,7 +143,7 @@ _SAMPLER = _descriptor.Descriptor(
             cpp_type=9,
             label=1,
             has_default_value=False,
-            default_value=_b("").decode("utf-8"),
+            default_value=b"".decode("utf-8"),
             message_type=None,
             enum_type=None,
             containing_type=None,
@@ -1,7 +1,6 @@
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: second/protos/second.proto
 
-import sys
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
 from google.protobuf import reflection as _reflection
@@ -20,8 +19,6 @@ from opendr.perception.object_detection_3d.voxel_object_detection_3d.second_dete
     voxel_generator_pb2 as second_dot_protos_dot_voxel__generator__pb2,
 )
 
-_b = sys.version_info[0] < 3 and (lambda x: x) or (lambda x: x.encode("latin1"))
-
 # @@protoc_insertion_point(imports)
 
 _sym_db = _symbol_database.Default()
@@ -31,44 +28,37 @@ DESCRIPTOR = _descriptor.FileDescriptor(
     package="second.protos",
     syntax="proto3",
     serialized_options=None,
-    serialized_pb=_b(
-        '\n\x1asecond/protos/second.proto\x12\rsecond.protos\x1a\x1asecond/protos/losses.' +
-        'proto\x1a\x1dsecond/protos/box_coder.proto\x1a\x1asecond/protos/target.proto\x1a#s' +
-        'econd/protos/voxel_generator.proto"\xff\x0b\n\x08VoxelNet\x12\x11\n\tnum_clas' +
-        's\x18\x01 \x01(\r\x12N\n\x17voxel_feature_extractor\x18\x02 \x01(\x0b\x32-.seco' +
-        'nd.protos.VoxelNet.VoxelFeatureExtractor\x12P\n\x18middle_feature_extract' +
-        'or\x18\x03 \x01(\x0b\x32..second.protos.VoxelNet.MiddleFeatureExtractor' +
-        '\x12(\n\x03rpn\x18\x04 \x01(\x0b\x32\x1b.second.protos.VoxelNet.RP' +
-        'N\x12\x19\n\x11use_sigmoid_score\x18\x05 \x01(\x08\x12!\n\x04loss\x18\x06 ' +
-        '\x01(\x0b\x32\x13.second.protos.Loss\x12\x1f\n\x17\x65ncode_rad_error_by_sin' +
-        '\x18\x07 \x01(\x08\x12"\n\x1a\x65ncode_background_as_zeros\x18\x08 \x01' +
-        '(\x08\x12\x1a\n\x12use_aux_classifier\x18\t \x01(\x08\x12\x16\n\x0euse_rota' +
-        'te_nms\x18\n \x01(\x08\x12\x1b\n\x13use_multi_class_nms\x18\x0b \x01(' +
-        '\x08\x12\x18\n\x10nms_pre_max_size\x18\x0c \x01(\r\x12\x19\n\x11nms_post_' +
-        'max_size\x18\r \x01(\r\x12\x1b\n\x13nms_score_threshold\x18\x0e \x01' +
-        '(\x02\x12\x19\n\x11nms_iou_threshold\x18\x0f \x01(\x02\x12\x1f\n\x17post_ce' +
-        'nter_limit_range\x18\x10 \x03(\x02\x12 \n\x18use_direction_classifier\x18\x11 ' +
-        '\x01(\x08\x12\x1d\n\x15\x64irection_loss_weight\x18\x12 \x01(\x02\x12\x18\n\x10p' +
-        'os_class_weight\x18\x13 \x01(\x02\x12\x18\n\x10neg_class_weight\x18\x14 \x01' +
-        '(\x02\x12<\n\x0eloss_norm_type\x18\x15 \x01(\x0e\x32$.second.protos.VoxelNe' +
-        't.LossNormType\x12\x0f\n\x07use_bev\x18\x16 \x01(\x08\x12\x1c\n\x14without_r' +
-        'eflectivity\x18\x17 \x01(\x08\x12\x1e\n\x16\x65ncode_angle_to_vector\x18\x18 ' +
-        '\x01(\x08\x12*\n\tbox_coder\x18\x19 \x01(\x0b\x32\x17.second.protos.BoxCod' +
-        'er\x12\x36\n\x0ftarget_assigner\x18\x1a \x01(\x0b\x32\x1d.second.protos.Target' +
-        'Assigner\x12\x13\n\x0blidar_input\x18\x1b \x01(\x08\x12\x1a\n\x12num_point_featu' +
-        'res\x18\x1c \x01(\r\x12\x36\n\x0fvoxel_generator\x18\x1d \x01(\x0b\x32\x1d.second' +
-        '.protos.VoxelGenerator\x1a^\n\x15VoxelFeatureExtractor\x12\x19\n\x11module_cla' +
-        'ss_name\x18\x01 \x01(\t\x12\x13\n\x0bnum_filters\x18\x02 \x03(\r\x12\x15\n\rwi' +
-        'th_distance\x18\x03 \x01(\x08\x1ai\n\x16MiddleFeatureExtractor\x12\x19\n\x11module_' +
-        'class_name\x18\x01 \x01(\t\x12\x19\n\x11num_filters_down1\x18\x02 \x03(' +
-        '\r\x12\x19\n\x11num_filters_down2\x18\x03 \x03(\r\x1a\xc3\x01\n\x03RP' +
-        'N\x12\x19\n\x11module_class_name\x18\x01 \x01(\t\x12\x12\n\nlayer_nu' +
-        'ms\x18\x02 \x03(\r\x12\x15\n\rlayer_strides\x18\x03 \x03(\r\x12\x13\n\x0bnum_f' +
-        'ilters\x18\x04 \x03(\r\x12\x18\n\x10upsample_strides\x18\x05 \x03(\r\x12\x1c\n\x14' +
-        'num_upsample_filters\x18\x06 \x03(\r\x12\x15\n\ruse_groupnorm\x18\x07 \x01' +
-        '(\x08\x12\x12\n\nnum_groups\x18\x08 \x01(\r"R\n\x0cLossNormType\x12\x15\n\x11N' +
-        'ormByNumExamples\x10\x00\x12\x16\n\x12NormByNumPositives\x10\x01\x12\x13\n\x0fNorm' +
-        'ByNumPosNeg\x10\x02\x62\x06proto3'
+    serialized_pb=(
+        b"\n\x1asecond/protos/second.proto\x12\rsecond.protos\x1a\x1asecond/protos/losses.proto\x1a\x1d"
+        b"second/protos/box_coder.proto\x1a\x1asecond/protos/target.proto\x1a#second/protos/voxel_gener"
+        b'ator.proto"\xff\x0b\n\x08VoxelNet\x12\x11\n\tnum_class\x18\x01 \x01(\r\x12N\n\x17voxel_featur'
+        b"e_extractor\x18\x02 \x01(\x0b2-.second.protos.VoxelNet.VoxelFeatureExtractor\x12P\n\x18middle"
+        b"_feature_extractor\x18\x03 \x01(\x0b2..second.protos.VoxelNet.MiddleFeatureExtractor\x12(\n"
+        b"\x03rpn\x18\x04 \x01(\x0b2\x1b.second.protos.VoxelNet.RPN\x12\x19\n\x11use_sigmoid_score\x18"
+        b"\x05 \x01(\x08\x12!\n\x04loss\x18\x06 \x01(\x0b2\x13.second.protos.Loss\x12\x1f\n\x17encode_r"
+        b'ad_error_by_sin\x18\x07 \x01(\x08\x12"\n\x1aencode_background_as_zeros\x18\x08 \x01(\x08\x12'
+        b"\x1a\n\x12use_aux_classifier\x18\t \x01(\x08\x12\x16\n\x0euse_rotate_nms\x18\n \x01(\x08\x12"
+        b"\x1b\n\x13use_multi_class_nms\x18\x0b \x01(\x08\x12\x18\n\x10nms_pre_max_size\x18\x0c \x01(\r"
+        b"\x12\x19\n\x11nms_post_max_size\x18\r \x01(\r\x12\x1b\n\x13nms_score_threshold\x18\x0e \x01("
+        b"\x02\x12\x19\n\x11nms_iou_threshold\x18\x0f \x01(\x02\x12\x1f\n\x17post_center_limit_range"
+        b"\x18\x10 \x03(\x02\x12 \n\x18use_direction_classifier\x18\x11 \x01(\x08\x12\x1d\n\x15directio"
+        b"n_loss_weight\x18\x12 \x01(\x02\x12\x18\n\x10pos_class_weight\x18\x13 \x01(\x02\x12\x18\n\x10"
+        b"neg_class_weight\x18\x14 \x01(\x02\x12<\n\x0eloss_norm_type\x18\x15 \x01(\x0e2$.second.protos"
+        b".VoxelNet.LossNormType\x12\x0f\n\x07use_bev\x18\x16 \x01(\x08\x12\x1c\n\x14without_reflectivi"
+        b"ty\x18\x17 \x01(\x08\x12\x1e\n\x16encode_angle_to_vector\x18\x18 \x01(\x08\x12*\n\tbox_coder"
+        b"\x18\x19 \x01(\x0b2\x17.second.protos.BoxCoder\x126\n\x0ftarget_assigner\x18\x1a \x01(\x0b2"
+        b"\x1d.second.protos.TargetAssigner\x12\x13\n\x0blidar_input\x18\x1b \x01(\x08\x12\x1a\n\x12num"
+        b"_point_features\x18\x1c \x01(\r\x126\n\x0fvoxel_generator\x18\x1d \x01(\x0b2\x1d.second.proto"
+        b"s.VoxelGenerator\x1a^\n\x15VoxelFeatureExtractor\x12\x19\n\x11module_class_name\x18\x01 \x01("
+        b"\t\x12\x13\n\x0bnum_filters\x18\x02 \x03(\r\x12\x15\n\rwith_distance\x18\x03 \x01(\x08\x1ai\n"
+        b"\x16MiddleFeatureExtractor\x12\x19\n\x11module_class_name\x18\x01 \x01(\t\x12\x19\n\x11num_fi"
+        b"lters_down1\x18\x02 \x03(\r\x12\x19\n\x11num_filters_down2\x18\x03 \x03(\r\x1a\xc3\x01\n\x03R"
+        b"PN\x12\x19\n\x11module_class_name\x18\x01 \x01(\t\x12\x12\n\nlayer_nums\x18\x02 \x03(\r\x12"
+        b"\x15\n\rlayer_strides\x18\x03 \x03(\r\x12\x13\n\x0bnum_filters\x18\x04 \x03(\r\x12\x18\n\x10u"
+        b"psample_strides\x18\x05 \x03(\r\x12\x1c\n\x14num_upsample_filters\x18\x06 \x03(\r\x12\x15\n\r"
+        b'use_groupnorm\x18\x07 \x01(\x08\x12\x12\n\nnum_groups\x18\x08 \x01(\r"R\n\x0cLossNormType\x12'
+        b"\x15\n\x11NormByNumExamples\x10\x00\x12\x16\n\x12NormByNumPositives\x10\x01\x12\x13\n\x0fNorm"
+        b"ByNumPosNeg\x10\x02b\x06proto3"
     ),
     dependencies=[
         second_dot_protos_dot_losses__pb2.DESCRIPTOR,
@@ -131,7 +121,7 @@ _VOXELNET_VOXELFEATUREEXTRACTOR = _descriptor.Descriptor(
             cpp_type=9,
             label=1,
             has_default_value=False,
-            default_value=_b("").decode("utf-8"),
+            default_value=b"".decode("utf-8"),
             message_type=None,
             enum_type=None,
             containing_type=None,
@@ -205,7 +195,7 @@ _VOXELNET_MIDDLEFEATUREEXTRACTOR = _descriptor.Descriptor(
             cpp_type=9,
             label=1,
             has_default_value=False,
-            default_value=_b("").decode("utf-8"),
+            default_value=b"".decode("utf-8"),
             message_type=None,
             enum_type=None,
             containing_type=None,
@@ -279,7 +269,7 @@ _VOXELNET_RPN = _descriptor.Descriptor(
             cpp_type=9,
             label=1,
             has_default_value=False,
-            default_value=_b("").decode("utf-8"),
+            default_value=b"".decode("utf-8"),
             message_type=None,
             enum_type=None,
             containing_type=None,
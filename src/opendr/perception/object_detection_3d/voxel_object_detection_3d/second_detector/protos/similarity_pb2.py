@@ -1,14 +1,11 @@
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: second/protos/similarity.proto
 
-import sys
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
 from google.protobuf import reflection as _reflection
 from google.protobuf import symbol_database as _symbol_database
 
-_b = sys.version_info[0] < 3 and (lambda x: x) or (lambda x: x.encode("latin1"))
-
 # @@protoc_insertion_point(imports)
 
 _sym_db = _symbol_database.Default()
@@ -19,17 +16,14 @@ DESCRIPTOR = _descriptor.FileDescriptor(
     package="second.protos",
     syntax="proto3",
     serialized_options=None,
-    serialized_pb=_b(
-        '\n\x1esecond/protos/similarity.proto\x12\rsecond.protos"\xff\x01\n\x1a' +
-        'RegionSimilarityCalculator\x12\x43\n\x15rotate_iou_similarity\x18\x01 ' +
-        '\x01(\x0b\x32".second.protos.RotateIouSimilarityH\x00\x12\x45\n\x16near' +
-        'est_iou_similarity\x18\x02' +
-        ' \x01(\x0b\x32#.second.protos.NearestIouSimilarityH\x00\x12@\n\x13\x64i' +
-        'stance_similarity\x18\x03 \x01(\x0b\x32!.second.protos.DistanceSimilari' +
-        'tyH\x00\x42\x13\n\x11region_similarity"\x15\n\x13RotateIouSimilarity"' +
-        '\x16\n\x14NearestIouSimilarity"Z\n\x12\x44istanceSimilarity\x12\x15\n\r' +
-        'distance_norm\x18\x01 \x01(\x02\x12\x15\n\rwith_rotation\x18\x02 ' +
-        '\x01(\x08\x12\x16\n\x0erotation_alpha\x18\x03 \x01(\x02\x62\x06proto3'
+    serialized_pb=(
+        b'\n\x1esecond/protos/similarity.proto\x12\rsecond.protos"\xff\x01\n\x1aRegionSimilarityCalcula'
+        b'tor\x12C\n\x15rotate_iou_similarity\x18\x01 \x01(\x0b2".second.protos.RotateIouSimilarityH'
+        b"\x00\x12E\n\x16nearest_iou_similarity\x18\x02 \x01(\x0b2#.second.protos.NearestIouSimilarityH"
+        b"\x00\x12@\n\x13distance_similarity\x18\x03 \x01(\x0b2!.second.protos.DistanceSimilarityH\x00B"
+        b'\x13\n\x11region_similarity"\x15\n\x13RotateIouSimilarity"\x16\n\x14NearestIouSimilarity"Z\n'
+        b"\x12DistanceSimilarity\x12\x15\n\rdistance_norm\x18\x01 \x01(\x02\x12\x15\n\rwith_rotation"
+        b"\x18\x02 \x01(\x08\x12\x16\n\x0erotation_alpha\x18\x03 \x01(\x02b\x06proto3"
     ),
 )
 
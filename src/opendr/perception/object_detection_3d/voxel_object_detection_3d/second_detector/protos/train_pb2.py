@@ -1,7 +1,6 @@
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: second/protos/train.proto
 
-import sys
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
 from google.protobuf import reflection as _reflection
@@ -14,8 +13,6 @@ from opendr.perception.object_detection_3d.voxel_object_detection_3d.second_dete
     preprocess_pb2 as second_dot_protos_dot_preprocess__pb2,
 )
 
-_b = sys.version_info[0] < 3 and (lambda x: x) or (lambda x: x.encode("latin1"))
-
 # @@protoc_insertion_point(imports)
 
 _sym_db = _symbol_database.Default()
@@ -25,19 +22,18 @@ DESCRIPTOR = _descriptor.FileDescriptor(
     package="second.protos",
     syntax="proto3",
     serialized_options=None,
-    serialized_pb=_b(
-        '\n\x19second/protos/train.proto\x12\rsecond.protos\x1a\x1dsecond/protos/optimi' +
-        'zer.proto\x1a\x1esecond/protos/preprocess.proto"\x92\x01\n\x0bRegularizer\x12\x36\n\x0el1_re' +
-        'gularizer\x18\x01 \x01(\x0b\x32\x1c.second.protos.L1RegularizerH\x00\x12\x36\n\x0el2_regu' +
-        'larizer\x18\x02 \x01(\x0b\x32\x1c.second.protos.L2RegularizerH\x00\x42\x13\n\x11regular' +
-        'izer_oneof"\x1f\n\rL1Regularizer\x12\x0e\n\x06weight\x18\x01 \x01(\x02"\x1f\n\rL2Regular' +
-        'izer\x12\x0e\n\x06weight\x18\x01 \x01(\x02"\xc6\x02\n\x0bTrainConfig\x12+\n\toptim' +
-        'izer\x18\x01 \x01(\x0b\x32\x18.second.protos.Optimizer\x12$\n\x1cinter_op_parallelism_' +
-        'threads\x18\x03 \x01(\r\x12$\n\x1cintra_op_parallelism_threads\x18\x04 \x01(\r\x12\r\n\x05ste' +
-        'ps\x18\x05 \x01(\r\x12\x16\n\x0esteps_per_eval\x18\x06 \x01(\r\x12\x1d\n\x15save_checkpoin' +
-        'ts_secs\x18\x07 \x01(\r\x12\x1a\n\x12save_summary_steps\x18\x08 \x01(\r\x12\x1e\n\x16\x65nabl' +
-        'e_mixed_precision\x18\t \x01(\x08\x12\x19\n\x11loss_scale_factor\x18\n \x01(\x02\x12!\n\x19\x63le' +
-        'ar_metrics_every_epoch\x18\x0b \x01(\x08\x62\x06proto3'
+    serialized_pb=(
+        b"\n\x19second/protos/train.proto\x12\rsecond.protos\x1a\x1dsecond/protos/optimizer.proto\x1a"
+        b'\x1esecond/protos/preprocess.proto"\x92\x01\n\x0bRegularizer\x126\n\x0el1_regularizer\x18\x01'
+        b" \x01(\x0b2\x1c.second.protos.L1RegularizerH\x00\x126\n\x0el2_regularizer\x18\x02 \x01(\x0b2"
+        b'\x1c.second.protos.L2RegularizerH\x00B\x13\n\x11regularizer_oneof"\x1f\n\rL1Regularizer\x12'
+        b'\x0e\n\x06weight\x18\x01 \x01(\x02"\x1f\n\rL2Regularizer\x12\x0e\n\x06weight\x18\x01 \x01('
+        b'\x02"\xc6\x02\n\x0bTrainConfig\x12+\n\toptimizer\x18\x01 \x01(\x0b2\x18.second.protos.Optimiz'
+        b"er\x12$\n\x1cinter_op_parallelism_threads\x18\x03 \x01(\r\x12$\n\x1cintra_op_parallelism_thre"
+        b"ads\x18\x04 \x01(\r\x12\r\n\x05steps\x18\x05 \x01(\r\x12\x16\n\x0esteps_per_eval\x18\x06 \x01"
+        b"(\r\x12\x1d\n\x15save_checkpoints_secs\x18\x07 \x01(\r\x12\x1a\n\x12save_summary_steps\x18"
+        b"\x08 \x01(\r\x12\x1e\n\x16enable_mixed_precision\x18\t \x01(\x08\x12\x19\n\x11loss_scale_fact"
+        b"or\x18\n \x01(\x02\x12!\n\x19clear_metrics_every_epoch\x18\x0b \x01(\x08b\x06proto3"
     ),
     dependencies=[
         second_dot_protos_dot_optimizer__pb2.DESCRIPTOR,
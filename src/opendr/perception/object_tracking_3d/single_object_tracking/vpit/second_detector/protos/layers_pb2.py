@@ -1,12 +1,9 @@
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: second/protos/layers.proto
 
-import sys
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import symbol_database as _symbol_database
 
-_b = sys.version_info[0] < 3 and (lambda x: x) or (lambda x: x.encode("latin1"))
-
 # @@protoc_insertion_point(imports)
 
 _sym_db = _symbol_database.Default()
@@ -17,7 +14,7 @@ DESCRIPTOR = _descriptor.FileDescriptor(
     package="second",
     syntax="proto3",
     serialized_options=None,
-    serialized_pb=_b("\n\x1asecond/protos/layers.proto\x12\x06secondb\x06proto3"),
+    serialized_pb=b"\n\x1asecond/protos/layers.proto\x12\x06secondb\x06proto3",
 )
 
 
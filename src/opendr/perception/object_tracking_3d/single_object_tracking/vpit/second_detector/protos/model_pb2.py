@@ -1,7 +1,6 @@
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: second/protos/model.proto
 
-import sys
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
 from google.protobuf import reflection as _reflection
@@ -11,8 +10,6 @@ from opendr.perception.object_tracking_3d.single_object_tracking.vpit.second_det
     second_pb2 as second_dot_protos_dot_second__pb2,
 )
 
-_b = sys.version_info[0] < 3 and (lambda x: x) or (lambda x: x.encode("latin1"))
-
 # @@protoc_insertion_point(imports)
 
 _sym_db = _symbol_database.Default()
@@ -22,10 +19,10 @@ DESCRIPTOR = _descriptor.FileDescriptor(
     package="second.protos",
     syntax="proto3",
     serialized_options=None,
-    serialized_pb=_b(
-        '\n\x19second/protos/model.proto\x12\rsecond.protos\x1a\x1asecond/protos/secon' +
-        'd.proto"D\n\x0e\x44\x65tectionModel\x12)\n\x06second\x18\x01 \x01(\x0b\x32\x17.second' +
-        '.protos.VoxelNetH\x00\x42\x07\n\x05modelb\x06proto3'
+    serialized_pb=(
+        b'\n\x19second/protos/model.proto\x12\rsecond.protos\x1a\x1asecond/protos/second.proto"D\n\x0eD'
+        b"etectionModel\x12)\n\x06second\x18\x01 \x01(\x0b2\x17.second.protos.VoxelNetH\x00B\x07\n\x05m"
+        b"odelb\x06proto3"
     ),
     dependencies=[second_dot_protos_dot_second__pb2.DESCRIPTOR],
 )
@@ -1,7 +1,6 @@
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: second/protos/pipeline.proto
 
-import sys
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
 from google.protobuf import reflection as _reflection
@@ -17,8 +16,6 @@ from opendr.perception.object_tracking_3d.single_object_tracking.vpit.second_det
     train_pb2 as second_dot_protos_dot_train__pb2,
 )
 
-_b = sys.version_info[0] < 3 and (lambda x: x) or (lambda x: x.encode("latin1"))
-
 # @@protoc_insertion_point(imports)
 
 _sym_db = _symbol_database.Default()
@@ -28,14 +25,13 @@ DESCRIPTOR = _descriptor.FileDescriptor(
     package="second.protos",
     syntax="proto3",
     serialized_options=None,
-    serialized_pb=_b(
-        '\n\x1csecond/protos/pipeline.proto\x12\rsecond.protos\x1a second/prot' +
-        'os/input_reader.proto\x1a\x19second/protos/model.proto\x1a\x19second/protos/tr' +
-        'ain.proto"\xe8\x01\n\x17TrainEvalPipelineConfig\x12,\n\x05model\x18\x01 \x01(' +
-        '\x0b\x32\x1d.second.protos.DetectionModel\x12\x36\n\x12train_input_reader\x18\x02 ' +
-        '\x01(\x0b\x32\x1a.second.protos.InputReader\x12\x30\n\x0ctrain_config\x18\x03 \x01' +
-        '(\x0b\x32\x1a.second.protos.TrainConfig\x12\x35\n\x11\x65val_input_reader\x18\x04 ' +
-        '\x01(\x0b\x32\x1a.second.protos.InputReaderb\x06proto3'
+    serialized_pb=(
+        b"\n\x1csecond/protos/pipeline.proto\x12\rsecond.protos\x1a second/protos/input_reader.proto"
+        b'\x1a\x19second/protos/model.proto\x1a\x19second/protos/train.proto"\xe8\x01\n\x17TrainEvalPip'
+        b"elineConfig\x12,\n\x05model\x18\x01 \x01(\x0b2\x1d.second.protos.DetectionModel\x126\n\x12tra"
+        b"in_input_reader\x18\x02 \x01(\x0b2\x1a.second.protos.InputReader\x120\n\x0ctrain_config\x18"
+        b"\x03 \x01(\x0b2\x1a.second.protos.TrainConfig\x125\n\x11eval_input_reader\x18\x04 \x01(\x0b2"
+        b"\x1a.second.protos.InputReaderb\x06proto3"
     ),
     dependencies=[
         second_dot_protos_dot_input__reader__pb2.DESCRIPTOR,
@@ -1,14 +1,12 @@
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: second/protos/voxel_generator.proto
 
-import sys
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
 from google.protobuf import reflection as _reflection
 from google.protobuf import symbol_database as _symbol_database
 
 
-_b = sys.version_info[0] < 3 and (lambda x: x) or (lambda x: x.encode("latin1"))
 # @@protoc_insertion_point(imports)
 
 _sym_db = _symbol_database.Default()
@@ -18,13 +16,12 @@ DESCRIPTOR = _descriptor.FileDescriptor(
     package="second.protos",
     syntax="proto3",
     serialized_options=None,
-    serialized_pb=_b(
-        '\n#second/protos/voxel_generator.proto\x12\rsecond.prot' +
-        'os"\xbc\x01\n\x0eVoxelGenerator\x12\x12\n\nvoxel_size\x18\x01 ' +
-        '\x03(\x02\x12\x19\n\x11point_cloud_range\x18\x02 \x03(\x02\x12&\n\x1ema' +
-        'x_number_of_points_per_voxel\x18\x03 \x01(\r\x12\x19\n\x11submanifold_' +
-        'group\x18\x04 \x01(\x08\x12\x18\n\x10submanifold_size\x18\x05 \x03(\r\x12\x1e\n\x16sub' +
-        'manifold_max_points\x18\x06 \x01(\rb\x06proto3'
+    serialized_pb=(
+        b'\n#second/protos/voxel_generator.proto\x12\rsecond.protos"\xbc\x01\n\x0eVoxelGenerator\x12'
+        b"\x12\n\nvoxel_size\x18\x01 \x03(\x02\x12\x19\n\x11point_cloud_range\x18\x02 \x03(\x02\x12&\n"
+        b"\x1emax_number_of_points_per_voxel\x18\x03 \x01(\r\x12\x19\n\x11submanifold_group\x18\x04 "
+        b"\x01(\x08\x12\x18\n\x10submanifold_size\x18\x05 \x03(\r\x12\x1e\n\x16submanifold_max_points"
+        b"\x18\x06 \x01(\rb\x06proto3"
     ),
 )
 
@@ -298,7 +298,8 @@ class CityscapesDataset(ExternalDataset, DatasetIterator):
                                 image_output_dir=img_split_dir,
                                 mask_output_dir=mask_split_dir
                             ),
-                            img_list
+                            img_list,
+                            chunksize=max(1, len(img_list) // (num_workers * 4))
                     ):
                         coco_out["images"].append(coco_img)
                         coco_out["annotations"] += coco_ann
@@ -334,7 +335,7 @@ def _process_data(image, image_input_dir: Path, mask_input_dir: Path, image_outp
     ids = np.unique(lbl)
 
     # Compress the labels and compute cat
-    lbl_out = np.ones(lbl.shape, np.uint8) * 255
+    lbl_out = np.full(lbl.shape, 255, np.uint8)
     for city_id in ids:
         if city_id < 1000:
             # Stuff or group
@@ -315,7 +315,8 @@ class KittiDataset(ExternalDataset, DatasetIterator):
                                 mask_output_dir=mask_split_dir,
                                 eval_output_dir=eval_output_dir
                             ),
-                            img_list
+                            img_list,
+                            chunksize=max(1, len(img_list) // (num_workers * 4))
                     ):
                         coco_out["images"].append(coco_img)
                         coco_out["annotations"] += coco_ann
@@ -348,7 +349,7 @@ def _process_data(img_id: str, image_input_dir: Path, mask_input_dir: Path, imag
     color_ids = np.vstack(list(set(tuple(r) for r in lbl.reshape(-1, 3))))
 
     # Compress the labels and compute cat
-    lbl_out = np.ones(lbl.shape[:2], np.uint8) * 255
+    lbl_out = np.full(lbl.shape[:2], 255, np.uint8)
     segmInfo = []
     for color_id in color_ids:
         city_id = color_id[2] * 256 * 256 + color_id[1] * 256 + color_id[0]
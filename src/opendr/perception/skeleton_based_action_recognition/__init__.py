@@ -1,16 +1,14 @@
-from opendr.perception.skeleton_based_action_recognition.continual_stgcn_learner import CoSTGCNLearner
-from opendr.perception.skeleton_based_action_recognition.spatio_temporal_gcn_learner import (
-    SpatioTemporalGCNLearner,
-)
-from opendr.perception.skeleton_based_action_recognition.progressive_spatio_temporal_gcn_learner import (
-    ProgressiveSpatioTemporalGCNLearner,
-)
-from opendr.perception.skeleton_based_action_recognition.algorithm.datasets.ntu_gendata import (
-    NTU60_CLASSES,
-)
-from opendr.perception.skeleton_based_action_recognition.algorithm.datasets.kinetics_gendata import (
-    KINETICS400_CLASSES,
-)
+import importlib
+
+# The learners pull in torch and the dataset modules, so they are only imported on first access (PEP 562)
+_LAZY_IMPORTS = {
+    "CoSTGCNLearner": "opendr.perception.skeleton_based_action_recognition.continual_stgcn_learner",
+    "SpatioTemporalGCNLearner": "opendr.perception.skeleton_based_action_recognition.spatio_temporal_gcn_learner",
+    "ProgressiveSpatioTemporalGCNLearner":
+        "opendr.perception.skeleton_based_action_recognition.progressive_spatio_temporal_gcn_learner",
+    "NTU60_CLASSES": "opendr.perception.skeleton_based_action_recognition.algorithm.datasets.ntu_gendata",
+    "KINETICS400_CLASSES": "opendr.perception.skeleton_based_action_recognition.algorithm.datasets.kinetics_gendata",
+}
 
 __all__ = [
     "CoSTGCNLearner",
@@ -19,3 +17,15 @@ __all__ = [
     "NTU60_CLASSES",
     "KINETICS400_CLASSES",
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
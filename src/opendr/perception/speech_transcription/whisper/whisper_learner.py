@@ -13,7 +13,10 @@
 # limitations under the License.
 
 import os
-from dataclasses import asdict
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, replace
 from logging import getLogger
 from typing import Iterable, List, Tuple, Dict, Optional, Union
 
@@ -37,6 +40,45 @@ from opendr.engine.target import WhisperTranscription
 logger = getLogger(__name__)
 
 
+class _AudioCache:
+    """
+    Least recently used cache of decoded audio files, bounded by the total size of the cached waveforms.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def load(self, path: str, sample_rate: int) -> np.ndarray:
+        # The modification time is part of the key so that a rewritten file is decoded again
+        key = (path, os.path.getmtime(path), sample_rate)
+        with self._lock:
+            audio = self._entries.get(key)
+            if audio is not None:
+                self._entries.move_to_end(key)
+                return audio
+
+        audio = whisper.load_audio(path, sr=sample_rate)
+        audio.setflags(write=False)
+        if audio.nbytes > self.max_bytes:
+            return audio
+
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = audio
+                self._size += audio.nbytes
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.nbytes
+        return audio
+
+
+# 256 MB hold about 70 minutes of 16 kHz float32 audio
+_audio_cache = _AudioCache(max_bytes=256 * 1024 ** 2)
+
+
 class WhisperLearner(Learner):
     def __init__(
         self,
@@ -63,6 +105,9 @@ class WhisperLearner(Learner):
         max_initial_timestamp: Optional[float]=1.0,
         fp16: bool=True,
         device: str="cuda",
+        compile_model: Optional[bool]=None,
+        backend: str="openai",
+        compute_type: Optional[str]=None,
     ):
         """
         Initialize transcription model that uses Whisper.
@@ -154,6 +199,18 @@ class WhisperLearner(Learner):
 
             device: str
                 Device to use for PyTorch inference, either "cpu" or "cuda".
+
+            compile_model: Optional[bool]
+                Whether to compile the audio encoder with torch.compile (PyTorch >= 2.0) when the model is loaded.
+                If None, it is enabled on CUDA devices.
+
+            backend: str
+                Inference backend, either "openai" for the reference Whisper implementation or "ctranslate2" to run the
+                model with faster-whisper (CTranslate2) using int8 weights, which requires the faster-whisper package.
+
+            compute_type: Optional[str]
+                Weight and activation type of the ctranslate2 backend, e.g., "int8", "int8_float16" or "float16". If None,
+                "int8_float16" is used with fp16 and "int8" otherwise.
         """
 
         super(WhisperLearner, self).__init__()
@@ -189,6 +246,14 @@ class WhisperLearner(Learner):
         self.model_name = None
         self.sample_rate = 16000
         self.device = device
+        if compile_model is None:
+            compile_model = "cuda" in self.device
+        self.compile_model = compile_model
+        if backend not in ("openai", "ctranslate2"):
+            raise ValueError(f"{backend} is not a supported backend, use 'openai' or 'ctranslate2'.")
+        self.backend = backend
+        self.compute_type = compute_type
+        self._suppress_token_ids = None
 
         if self.device == "cpu" and self.fp16:
             logger.warning("FP16 is not supported on CPU, using FP32 instead.")
@@ -212,6 +277,16 @@ class WhisperLearner(Learner):
             fp16=self.fp16,
         )
 
+    @property
+    def decode_options(self) -> whisper.DecodingOptions:
+        return self._decode_options
+
+    @decode_options.setter
+    def decode_options(self, decode_options: whisper.DecodingOptions):
+        # The options are converted to keyword arguments once here instead of on every infer() call.
+        self._decode_options = decode_options
+        self._decode_options_dict = asdict(decode_options)
+
     def load(
         self,
         name: Optional[str] = None,
@@ -230,6 +305,10 @@ class WhisperLearner(Learner):
             in_memory (bool, optional): whether to load the model in memory. Defaults to False.
         """
 
+        if self.backend == "ctranslate2":
+            self._load_ctranslate2(name=name, model_path=model_path, download_dir=download_dir)
+            return
+
         if model_path is not None:
             if os.path.isfile(model_path):
                 self.model_name = os.path.splitext(os.path.basename(model_path))[1]
@@ -251,6 +330,131 @@ class WhisperLearner(Learner):
             download_root=download_dir,
             in_memory=in_memory,
         )
+        if self.compile_model and hasattr(torch, "compile"):
+            # The encoder always receives 30-second mel windows, so its input shape is static and the compiled graph
+            # can be replayed with CUDA graphs. Only forward is replaced, so the module and its state dict are kept.
+            self.model.encoder.forward = torch.compile(self.model.encoder.forward, mode="reduce-overhead")
+        # Whisper parses the suppressed tokens again for every decoded window, so they are resolved once here
+        self._suppress_token_ids = self._resolve_suppress_tokens()
+
+    def _resolve_suppress_tokens(self) -> Optional[Tuple[int, ...]]:
+        """
+        Expand the suppress_tokens option to an explicit tuple of token ids, replacing "-1" with the non-speech
+        tokens of the loaded model's tokenizer.
+
+        Returns:
+            Optional[Tuple[int, ...]]: The token ids to suppress, or None if no tokens are suppressed.
+        """
+        suppress_tokens = self.suppress_tokens
+        if suppress_tokens is None:
+            return None
+        if isinstance(suppress_tokens, str):
+            suppress_tokens = [int(token) for token in suppress_tokens.split(",")]
+        suppress_tokens = list(suppress_tokens)
+        if -1 in suppress_tokens:
+            tokenizer = whisper.tokenizer.get_tokenizer(
+                self.model.is_multilingual, num_languages=self.model.num_languages
+            )
+            suppress_tokens = [token for token in suppress_tokens if token >= 0] + list(tokenizer.non_speech_tokens)
+        return tuple(suppress_tokens)
+
+    def _decode_kwargs(self) -> Dict:
+        """
+        Get the decoding options as keyword arguments, with the suppressed tokens resolved by load().
+
+        Returns:
+            Dict: Keyword arguments for whisper.DecodingOptions.
+        """
+        if self._suppress_token_ids is None:
+            return self._decode_options_dict
+        # Whisper extends the suppress_tokens list it is given in place, so every call gets a fresh copy
+        return {**self._decode_options_dict, "suppress_tokens": list(self._suppress_token_ids)}
+
+    def _load_ctranslate2(
+        self,
+        name: Optional[str] = None,
+        model_path: Optional[str] = None,
+        download_dir: Optional[str] = None,
+    ):
+        """
+        Loads a CTranslate2 Whisper model with faster-whisper, which downloads converted models by name if necessary.
+
+        Args:
+            name (str): name of Whisper model. Could be: tiny.en, tiny, base, base.en, etc. Defaults to None.
+            model_path (str, optional): path to a directory with a CTranslate2 converted model. Defaults to None.
+            download_dir (str, optional): directory to save the downloaded model. Defaults to None.
+        """
+        from faster_whisper import WhisperModel
+
+        if model_path is not None:
+            if not os.path.isdir(model_path):
+                raise ValueError(f"{model_path} is not a correct path to a CTranslate2 model directory.")
+            self.model_name = os.path.basename(os.path.normpath(model_path))
+            whisper_path = model_path
+        elif name is not None:
+            self.model_name = name
+            whisper_path = name
+        else:
+            raise ValueError("Please specify a model name or path to model checkpoint.")
+
+        device, _, device_index = self.device.partition(":")
+        self.model = WhisperModel(
+            whisper_path,
+            device=device,
+            device_index=int(device_index) if device_index else 0,
+            compute_type=self.compute_type or ("int8_float16" if self.fp16 else "int8"),
+            download_root=download_dir,
+        )
+
+    def _transcribe_ctranslate2(self, data: np.ndarray, initial_prompt: Optional[str] = None) -> Dict:
+        """
+        Transcribe audio with a faster-whisper model and return the result in the format of Whisper's transcribe.
+        """
+        suppress_tokens = self.suppress_tokens
+        if isinstance(suppress_tokens, str):
+            suppress_tokens = [int(token) for token in suppress_tokens.split(",")]
+        optional_options = dict(
+            best_of=self.best_of,
+            patience=self.patience,
+            length_penalty=self.length_penalty,
+            prefix=self.prefix,
+            max_initial_timestamp=self.max_initial_timestamp,
+        )
+        segments, _ = self.model.transcribe(
+            data,
+            language=self.language,
+            task=self.task,
+            beam_size=self.beam_size or 1,
+            temperature=self.temperature,
+            compression_ratio_threshold=self.compression_ratio_threshold,
+            log_prob_threshold=self.logprob_threshold,
+            no_speech_threshold=self.no_speech_threshold,
+            condition_on_previous_text=self.condition_on_previous_text,
+            initial_prompt=initial_prompt if initial_prompt is not None else self.prompt,
+            suppress_blank=self.suppress_blank,
+            suppress_tokens=list(suppress_tokens) if suppress_tokens is not None else None,
+            without_timestamps=self.without_timestamps,
+            word_timestamps=self.word_timestamps,
+            prepend_punctuations=self.prepend_punctuations,
+            append_punctuations=self.append_punctuations,
+            **{key: value for key, value in optional_options.items() if value is not None},
+        )
+        results = [
+            dict(
+                id=segment.id,
+                seek=segment.seek,
+                start=segment.start,
+                end=segment.end,
+                text=segment.text,
+                tokens=segment.tokens,
+                temperature=segment.temperature,
+                avg_logprob=segment.avg_logprob,
+                compression_ratio=segment.compression_ratio,
+                no_speech_prob=segment.no_speech_prob,
+            )
+            for segment in segments
+        ]
+        return {"text": "".join(segment["text"] for segment in results), "segments": results}
 
     def download(
         self,
@@ -286,57 +490,155 @@ class WhisperLearner(Learner):
 
     def infer(
         self,
-        audio: Union[Timeseries, np.ndarray, torch.Tensor, str],
+        audio: Union[Timeseries, np.ndarray, torch.Tensor, str, List[Union[Timeseries, np.ndarray, torch.Tensor, str]]],
         initial_prompt: Optional[str] = None,
-    ) -> WhisperTranscription:
+    ) -> Union[WhisperTranscription, List[WhisperTranscription]]:
         """
         Run inference on an audio sample. Please call the load() method before calling this method.
 
         Args:
-            audio (Union[Timeseries, np.ndarray, torch.Tensor, str]): The audio sample as a Timeseries, torch.Tensor, or
-            np.ndarray or a string of file path.
+            audio (Union[Timeseries, np.ndarray, torch.Tensor, str, List]): The audio sample as a Timeseries,
+            torch.Tensor, or np.ndarray or a string of file path. A list of samples is transcribed as a batch, see
+            infer_batch().
 
             initial_prompt (str, optional):  Optional text to provide as a prompt for the first window.
             This can be used to provide, or "prompt-engineer" a context for transcription, e.g. custom vocabularies or
             proper nouns to make it more likely to predict those word correctly.
 
         Returns:
-            WhisperTranscription: Transcription results with side information.
+            Union[WhisperTranscription, List[WhisperTranscription]]: Transcription results with side information, one
+            per sample when a list is given.
 
         Raises:
             TypeError: If the input batch is not a Timeseries, torch.Tensor, np.ndarray or str.
         """
 
-        if isinstance(audio, Timeseries):
-            data = audio.numpy().reshape(-1)
-        elif isinstance(audio, (torch.Tensor, np.ndarray)):
-            data = audio
-        elif isinstance(audio, str):
-            data = whisper.load_audio(audio)
-        else:
-            raise TypeError("batch must be a timeseries, torch.tensor or np.ndarray")
+        if isinstance(audio, list):
+            return self.infer_batch(audio, initial_prompt=initial_prompt)
 
-        decode_results = self.model.transcribe(
-            data,
-            verbose=self.verbose,
-            compression_ratio_threshold=self.compression_ratio_threshold,
-            no_speech_threshold=self.no_speech_threshold,
-            logprob_threshold=self.logprob_threshold,
-            condition_on_previous_text=self.condition_on_previous_text,
-            word_timestamps=self.word_timestamps,
-            initial_prompt=initial_prompt,
-            prepend_punctuations=self.prepend_punctuations,
-            append_punctuations=self.append_punctuations,
-            **asdict(self.decode_options),
-        )
+        data = self._audio_data(audio)
+
+        if self.backend == "ctranslate2":
+            if isinstance(data, torch.Tensor):
+                data = data.cpu().numpy()
+            decode_results = self._transcribe_ctranslate2(data, initial_prompt=initial_prompt)
+            return WhisperTranscription(
+                text=decode_results["text"], segments=decode_results["segments"]
+            )
+
+        # Whisper computes the mel spectrogram on the device of the audio tensor, so the audio is uploaded once here
+        # (from pinned memory) instead of computing the spectrogram on the CPU and copying every 30-second window.
+        data = torch.as_tensor(data, dtype=torch.float32)
+        if "cuda" in self.device:
+            if data.device.type == "cpu":
+                data = data.pin_memory()
+            data = data.to(self.device, non_blocking=True)
+
+        with torch.inference_mode():
+            decode_results = self.model.transcribe(
+                data,
+                verbose=self.verbose,
+                compression_ratio_threshold=self.compression_ratio_threshold,
+                no_speech_threshold=self.no_speech_threshold,
+                logprob_threshold=self.logprob_threshold,
+                condition_on_previous_text=self.condition_on_previous_text,
+                word_timestamps=self.word_timestamps,
+                initial_prompt=initial_prompt,
+                prepend_punctuations=self.prepend_punctuations,
+                append_punctuations=self.append_punctuations,
+                **self._decode_kwargs(),
+            )
         return WhisperTranscription(
             text=decode_results["text"], segments=decode_results["segments"]
         )
 
+    def infer_batch(
+        self,
+        audios: List[Union[Timeseries, np.ndarray, torch.Tensor, str]],
+        initial_prompt: Optional[str] = None,
+    ) -> List[WhisperTranscription]:
+        """
+        Run inference on several audio samples. Samples that fit in a single 30-second window are decoded together,
+        so the encoder runs once for the whole batch. Longer samples, and all samples with the ctranslate2 backend,
+        are transcribed one by one with infer().
+
+        Batched samples are decoded with the first temperature only, i.e., without the temperature fallback of
+        Whisper's transcribe().
+
+        Args:
+            audios (List[Union[Timeseries, np.ndarray, torch.Tensor, str]]): The audio samples, each given as in
+            infer().
+
+            initial_prompt (str, optional): Optional text to provide as a prompt for every sample.
+
+        Returns:
+            List[WhisperTranscription]: Transcription results in the order of the input samples.
+        """
+        data = [self._audio_data(audio) for audio in audios]
+        results = [None] * len(data)
+        batch_indices = []
+        for i, sample in enumerate(data):
+            if self.backend == "openai" and sample.shape[-1] <= whisper.audio.N_SAMPLES:
+                batch_indices.append(i)
+            else:
+                results[i] = self.infer(sample, initial_prompt=initial_prompt)
+        if len(batch_indices) == 0:
+            return results
+
+        n_mels = self.model.dims.n_mels
+        mel = torch.stack([
+            whisper.log_mel_spectrogram(whisper.pad_or_trim(torch.as_tensor(data[i], dtype=torch.float32).reshape(-1)),
+                                        n_mels=n_mels)
+            for i in batch_indices
+        ])
+        if "cuda" in self.device:
+            if mel.device.type == "cpu":
+                mel = mel.pin_memory()
+            mel = mel.to(self.device, non_blocking=True)
+        options = whisper.DecodingOptions(**self._decode_kwargs())
+        if initial_prompt is not None:
+            options = replace(options, prompt=initial_prompt)
+
+        with torch.inference_mode():
+            decode_results = whisper.decode(self.model, mel, options)
+
+        # Same gating as Whisper's transcribe(), evaluated for the whole batch at once
+        no_speech_mask = np.zeros(len(decode_results), dtype=bool)
+        if self.no_speech_threshold is not None:
+            no_speech_mask = np.array([result.no_speech_prob for result in decode_results]) > self.no_speech_threshold
+            if self.logprob_threshold is not None:
+                no_speech_mask &= np.array([result.avg_logprob for result in decode_results]) <= self.logprob_threshold
+
+        for i, result, no_speech in zip(batch_indices, decode_results, no_speech_mask):
+            segments = [] if no_speech else [{
+                "id": 0,
+                "seek": 0,
+                "start": 0.0,
+                "end": data[i].shape[-1] / whisper.audio.SAMPLE_RATE,
+                "text": result.text,
+                "tokens": result.tokens,
+                "temperature": result.temperature,
+                "avg_logprob": result.avg_logprob,
+                "compression_ratio": result.compression_ratio,
+                "no_speech_prob": result.no_speech_prob,
+            }]
+            results[i] = WhisperTranscription(text="" if no_speech else result.text, segments=segments)
+        return results
+
+    def _audio_data(self, audio: Union[Timeseries, np.ndarray, torch.Tensor, str]) -> Union[np.ndarray, torch.Tensor]:
+        if isinstance(audio, Timeseries):
+            return audio.numpy().reshape(-1)
+        elif isinstance(audio, (torch.Tensor, np.ndarray)):
+            return audio
+        elif isinstance(audio, str):
+            return self.load_audio(audio)
+        raise TypeError("batch must be a timeseries, torch.tensor or np.ndarray")
+
     @staticmethod
     def load_audio(file: str) -> np.ndarray:
         """
-        Load audio from a file.
+        Load audio from a file. Decoded local files are cached (up to 256 MB of audio in total), so loading the same
+        unchanged file again does not spawn ffmpeg. Other inputs supported by ffmpeg, e.g., URLs, are not cached.
 
         Args
             file (str): Path to audio file.
@@ -344,7 +646,23 @@ class WhisperLearner(Learner):
         Returns:
             np.ndarray: Audio data.
         """
-        return whisper.load_audio(file)
+        if not os.path.isfile(file):
+            return whisper.load_audio(file)
+        return _audio_cache.load(os.path.realpath(file), whisper.audio.SAMPLE_RATE).copy()
+
+    @staticmethod
+    def preload(files: List[str], num_workers: int = 4):
+        """
+        Decode local audio files in parallel and keep them in the cache used by load_audio() and infer(). Inputs that are
+        not local files are skipped.
+
+        Args:
+            files (List[str]): Paths to audio files.
+            num_workers (int): Number of files decoded concurrently.
+        """
+        paths = [os.path.realpath(file) for file in files if os.path.isfile(file)]
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            list(executor.map(lambda path: _audio_cache.load(path, whisper.audio.SAMPLE_RATE), paths))
 
     def save(self):
         """This method is not used in this implementation."""
@@ -356,6 +674,7 @@ class WhisperLearner(Learner):
         """
         self.model_name = None
         self.model = None
+        self._suppress_token_ids = None
 
     def fit(self):
         """This method is not used in this implementation."""
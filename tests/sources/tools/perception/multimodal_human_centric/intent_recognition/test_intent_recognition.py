@@ -24,26 +24,31 @@ from opendr.engine.datasets import DatasetIterator
 
 
 DEVICE = os.getenv('TEST_DEVICE') if os.getenv('TEST_DEVICE') else 'cpu'
+# The HuggingFace backbone and tokenizer are cached outside the per-test temporary directories to avoid downloading
+# them again for every learner
+CACHE_PATH = os.getenv('OPENDR_HF_CACHE') if os.getenv('OPENDR_HF_CACHE') else \
+    os.path.join(os.path.expanduser('~'), '.cache', 'opendr_test_hf')
 
 
 class DummyDataset(DatasetIterator):
     def __init__(self, args):
         super(DummyDataset, self).__init__()
         self.args = args
+        # The sample is constant, so it is built once instead of on every access
+        text_feats = torch.zeros((3, args.max_seq_length_text), dtype=torch.long)
+        text_feats[0] = 1
+        self.sample = {
+            'label_ids': torch.tensor(0, dtype=torch.long),
+            'text_feats': text_feats,
+            'video_feats': torch.zeros((args.max_seq_length_video, args.video_feat_dim), dtype=torch.double),
+            'audio_feats': torch.zeros((args.max_seq_length_audio, args.audio_feat_dim), dtype=torch.double)
+        }
 
     def __len__(self,):
         return 1
 
     def __getitem__(self, i):
-
-        sample = {
-            'label_ids': torch.tensor(0).to(torch.long),
-            'text_feats': torch.cat((torch.ones((1, self.args.max_seq_length_text)),
-                                     torch.zeros(2, self.args.max_seq_length_text))).to(torch.long),
-            'video_feats': torch.zeros(self.args.max_seq_length_video, self.args.video_feat_dim).to(torch.double),
-            'audio_feats': torch.zeros(self.args.max_seq_length_audio, self.args.audio_feat_dim).to(torch.double)
-        }
-        return sample
+        return dict(self.sample)
 
 
 class TestIntentRecognitionLearner(unittest.TestCase):
@@ -51,42 +56,52 @@ class TestIntentRecognitionLearner(unittest.TestCase):
     def setUpClass(cls):
         print("\n\n**********************************\nTEST IntentRecognitionLearner\n"
               "**********************************")
-        pass
+        # The language-mode learner is shared by test_fit and test_save_load, so the backbone is only loaded once.
+        # Each test restores the initial weights before training.
+        os.makedirs(CACHE_PATH, exist_ok=True)
+        cls.tmp_direc = tempfile.TemporaryDirectory()
+        tmp_dir = cls.tmp_direc.name
+        cls.language_learner = IntentRecognitionLearner(text_backbone='prajjwal1/bert-tiny', mode='language',
+                                                        device=DEVICE, log_path=tmp_dir, cache_path=CACHE_PATH,
+                                                        results_path=tmp_dir, output_path=tmp_dir)
+        cls.language_learner.method.args.num_train_epochs = 1
+        cls.initial_state = {k: v.clone() for k, v in cls.language_learner.model.model.state_dict().items()}
 
     @classmethod
     def tearDownClass(cls):
+        cls.tmp_direc.cleanup()
         if os.path.exists('tokenizers'):
             shutil.rmtree('tokenizers')
         return
 
     def test_fit(self):
-        tmp_direc = tempfile.TemporaryDirectory()
-        tmp_dir = tmp_direc.name
-        learner = IntentRecognitionLearner(text_backbone='prajjwal1/bert-tiny', mode='language', device=DEVICE,
-                                           log_path=tmp_dir, cache_path=tmp_dir, results_path=tmp_dir,
-                                           output_path=tmp_dir)
+        learner = self.language_learner
+        learner.model.model.load_state_dict(self.initial_state)
         train_set = DummyDataset(learner.train_config)
         val_set = DummyDataset(learner.train_config)
-        learner.method.args.num_train_epochs = 1
-        old_weight = list(learner.model.model.parameters())[0].clone()
+        # A double precision sum is enough to detect the update without cloning the (large) embedding matrix
+        old_weight = torch.sum(next(learner.model.model.parameters()), dtype=torch.float64).item()
         learner.fit(train_set, val_set, silent=True, verbose=False)
-        new_weight = list(learner.model.model.parameters())[0].clone()
+        new_weight = torch.sum(next(learner.model.model.parameters()), dtype=torch.float64).item()
 
-        self.assertFalse(torch.equal(old_weight, new_weight),
-                         msg="Model parameters did not change after running fit.")
-        tmp_direc.cleanup()
+        self.assertNotEqual(old_weight, new_weight,
+                            msg="Model parameters did not change after running fit.")
 
     def test_eval_trim(self):
         tmp_direc = tempfile.TemporaryDirectory()
         tmp_dir = tmp_direc.name
         learner = IntentRecognitionLearner(text_backbone='prajjwal1/bert-tiny', mode='joint', device=DEVICE,
-                                           log_path=tmp_dir, cache_path=tmp_dir, results_path=tmp_dir,
+                                           log_path=tmp_dir, cache_path=CACHE_PATH, results_path=tmp_dir,
                                            output_path=tmp_dir)
         dataset = DummyDataset(learner.train_config)
-        performance = learner.eval(dataset, modality='language', silent=True, verbose=False, restore_best_model=False)
+        with torch.inference_mode():
+            performance = learner.eval(dataset, modality='language', silent=True, verbose=False,
+                                       restore_best_model=False)
         self.assertTrue('acc' in performance.keys())
         learner.trim('language')
-        performance_trimmed = learner.eval(dataset, modality='language', silent=True, verbose=False, restore_best_model=False)
+        with torch.inference_mode():
+            performance_trimmed = learner.eval(dataset, modality='language', silent=True, verbose=False,
+                                               restore_best_model=False)
         self.assertTrue(performance['loss'] == performance_trimmed['loss'])
         tmp_direc.cleanup()
 
@@ -99,12 +114,13 @@ class TestIntentRecognitionLearner(unittest.TestCase):
         tmp_dir = tmp_direc.name
         # create learner and download pretrained model
         learner = IntentRecognitionLearner(text_backbone='prajjwal1/bert-tiny', mode='joint', device=DEVICE,
-                                           log_path=tmp_dir, cache_path=tmp_dir, results_path=tmp_dir,
+                                           log_path=tmp_dir, cache_path=CACHE_PATH, results_path=tmp_dir,
                                            output_path=tmp_dir)
         learner.download(f'{tmp_dir}/bert-tiny.pth')
         learner.load(f'{tmp_dir}/bert-tiny.pth')
         # make inference
-        pred = learner.infer({'text': test_text}, modality='language')
+        with torch.inference_mode():
+            pred = learner.infer({'text': test_text}, modality='language')
         self.assertTrue(isinstance(pred, list))
         self.assertTrue(len(pred) == 3)
         self.assertTrue(isinstance(pred[0], Category))
@@ -122,22 +138,21 @@ class TestIntentRecognitionLearner(unittest.TestCase):
         temp_dir = 'tmp_'+str(time.time())
         tmp_direc = tempfile.TemporaryDirectory()
         tmp_dir2 = tmp_direc.name
-        learner = IntentRecognitionLearner(text_backbone='prajjwal1/bert-tiny', mode='language', device=DEVICE,
-                                           log_path=tmp_dir2, cache_path=tmp_dir2, results_path=tmp_dir2,
-                                           output_path=tmp_dir2)
+        learner = self.language_learner
+        learner.model.model.load_state_dict(self.initial_state)
         train_set = DummyDataset(learner.train_config)
-        learner.method.args.num_train_epochs = 1
         learner.fit(train_set, silent=True, verbose=False)
 
         learner.save(temp_dir)
 
         new_learner = IntentRecognitionLearner(text_backbone='prajjwal1/bert-tiny', mode='language', device=DEVICE,
-                                               log_path=tmp_dir2, cache_path=tmp_dir2, results_path=tmp_dir2,
+                                               log_path=tmp_dir2, cache_path=CACHE_PATH, results_path=tmp_dir2,
                                                output_path=tmp_dir2)
 
         new_learner.load(temp_dir)
-        old_pred = learner.infer({'text': test_text}, modality='language')[0].confidence
-        new_pred = new_learner.infer({'text': test_text}, modality='language')[0].confidence
+        with torch.inference_mode():
+            old_pred = learner.infer({'text': test_text}, modality='language')[0].confidence
+            new_pred = new_learner.infer({'text': test_text}, modality='language')[0].confidence
 
         self.assertEqual(old_pred, new_pred)
         os.remove(temp_dir)
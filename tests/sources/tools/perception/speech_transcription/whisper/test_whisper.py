@@ -113,6 +113,40 @@ class WhisperTest(unittest.TestCase):
 
         temp_dir.cleanup()
 
+    def test_infer_batch(self):
+        # Without the temperature fallback, transcribing a short clip decodes it exactly once, as the batch does
+        learner = WhisperLearner(language="en", device=device, temperature=0.0)
+        learner.load(name=TEST_MODEL_NAME, download_dir=None)
+
+        audios = [
+            np.ones(TEST_SIGNAL_LENGTH).astype(np.float32),
+            np.random.uniform(-1, 1, TEST_SIGNAL_LENGTH // 2).astype(np.float32),
+            torch.from_numpy(np.ones(TEST_SIGNAL_LENGTH).astype(np.float32)).to(device),
+        ]
+        transcriptions = learner.infer_batch(audios)
+
+        self.assertEqual(len(transcriptions), len(audios))
+        for audio, transcription in zip(audios, transcriptions):
+            self.assertTrue(isinstance(transcription, WhisperTranscription))
+            self.assertEqual(transcription.text.strip(), learner.infer(audio).text.strip(),
+                             "Batched transcription differs from the transcription of the single sample.")
+
+    def test_infer_suppress_tokens(self):
+        audio_numpy = np.ones(TEST_SIGNAL_LENGTH).astype(np.float32)
+
+        self.learner.load(name=TEST_MODEL_NAME, download_dir=None)
+        suppress_tokens = self.learner._decode_kwargs()["suppress_tokens"]
+        decode_suppress_tokens = self.learner.decode_options.suppress_tokens
+
+        self.learner.infer(audio_numpy)
+        self.learner.infer([audio_numpy, audio_numpy])
+        self.learner.infer(audio_numpy)
+
+        self.assertEqual(self.learner._decode_kwargs()["suppress_tokens"], suppress_tokens,
+                         "Suppressed tokens changed after running inference.")
+        self.assertEqual(self.learner.decode_options.suppress_tokens, decode_suppress_tokens,
+                         "Decoding options changed after running inference.")
+
     def test_load(self):
         temp_dir = tempfile.TemporaryDirectory()
 